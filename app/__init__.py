@@ -1 +1,6 @@
 """FastAPI Server Template Application"""
+
+import time
+
+# 콜드 스타트 측정 기준 (app 패키지를 처음 import한 시각)
+STARTED_AT = time.perf_counter()
@@ -0,0 +1,304 @@
+"""
+요청 수락 제어 (Admission Control / Load Shedding)
+
+DB가 느려져 요청이 커넥션 체크아웃과 스레드 풀에서 쌓이기 전에, 처리할 수 없는 요청을
+라우팅 전에 바로 거절합니다.
+
+- 토큰 버킷: 클라이언트별(ADMISSION_CLIENT_RATE) / 클라이언트 + 경로별(ADMISSION_ROUTE_LIMITS)
+  요청 속도를 제한하고, 초과하면 429와 다음 토큰까지의 Retry-After를 반환합니다.
+- 동시 처리 한도: 처리 중 요청 수가 한도 이상이면 503과 Retry-After를 반환합니다.
+  한도는 커넥션 풀 체크아웃 대기 시간에 따라 조정합니다 (AIMD).
+  구간 평균 대기 시간이 목표를 넘거나 체크아웃 타임아웃이 나면 한도를 곱으로 줄이고,
+  대기 없이 한도까지 사용되면 1씩 늘립니다.
+- 상태는 워커 프로세스마다 따로 유지하며, 이벤트 루프 스레드에서만 갱신하므로 Lock이 없습니다.
+- 헬스 체크 / 메트릭 경로와 CORS preflight(OPTIONS)는 제한하지 않습니다.
+- 경로 접두사는 경로 구분(/) 단위로 비교합니다. "/api/v1/users"는 "/api/v1/users/1"과 일치하지만
+  "/api/v1/usersX"와는 일치하지 않습니다.
+"""
+
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+import orjson
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.metrics import Counter, Gauge
+from app.core.pool_metrics import checkout_wait_totals
+
+# 제한하지 않는 경로 (정확히 일치 또는 접두사) / 메서드
+EXEMPT_PATHS = ("/",)
+EXEMPT_PREFIXES = ("/health", "/metrics")
+EXEMPT_METHODS = ("OPTIONS",)
+
+admission_rejections = Counter(
+    "http_admission_rejections_total",
+    "Requests rejected before routing by admission control",
+    ("reason",),
+)
+admission_limit = Gauge(
+    "http_admission_concurrency_limit", "Current adaptive concurrency limit"
+)
+
+
+def path_has_prefix(path: str, prefix: str) -> bool:
+    """경로가 접두사와 같거나 그 하위 경로인지 여부 (경로 구분 단위 비교)"""
+    return path == prefix or path.startswith(prefix.rstrip("/") + "/")
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷"""
+
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: float, now: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = now
+
+    def take(self, now: float) -> float:
+        """
+        토큰 하나 사용
+
+        Returns:
+            0이면 수락, 그 외에는 토큰이 생길 때까지 기다려야 하는 시간 (초)
+        """
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class RouteLimit:
+    """경로 접두사별 토큰 버킷 설정"""
+
+    __slots__ = ("method", "prefix", "rate", "burst")
+
+    def __init__(self, method: str, prefix: str, rate: float, burst: float):
+        self.method = method
+        self.prefix = prefix
+        self.rate = rate
+        self.burst = burst
+
+    def matches(self, method: str, path: str) -> bool:
+        return self.method in ("*", method) and path_has_prefix(path, self.prefix)
+
+
+def parse_route_limits(value: str) -> list[RouteLimit]:
+    """
+    경로별 제한 설정 파싱
+
+    Args:
+        value: "METHOD /경로접두사=rate:burst"를 쉼표로 구분한 문자열
+            (예: "POST /api/v1/users/bulk=1:5, GET /api/v1/users/export=0.5:2",
+            METHOD가 *이면 모든 메서드)
+
+    Returns:
+        RouteLimit 목록 (먼저 적은 규칙이 우선)
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    limits = []
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        try:
+            route, spec = item.rsplit("=", 1)
+            method, prefix = route.split()
+            rate, _, burst = spec.partition(":")
+            limit = RouteLimit(
+                method.upper(), prefix, float(rate), float(burst or rate)
+            )
+        except ValueError as e:
+            raise ValueError(f"Invalid ADMISSION_ROUTE_LIMITS entry: {item!r}") from e
+        if limit.rate <= 0 or limit.burst < 1:
+            raise ValueError(f"Invalid ADMISSION_ROUTE_LIMITS entry: {item!r}")
+        limits.append(limit)
+    return limits
+
+
+class AdaptiveConcurrencyLimit:
+    """
+    커넥션 풀 대기 시간에 따라 조정되는 동시 처리 한도
+
+    Args:
+        max_limit: 최대 한도 (초기값)
+        min_limit: 최소 한도
+        wait_target: 목표 평균 체크아웃 대기 시간 (초)
+        interval: 조정 주기 (초)
+        decrease: 줄일 때 곱하는 비율
+        wait_totals: 누적 (체크아웃 횟수, 대기 합계, 타임아웃 횟수) 조회 함수
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        wait_target: float = 0.05,
+        interval: float = 1.0,
+        decrease: float = 0.75,
+        wait_totals: Callable[[], tuple[int, float, float]] = checkout_wait_totals,
+    ):
+        self.max_limit = max_limit
+        self.min_limit = min(min_limit, max_limit)
+        self.wait_target = wait_target
+        self.interval = interval
+        self.decrease = decrease
+        self.wait_totals = wait_totals
+        self.limit = float(max_limit)
+        self.in_flight = 0
+        self._saturated = False  # 구간 중 한도까지 사용된 적이 있는지
+        self._last_adjust = time.monotonic()
+        self._last_totals = wait_totals()
+
+    def try_acquire(self) -> bool:
+        """한도 안이면 처리 중 요청 수를 늘리고 True"""
+        if self.in_flight >= int(self.limit):
+            return False
+        self.in_flight += 1
+        if self.in_flight >= int(self.limit):
+            self._saturated = True
+        return True
+
+    def release(self, now: float) -> None:
+        """요청 완료 (조정 주기가 지났으면 한도 조정)"""
+        self.in_flight -= 1
+        if now - self._last_adjust >= self.interval:
+            self.adjust(now)
+
+    def adjust(self, now: float) -> None:
+        """직전 조정 이후 구간의 평균 체크아웃 대기 시간으로 한도 조정"""
+        totals = self.wait_totals()
+        count, total, timeouts = (
+            current - previous for current, previous in zip(totals, self._last_totals)
+        )
+        if count < 0:  # fork 후 메트릭 초기화
+            count, total, timeouts = totals
+        self._last_totals = totals
+        self._last_adjust = now
+
+        if timeouts > 0 or (count and total / count > self.wait_target):
+            self.limit = max(self.min_limit, self.limit * self.decrease)
+        elif self._saturated:
+            self.limit = min(self.max_limit, self.limit + 1)
+        self._saturated = False
+
+
+class AdmissionControlMiddleware:
+    """
+    토큰 버킷과 동시 처리 한도로 요청을 수락/거절하는 ASGI 미들웨어
+
+    Args:
+        app: ASGI 앱
+        concurrency: 동시 처리 한도 (None이면 제한하지 않음)
+        client_rate: 클라이언트별 초당 요청 수 (0이면 제한하지 않음)
+        client_burst: 클라이언트별 순간 최대 요청 수
+        route_limits: 클라이언트 + 경로별 제한
+        retry_after: 과부하(503) 응답의 Retry-After (초)
+        max_clients: 토큰 버킷을 유지할 최대 클라이언트 수 (오래 사용하지 않은 순으로 제거)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        concurrency: AdaptiveConcurrencyLimit | None = None,
+        client_rate: float = 0.0,
+        client_burst: float = 0.0,
+        route_limits: list[RouteLimit] | None = None,
+        retry_after: int = 1,
+        max_clients: int = 10000,
+    ):
+        self.app = app
+        self.concurrency = concurrency
+        self.client_rate = client_rate
+        self.client_burst = max(client_burst, client_rate, 1.0)
+        self.route_limits = route_limits or []
+        self.retry_after = retry_after
+        self.max_clients = max_clients
+        self._buckets: OrderedDict[tuple, TokenBucket] = OrderedDict()
+        if concurrency is not None:
+            admission_limit.labels().set_function(lambda: int(concurrency.limit))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get("path", "")
+        if (
+            scope["type"] != "http"
+            or scope["method"] in EXEMPT_METHODS
+            or path in EXEMPT_PATHS
+            or any(path_has_prefix(path, prefix) for prefix in EXEMPT_PREFIXES)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        now = time.monotonic()
+        wait = self._take_tokens(scope, path, now)
+        if wait > 0:
+            admission_rejections.labels("rate_limited").inc()
+            await self._reject(send, 429, "Too many requests", math.ceil(wait))
+            return
+
+        concurrency = self.concurrency
+        if concurrency is None:
+            await self.app(scope, receive, send)
+            return
+        if not concurrency.try_acquire():
+            admission_rejections.labels("overloaded").inc()
+            await self._reject(
+                send, 503, "Server is overloaded, retry later", self.retry_after
+            )
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            concurrency.release(time.monotonic())
+
+    def _take_tokens(self, scope: Scope, path: str, now: float) -> float:
+        """
+        클라이언트 버킷, 첫 번째로 일치하는 경로 버킷 순으로 토큰 사용
+
+        Returns:
+            0이면 수락, 그 외에는 거절한 버킷의 대기 시간 (초)
+        """
+        client = scope.get("client")
+        client_key = client[0] if client else "unknown"
+        if self.client_rate > 0:
+            wait = self._bucket((client_key,), self.client_rate, self.client_burst, now)
+            if wait > 0:
+                return wait
+        method = scope["method"]
+        for index, limit in enumerate(self.route_limits):
+            if limit.matches(method, path):
+                return self._bucket((client_key, index), limit.rate, limit.burst, now)
+        return 0.0
+
+    def _bucket(self, key: tuple, rate: float, burst: float, now: float) -> float:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(rate, burst, now)
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket.take(now)
+
+    @staticmethod
+    async def _reject(send: Send, status_code: int, detail: str, retry_after: int) -> None:
+        body = orjson.dumps({"detail": detail})
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(max(retry_after, 1)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,199 @@
+"""
+그룹 커밋 (Group Commit) 마이크로 배치
+
+짧은 시간 창 안에 도착한 쓰기 요청을 모아 한 트랜잭션(한 번의 커밋 / fsync)으로 처리합니다.
+
+- 배치가 비어 있을 때 도착한 요청이 리더가 되어 window 동안(또는 max_size개가 모일 때까지)
+  기다린 뒤, 자신의 DB 세션으로 배치 전체를 flush 함수에 넘깁니다. 별도 스레드나 세션은 없습니다.
+- 나머지 요청(팔로워)은 리더의 flush가 끝날 때까지 기다렸다가 자기 항목의 결과를 받습니다.
+- flush는 항목 순서대로 결과 목록을 반환합니다. 결과가 예외 인스턴스면 해당 요청에서만 발생시키고
+  (예: 이메일 중복 409), flush 자체가 실패하면 배치의 모든 요청에 같은 예외가 발생합니다.
+- 배치는 프로세스(워커) 안에서만 모읍니다. 리더의 요청 시간 예산(deadlines)이 배치 전체에 적용됩니다.
+- 리더가 취소되는 등 Exception이 아닌 이유로 끝나면 리더만 원래 예외(CancelledError 등)를 받고,
+  팔로워에게는 GroupCommitAborted가 발생합니다. 팔로워 자신이 취소된 것은 아니기 때문입니다.
+"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from typing import Any, Generic, TypeVar
+
+from app.core.metrics import Histogram
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+BATCH_SIZE_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+group_commit_batch_size = Histogram(
+    "db_group_commit_batch_size",
+    "Items flushed per group-commit transaction",
+    ("batch",),
+    buckets=BATCH_SIZE_BUCKETS,
+)
+
+# 동기 배처는 스레드 풀에서 기록하므로 메트릭 갱신을 직렬화
+_metrics_lock = threading.Lock()
+
+
+class GroupCommitAborted(RuntimeError):
+    """리더가 취소 / 중단되어 배치를 flush하지 못함 (팔로워에게 발생)"""
+
+
+def _observe(name: str, size: int) -> None:
+    with _metrics_lock:
+        group_commit_batch_size.labels(name).observe(size)
+
+
+class _Batch:
+    """모으는 중이거나 flush 중인 배치 하나"""
+
+    def __init__(self, full: Any, done: Any):
+        self.items: list[Any] = []
+        self.results: list[Any] | None = None
+        self.error: BaseException | None = None
+        self.full = full  # max_size에 도달하면 set (리더가 대기 종료)
+        self.done = done  # flush가 끝나면 set (팔로워가 대기 종료)
+
+    def fail(self, error: BaseException) -> None:
+        """
+        배치 실패 기록
+
+        Exception이 아닌 예외(CancelledError, KeyboardInterrupt 등)는 리더 자신의 종료 사유이므로
+        팔로워에게는 GroupCommitAborted로 감싸 전달합니다.
+        """
+        if isinstance(error, Exception):
+            self.error = error
+        else:
+            aborted = GroupCommitAborted("group commit leader was aborted before flushing")
+            aborted.__cause__ = error
+            self.error = aborted
+
+    def result(self, index: int) -> Any:
+        if self.error is not None:
+            raise self.error
+        result = self.results[index]
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+
+class GroupCommitBatcher(Generic[T, R]):
+    """
+    동기 엔드포인트(스레드 풀)용 그룹 커밋 배처
+
+    Args:
+        name: 메트릭 라벨
+        flush: (DB 세션, 항목 목록) → 항목 순서의 결과 목록 (결과가 예외면 해당 요청에서 발생)
+        window: 리더가 다른 요청을 기다리는 최대 시간 (초)
+        max_size: 배치 최대 항목 수 (도달하면 바로 flush)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        flush: Callable[[Any, list[T]], list[R | BaseException]],
+        window: float = 0.003,
+        max_size: int = 100,
+    ):
+        self.name = name
+        self.flush = flush
+        self.window = window
+        self.max_size = max(max_size, 1)
+        self._lock = threading.Lock()
+        self._open: _Batch | None = None
+
+    def submit(self, db: Any, item: T) -> R:
+        """
+        항목을 현재 배치에 추가하고 flush 결과 반환
+
+        Args:
+            db: 요청의 DB 세션 (리더가 된 경우에만 사용)
+            item: 배치에 추가할 항목
+
+        Returns:
+            이 항목의 결과
+        """
+        with self._lock:
+            batch = self._open
+            leader = batch is None
+            if leader:
+                batch = self._open = _Batch(threading.Event(), threading.Event())
+            index = len(batch.items)
+            batch.items.append(item)
+            if len(batch.items) >= self.max_size:
+                self._open = None
+                batch.full.set()
+
+        if not leader:
+            batch.done.wait()
+            return batch.result(index)
+
+        batch.full.wait(self.window)
+        with self._lock:
+            if self._open is batch:
+                self._open = None
+        try:
+            _observe(self.name, len(batch.items))
+            batch.results = self.flush(db, batch.items)
+        except BaseException as e:
+            batch.fail(e)
+            raise
+        finally:
+            batch.done.set()
+        return batch.result(index)
+
+
+class AsyncGroupCommitBatcher(Generic[T, R]):
+    """
+    async 엔드포인트(이벤트 루프)용 그룹 커밋 배처
+
+    GroupCommitBatcher와 같으며 flush는 코루틴 함수입니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        flush: Callable[[Any, list[T]], Awaitable[list[R | BaseException]]],
+        window: float = 0.003,
+        max_size: int = 100,
+    ):
+        self.name = name
+        self.flush = flush
+        self.window = window
+        self.max_size = max(max_size, 1)
+        self._open: _Batch | None = None
+
+    async def submit(self, db: Any, item: T) -> R:
+        """GroupCommitBatcher.submit과 동일 (대기 중 이벤트 루프를 막지 않음)"""
+        batch = self._open
+        leader = batch is None
+        if leader:
+            batch = self._open = _Batch(asyncio.Event(), asyncio.Event())
+        index = len(batch.items)
+        batch.items.append(item)
+        if len(batch.items) >= self.max_size:
+            self._open = None
+            batch.full.set()
+
+        if not leader:
+            await batch.done.wait()
+            return batch.result(index)
+
+        try:
+            try:
+                await asyncio.wait_for(batch.full.wait(), self.window)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                if self._open is batch:
+                    self._open = None
+            _observe(self.name, len(batch.items))
+            batch.results = await self.flush(db, batch.items)
+        except BaseException as e:
+            # 리더가 취소되면 리더는 CancelledError, 팔로워는 GroupCommitAborted로 종료
+            batch.fail(e)
+            raise
+        finally:
+            batch.done.set()
+        return batch.result(index)
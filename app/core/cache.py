@@ -0,0 +1,227 @@
+"""
+캐시 백엔드
+
+서비스 계층의 read-through 캐시에 사용하는 캐시 인터페이스와 구현을 정의합니다.
+
+- CacheBackend: 캐시 인터페이스 (외부 저장소 구현 시 상속)
+- LRUCache: 프로세스 내 LRU + TTL 캐시
+- NullCache: 캐시 비활성화용 no-op 구현
+
+값은 bytes(직렬화된 응답)로 저장하므로 외부 저장소(Redis 등)로 교체해도
+서비스 코드를 바꿀 필요가 없습니다.
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import lru_cache
+
+from app.core.config import get_settings
+from app.core.metrics import Counter, Gauge
+
+cache_hits = Counter("cache_hits_total", "Cache lookups that hit", ("namespace",))
+cache_misses = Counter("cache_misses_total", "Cache lookups that missed", ("namespace",))
+cache_evictions = Counter(
+    "cache_evictions_total", "Entries evicted by the size limit", ("namespace",)
+)
+cache_expirations = Counter(
+    "cache_expirations_total", "Entries dropped after their TTL", ("namespace",)
+)
+cache_entries = Gauge("cache_entries", "Entries currently cached", ("namespace",))
+
+
+class CacheBackend(ABC):
+    """캐시 백엔드 인터페이스"""
+
+    @abstractmethod
+    def get(self, key: str) -> bytes | None:
+        """키에 해당하는 값 조회 (없거나 만료되면 None)"""
+
+    @abstractmethod
+    def set(self, key: str, value: bytes) -> None:
+        """값 저장 (기존 값 덮어쓰기)"""
+
+    @abstractmethod
+    def add(self, key: str, value: bytes) -> bool:
+        """
+        키가 없을 때만 값 저장
+
+        read-through 채우기에 사용합니다. 조회 도중 쓰기 경로가 먼저 갱신한 값을
+        오래된 조회 결과로 덮어쓰지 않기 위함입니다.
+
+        Returns:
+            저장 여부
+        """
+
+    @abstractmethod
+    def compare_and_set(self, key: str, expected: bytes, value: bytes | None) -> bool:
+        """
+        저장된 값이 expected일 때만 value로 교체 (value가 None이면 삭제)
+
+        여러 요청이 같은 키를 갱신할 때 다른 요청이 먼저 바꾼 값을 덮어쓰지 않기 위함입니다.
+
+        Returns:
+            교체 여부 (키가 없거나 값이 다르면 False)
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """값 삭제"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """전체 삭제"""
+
+    @abstractmethod
+    def stats(self) -> dict[str, int]:
+        """hit/miss/eviction 카운터 조회"""
+
+
+class NullCache(CacheBackend):
+    """캐시 비활성화용 no-op 백엔드"""
+
+    def get(self, key: str) -> bytes | None:
+        return None
+
+    def set(self, key: str, value: bytes) -> None:
+        pass
+
+    def add(self, key: str, value: bytes) -> bool:
+        return False
+
+    def compare_and_set(self, key: str, expected: bytes, value: bytes | None) -> bool:
+        return False
+
+    def delete(self, key: str) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "size": 0}
+
+
+class LRUCache(CacheBackend):
+    """
+    프로세스 내 LRU + TTL 캐시
+
+    동기 라우트가 스레드 풀에서 동시에 접근하므로 모든 연산을 Lock으로 보호합니다.
+    max_size를 넘으면 가장 오래 사용되지 않은 항목을 제거(eviction)하고,
+    TTL이 지난 항목은 조회 시점에 제거(expiration)합니다.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        ttl_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._data: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._data[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._store(key, value)
+
+    def add(self, key: str, value: bytes) -> bool:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > self._clock():
+                return False
+            self._store(key, value)
+            return True
+
+    def compare_and_set(self, key: str, expected: bytes, value: bytes | None) -> bool:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= self._clock() or entry[1] != expected:
+                return False
+            if value is None:
+                del self._data[key]
+            else:
+                self._store(key, value)
+            return True
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "size": len(self._data),
+            }
+
+    def _store(self, key: str, value: bytes) -> None:
+        """Lock을 잡은 상태에서 값 저장 및 용량 초과 항목 제거"""
+        self._data[key] = (self._clock() + self.ttl_seconds, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self._evictions += 1
+
+
+@lru_cache()
+def get_cache(namespace: str) -> CacheBackend:
+    """
+    네임스페이스별 캐시 백엔드 반환 (싱글톤 패턴)
+
+    동기/async 서비스가 같은 인스턴스를 공유하므로 어느 경로로 수정해도 함께 무효화됩니다.
+
+    Args:
+        namespace: 캐시 네임스페이스 (예: "user")
+
+    Returns:
+        CACHE_ENABLED이면 LRUCache, 아니면 NullCache
+    """
+    settings = get_settings()
+    if not settings.CACHE_ENABLED:
+        return NullCache()
+    cache = LRUCache(
+        max_size=settings.CACHE_MAX_SIZE, ttl_seconds=settings.CACHE_TTL_SECONDS
+    )
+    # 캐시가 직접 집계하는 값을 스크레이프 시점에 읽음
+    cache_hits.labels(namespace).set_function(lambda: cache.stats()["hits"])
+    cache_misses.labels(namespace).set_function(lambda: cache.stats()["misses"])
+    cache_evictions.labels(namespace).set_function(lambda: cache.stats()["evictions"])
+    cache_expirations.labels(namespace).set_function(
+        lambda: cache.stats()["expirations"]
+    )
+    cache_entries.labels(namespace).set_function(lambda: cache.stats()["size"])
+    return cache
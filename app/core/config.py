@@ -29,6 +29,107 @@ class Settings(BaseSettings):
     DATABASE_URL: str = ""
     TEST_DATABASE_URL: str = ""
 
+    # Connection Pool
+    DB_POOL_SIZE: int = 5  # 유지할 커넥션 수
+    DB_MAX_OVERFLOW: int = 10  # pool_size를 넘어 추가로 열 수 있는 커넥션 수
+    DB_POOL_TIMEOUT: float = 30.0  # 커넥션 체크아웃 대기 제한 시간 (초)
+    DB_POOL_RECYCLE: int = 3600  # 커넥션 재생성 주기 (초)
+    DB_POOL_PRE_PING: bool = True  # 체크아웃 시 연결 상태 확인
+
+    # Read Replicas
+    DB_REPLICA_URLS: str = ""  # 읽기 복제본 URL (쉼표 구분, 비어 있으면 primary만 사용)
+    DB_REPLICA_MAX_LAG_SECONDS: float = 5.0  # 이보다 지연된 복제본은 읽기에서 제외
+    DB_REPLICA_CHECK_INTERVAL: float = 5.0  # 복제본 상태 확인 주기 (초)
+    READ_YOUR_WRITES_SECONDS: float = 5.0  # 쓰기 후 같은 클라이언트의 읽기를 primary로 보낼 시간
+
+    # Workers
+    WEB_CONCURRENCY: int = 0  # gunicorn 워커 수 (0이면 사용 가능한 CPU 수)
+    DB_MAX_CONNECTIONS: int = 0  # 전체 워커의 엔진당 커넥션 상한 (0이면 풀 설정 그대로 사용)
+
+    # Admission Control
+    ADMISSION_ENABLED: bool = True  # 과부하 시 라우팅 전에 요청 거절 (429 / 503)
+    ADMISSION_MAX_CONCURRENCY: int = 0  # 워커별 동시 처리 한도 상한 (0이면 워커별 커넥션 수의 2배)
+    ADMISSION_MIN_CONCURRENCY: int = 2  # 풀 대기로 한도를 줄일 때의 하한
+    ADMISSION_POOL_WAIT_TARGET_MS: float = 50.0  # 평균 커넥션 체크아웃 대기 목표 (넘으면 한도 감소)
+    ADMISSION_ADJUST_INTERVAL: float = 1.0  # 한도 조정 주기 (초)
+    ADMISSION_RETRY_AFTER_SECONDS: int = 1  # 503 응답의 Retry-After
+    ADMISSION_CLIENT_RATE: float = 0.0  # 클라이언트별 초당 요청 수 (0이면 제한하지 않음)
+    ADMISSION_CLIENT_BURST: float = 0.0  # 클라이언트별 순간 최대 요청 수 (rate보다 작으면 rate)
+    ADMISSION_ROUTE_LIMITS: str = ""  # 클라이언트 + 경로별 제한 ("POST /api/v1/users/bulk=1:5, ...")
+
+    # Timeouts
+    REQUEST_TIMEOUT_SECONDS: float = 30.0  # 요청별 기본 시간 예산 (초, 0이면 제한 없음)
+    # 경로별 시간 예산 ("METHOD /경로접두사=초", "/경로$"는 정확히 일치, 먼저 적은 규칙 우선)
+    ROUTE_TIMEOUTS: str = (
+        "GET /api/v1/users/export=300, POST /api/v1/users/bulk=120, "
+        "PATCH /api/v1/users$=300, DELETE /api/v1/users$=300"
+    )
+
+    # Schema
+    DB_SCHEMA_MODE: str = "create_all"  # 시작 시 스키마 처리 (create_all | check | migrate | none)
+
+    # Async Database
+    DB_ASYNC: bool = False  # True면 AsyncSession 기반 async 라우트 사용
+    ASYNC_DATABASE_URL: str = ""  # 비어 있으면 DATABASE_URL에서 async 드라이버로 변환
+
+    # Bulk Import
+    USER_BULK_MAX_ROWS: int = 10000  # 요청당 최대 행 수
+    USER_BULK_CHUNK_SIZE: int = 1000  # INSERT 한 번에 묶을 행 수
+
+    # Bulk Update / Delete
+    USER_BULK_WRITE_CHUNK_SIZE: int = 1000  # 일괄 수정/삭제 시 트랜잭션 하나로 처리할 행 수
+    USER_BULK_WRITE_MAX_IDS: int = 500  # 일괄 수정/삭제 요청당 최대 ID 수 (ids 파라미터)
+
+    # List
+    # X-Total-Count 기본 계산 방식 (exact | estimate | none, 클라이언트가 count로 요청 가능)
+    USER_LIST_COUNT_MODE: str = "none"
+    USER_COUNT_EXACT_THRESHOLD: int = 10000  # 예상 행 수가 이보다 작으면 COUNT(*)로 정확히 계산
+
+    # Search
+    USER_SEARCH_MAX_LIMIT: int = 50  # 검색 결과 최대 개수
+    USER_SEARCH_CONTAINS_MIN_LENGTH: int = 3  # 부분 일치 / 유사도 검색 최소 길이 (미만이면 접두사 일치만)
+
+    # Batch Get
+    USER_BATCH_MAX_IDS: int = 500  # 일괄 조회 요청당 최대 ID 수
+
+    # Group Commit
+    USER_CREATE_BATCH_ENABLED: bool = False  # 동시 생성 요청을 모아 한 트랜잭션으로 삽입
+    USER_CREATE_BATCH_WINDOW_MS: float = 3.0  # 첫 요청 이후 다른 요청을 기다리는 최대 시간 (ms)
+    USER_CREATE_BATCH_MAX_SIZE: int = 100  # 배치 최대 항목 수 (도달하면 바로 삽입)
+
+    # Export
+    USER_EXPORT_BATCH_SIZE: int = 1000  # 서버 사이드 커서 fetch 단위
+
+    # Cache
+    # 단건 조회 read-through 캐시 사용 여부 (프로세스 내 캐시라서 수정 / 삭제 시 처리한 워커만
+    # 무효화됨, 멀티 워커에서는 다른 워커가 CACHE_TTL_SECONDS 동안 이전 값 / ETag를 반환)
+    CACHE_ENABLED: bool = False
+    CACHE_MAX_SIZE: int = 10000  # 프로세스당 최대 항목 수
+    CACHE_TTL_SECONDS: float = 60.0  # 항목 유효 시간 (다른 워커의 수정은 TTL 이내에 반영)
+
+    # Idempotency
+    IDEMPOTENCY_ENABLED: bool = True  # Idempotency-Key 헤더 처리 여부
+    IDEMPOTENCY_TTL_SECONDS: float = 86400.0  # 키와 저장된 응답의 유효 시간
+    IDEMPOTENCY_MAX_KEYS: int = 10000  # 프로세스당 최대 키 수 (초과 시 오래된 키부터 제거)
+    IDEMPOTENCY_LOCK_SECONDS: float = 30.0  # 처리 중 키를 다른 요청이 넘겨받기까지의 시간
+    IDEMPOTENCY_WAIT_SECONDS: float = 10.0  # 같은 키의 처리 중 요청을 기다리는 최대 시간
+
+    # Metrics
+    METRICS_ENABLED: bool = True  # 요청 메트릭 수집 및 /metrics 노출 여부
+    METRICS_MULTIPROC_DIR: str = ""  # 멀티 워커 실행 시 워커별 스냅샷을 기록할 공유 디렉터리
+    METRICS_FLUSH_INTERVAL: float = 5.0  # 스냅샷 기록 주기 (초)
+
+    # SQL Instrumentation
+    SQL_STATS_ENABLED: bool = True  # 요청별 SQL 수/시간 집계 및 응답 헤더 노출 여부
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0  # slow query 로그 기준 (0이면 기록하지 않음)
+    N_PLUS_ONE_THRESHOLD: int = 10  # 한 요청에서 같은 SQL이 이 횟수를 넘으면 경고
+
+    # Logging
+    LOG_LEVEL: str = "INFO"  # 루트 로그 레벨
+    LOG_JSON: bool = True  # True면 JSON 한 줄, False면 텍스트 형식
+    SQL_LOG_LEVEL: str = "WARNING"  # app.sql 로거 레벨 (DEBUG면 SQL 문을 샘플링해 기록)
+    SQL_LOG_SAMPLE_RATE: float = 0.01  # SQL_LOG_LEVEL=DEBUG일 때 기록할 SQL 문 비율 (0~1)
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -4,28 +4,173 @@
 SQLAlchemy를 사용한 데이터베이스 연결 설정 및 세션 관리를 담당합니다.
 """
 
+import os
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from app.core.config import get_settings
+from app.core.pool_metrics import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    instrument_engine,
+)
+from app.core.workers import get_pool_limits
 
 settings = get_settings()
 
+# 동기 드라이버 → async 드라이버 매핑
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+
+def get_engine_options(url: str | URL, pool_name: str, is_async: bool = False) -> dict:
+    """
+    엔진 생성 옵션 구성
+
+    커넥션 풀 크기/대기 시간/재생성 주기를 Settings에서 읽습니다.
+    풀 크기는 DB_MAX_CONNECTIONS를 워커 수로 나눈 값으로 제한됩니다 (get_pool_limits).
+    SQLite 인메모리 DB는 단일 커넥션 풀을 사용하므로 풀 크기 옵션을 적용하지 않습니다.
+
+    Args:
+        url: 데이터베이스 URL
+        pool_name: 풀 메트릭 라벨 (pool_logging_name)
+        is_async: async 엔진 여부
+
+    Returns:
+        create_engine / create_async_engine 키워드 인자
+    """
+    options = {
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,  # 연결 상태 확인
+        "pool_recycle": settings.DB_POOL_RECYCLE,  # 주기적으로 연결 재생성
+        "pool_logging_name": pool_name,
+    }
+
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return options
+
+    pool_size, max_overflow = get_pool_limits(settings)
+    options.update(
+        poolclass=InstrumentedAsyncAdaptedQueuePool if is_async else InstrumentedQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+    )
+    return options
+
+
 # 데이터베이스 엔진 생성
 engine = create_engine(
     settings.get_database_url(),
-    pool_pre_ping=True,  # 연결 상태 확인
-    pool_recycle=3600,  # 1시간마다 연결 재생성
-    echo=settings.DEBUG,  # DEBUG 모드에서 SQL 로그 출력
+    **get_engine_options(settings.get_database_url(), "primary"),
 )
+instrument_engine(engine, "primary")
 
 # 세션 팩토리 생성
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# RETURNING으로 받은 값을 커밋 후 다시 SELECT하지 않도록 만료하지 않음
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 # Base 클래스 생성 (모든 ORM 모델의 부모 클래스)
 Base = declarative_base()
 
 
+def to_async_url(url: str) -> URL:
+    """
+    동기 데이터베이스 URL을 async 드라이버 URL로 변환
+
+    asyncpg는 psycopg2 전용 `client_encoding` 쿼리 파라미터를 지원하지 않으므로 제거합니다.
+
+    Args:
+        url: 동기 드라이버 데이터베이스 URL
+
+    Returns:
+        async 드라이버 URL
+    """
+    async_url = make_url(url)
+    driver = ASYNC_DRIVERS.get(async_url.drivername)
+    if driver:
+        async_url = async_url.set(drivername=driver)
+    if async_url.drivername == "postgresql+asyncpg":
+        async_url = async_url.difference_update_query(["client_encoding"])
+    return async_url
+
+
+# Async 엔진 생성 (DB_ASYNC=True일 때만 드라이버를 로드)
+async_engine = None
+if settings.DB_ASYNC:
+    async_url = settings.ASYNC_DATABASE_URL or to_async_url(settings.get_database_url())
+    async_engine = create_async_engine(
+        async_url, **get_engine_options(async_url, "primary_async", is_async=True)
+    )
+    instrument_engine(async_engine.sync_engine, "primary_async")
+
+# Async 세션 팩토리 생성 (커밋 후 속성 접근 시 암묵적 I/O가 없도록 만료하지 않음)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+def dispose_pools_after_fork() -> None:
+    """
+    fork된 자식 프로세스에서 커넥션 풀 재생성
+
+    preload 모드에서는 부모 프로세스에서 만든 엔진을 자식이 물려받으므로, 부모의 소켓을
+    자식이 함께 사용하지 않도록 풀을 새로 만듭니다. close=False로 부모가 사용 중인
+    커넥션은 닫지 않고 참조만 버립니다.
+    """
+    engine.dispose(close=False)
+    if async_engine is not None:
+        async_engine.sync_engine.dispose(close=False)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=dispose_pools_after_fork)
+
+
+# 복제본 세션 표시 (Session.info 키, 값은 복제본 이름)
+REPLICA_SESSION_INFO = "replica"
+
+
+def is_replica_session(db: Session | AsyncSession) -> bool:
+    """
+    복제본에 연결된 읽기 세션 여부
+
+    복제본은 primary보다 늦을 수 있으므로, 공유 캐시처럼 무효화 이후에도 남는 곳에
+    복제본에서 읽은 값을 채우지 않을 때 사용합니다.
+    """
+    return REPLICA_SESSION_INFO in db.info
+
+
+def is_unique_violation(error: IntegrityError) -> bool:
+    """
+    IntegrityError가 UNIQUE 제약 조건 위반인지 확인
+
+    Args:
+        error: SQLAlchemy IntegrityError
+
+    Returns:
+        UNIQUE 위반 여부 (PostgreSQL 23505, MySQL 1062, SQLite UNIQUE constraint)
+    """
+    orig = error.orig
+    if getattr(orig, "pgcode", None) == "23505" or getattr(orig, "sqlstate", None) == "23505":
+        return True
+    if getattr(orig, "args", None) and orig.args[0] == 1062:
+        return True
+    return "UNIQUE constraint failed" in str(orig)
+
+
 def get_db():
     """
     데이터베이스 세션 의존성
@@ -41,3 +186,17 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """
+    Async 데이터베이스 세션 의존성
+
+    DB_ASYNC=True일 때 async 라우트에서 사용됩니다.
+    이벤트 루프를 블로킹하지 않으므로 스레드 풀 크기와 무관하게 동시 요청을 처리합니다.
+
+    Yields:
+        AsyncSession: async 데이터베이스 세션
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,214 @@
+"""
+요청별 시간 예산 (Deadline)과 DB statement timeout
+
+요청마다 경로별 시간 예산(REQUEST_TIMEOUT_SECONDS / ROUTE_TIMEOUTS)으로 마감 시각을 정하고,
+SQL 문을 실행할 때마다 그 시점의 남은 시간을 DB statement timeout으로 전달합니다.
+
+- 마감 시각은 ContextVar로 전달하므로 동기 엔드포인트의 스레드 풀에서도 그대로 보입니다.
+- PostgreSQL: 문마다 실행 직전에 SET LOCAL statement_timeout (트랜잭션이 끝나면 자동 해제).
+  트랜잭션 시작 시 한 번만 설정하면 COUNT → SELECT처럼 이어지는 문이 각각 처음 남은 시간을
+  모두 사용할 수 있어 마감 시각을 넘기기 때문입니다. (문마다 왕복 한 번 추가)
+- SQLite: 커넥션의 progress handler가 마감 시각이 지나면 실행 중인 쿼리를 중단 (동기 드라이버)
+- MySQL / MariaDB: 문 단위 제한을 적용하지 않습니다. 실행 전 예산 소진 확인만 합니다.
+- 문을 실행하기 전에 이미 예산을 다 썼으면 쿼리를 보내지 않고 DeadlineExceeded를 발생시킵니다.
+- DeadlineMiddleware가 DB 취소 오류 / DeadlineExceeded를 504 응답으로 바꾸고 메트릭에 집계합니다.
+  세션은 평소처럼 의존성 종료 시 롤백 후 닫히므로 커넥션은 정상 상태로 풀에 반환됩니다.
+- 요청 처리 태스크 자체를 취소하지는 않습니다. 스레드에서 실행 중인 쿼리와 세션을 다른 스레드에서
+  정리하게 되어 커넥션이 사용 중인 채로 반환될 수 있기 때문입니다. DB 밖의 작업은 제한하지 않습니다.
+"""
+
+import sqlite3
+import time
+from contextvars import ContextVar
+
+import orjson
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DBAPIError
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.admission import path_has_prefix
+from app.core.http_metrics import UNMATCHED_ROUTE
+from app.core.metrics import Counter
+
+# PostgreSQL query_canceled (statement_timeout 포함)
+QUERY_CANCELED_SQLSTATE = "57014"
+# SQLite progress handler 호출 간격 (VM 명령어 수)
+SQLITE_PROGRESS_STEPS = 1000
+
+request_timeouts = Counter(
+    "http_request_timeouts_total",
+    "Requests that ran out of their time budget",
+    ("method", "route", "reason"),
+)
+
+_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceeded(RuntimeError):
+    """요청의 시간 예산을 모두 사용함"""
+
+
+def remaining_time() -> float | None:
+    """현재 요청의 남은 시간 (초, 마감 시각이 없으면 None)"""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def parse_route_timeouts(value: str) -> list[tuple[str, str, float]]:
+    """
+    경로별 시간 예산 설정 파싱
+
+    Args:
+        value: "METHOD /경로접두사=초"를 쉼표로 구분한 문자열
+            (예: "GET /api/v1/users/export=300, DELETE /api/v1/users$=300",
+            METHOD가 *이면 모든 메서드). 접두사는 경로 구분(/) 단위로 비교하며,
+            $로 끝나면 경로가 정확히 일치할 때만 적용합니다.
+
+    Returns:
+        (METHOD, 경로 접두사 또는 $로 끝나는 경로, 예산) 목록 (먼저 적은 규칙이 우선)
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    rules = []
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        try:
+            route, seconds = item.rsplit("=", 1)
+            method, prefix = route.split()
+            rules.append((method.upper(), prefix, float(seconds)))
+        except ValueError as e:
+            raise ValueError(f"Invalid ROUTE_TIMEOUTS entry: {item!r}") from e
+    return rules
+
+
+def route_matches(path: str, pattern: str) -> bool:
+    """경로가 규칙과 일치하는지 여부 ($로 끝나면 정확히 일치, 아니면 경로 구분 단위 접두사)"""
+    if pattern.endswith("$"):
+        return path == pattern[:-1]
+    return path_has_prefix(path, pattern)
+
+
+def is_statement_timeout(exc: BaseException) -> bool:
+    """DB가 시간 예산 때문에 쿼리를 취소한 오류인지 여부"""
+    if not isinstance(exc, DBAPIError):
+        return False
+    orig = exc.orig
+    sqlstate = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+    if sqlstate == QUERY_CANCELED_SQLSTATE:
+        return True
+    return isinstance(orig, sqlite3.OperationalError) and str(orig) == "interrupted"
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _apply_statement_timeout(
+    conn: Connection, cursor, statement, parameters, context, executemany
+) -> None:
+    """문 실행 직전 남은 시간을 statement timeout으로 설정"""
+    remaining = remaining_time()
+    if remaining is None:
+        return
+    if remaining <= 0:
+        raise DeadlineExceeded("request deadline exceeded before the query started")
+    if conn.dialect.name == "postgresql":
+        # 같은 DBAPI 커서로 실행하므로 실행 이벤트가 다시 발생하지 않음
+        cursor.execute(f"SET LOCAL statement_timeout = {max(int(remaining * 1000), 1)}")
+
+
+def _sqlite_progress() -> int:
+    deadline = _deadline.get()
+    return 1 if deadline is not None and time.monotonic() > deadline else 0
+
+
+@event.listens_for(Engine, "connect")
+def _install_sqlite_progress_handler(dbapi_connection, connection_record) -> None:
+    """SQLite 커넥션에 마감 시각을 확인하는 progress handler 등록"""
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        dbapi_connection.set_progress_handler(_sqlite_progress, SQLITE_PROGRESS_STEPS)
+
+
+class DeadlineMiddleware:
+    """
+    요청마다 마감 시각을 지정하고 시간 초과를 504로 응답하는 ASGI 미들웨어
+
+    Args:
+        app: ASGI 앱
+        default_timeout: 기본 시간 예산 (초, 0이면 제한 없음)
+        route_timeouts: (METHOD, 경로 접두사, 예산) 목록 (parse_route_timeouts)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        default_timeout: float = 30.0,
+        route_timeouts: list[tuple[str, str, float]] | None = None,
+    ):
+        self.app = app
+        self.default_timeout = default_timeout
+        self.route_timeouts = route_timeouts or []
+
+    def budget(self, method: str, path: str) -> float:
+        """요청의 시간 예산 (초, 0 이하면 제한 없음)"""
+        for rule_method, prefix, seconds in self.route_timeouts:
+            if rule_method in ("*", method) and route_matches(path, prefix):
+                return seconds
+        return self.default_timeout
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        budget = self.budget(scope["method"], scope["path"])
+        if budget <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        token = _deadline.set(time.monotonic() + budget)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except (DBAPIError, DeadlineExceeded) as e:
+            if isinstance(e, DBAPIError) and not is_statement_timeout(e):
+                raise
+            route = scope.get("route")
+            reason = (
+                "budget_exhausted"
+                if isinstance(e, DeadlineExceeded)
+                else "statement_timeout"
+            )
+            request_timeouts.labels(
+                scope["method"],
+                route.path if route is not None else UNMATCHED_ROUTE,
+                reason,
+            ).inc()
+            if response_started:
+                raise
+            await self._timeout_response(send)
+        finally:
+            _deadline.reset(token)
+
+    @staticmethod
+    async def _timeout_response(send: Send) -> None:
+        body = orjson.dumps({"detail": "Request deadline exceeded"})
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 504,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -4,8 +4,9 @@
 FastAPI의 Depends()와 함께 사용되는 의존성들을 정의합니다.
 """
 
-from sqlalchemy.orm import Session
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
+from app.core.replicas import get_read_db, get_async_read_db
 
 # 데이터베이스 세션 의존성 (재export)
-__all__ = ["get_db"]
+# 읽기 전용 라우트는 get_read_db / get_async_read_db (복제본), 쓰기 라우트는 get_db / get_async_db
+__all__ = ["get_db", "get_async_db", "get_read_db", "get_async_read_db"]
@@ -0,0 +1,53 @@
+"""
+ETag / 조건부 요청 처리
+
+If-None-Match / If-Match 헤더를 ETag와 비교하는 함수를 정의합니다. (RFC 9110 13.1)
+
+- If-None-Match는 약한 비교(W/ 접두사 무시)를 사용합니다.
+- If-Match는 강한 비교를 사용하므로 약한 ETag는 일치하지 않습니다.
+- "*"는 리소스가 존재하면 일치합니다.
+"""
+
+import hashlib
+
+
+def make_etag(*parts: object) -> str:
+    """
+    값 목록으로 강한 ETag 생성
+
+    Args:
+        parts: 리소스 버전을 결정하는 값 (예: ID, 수정 시각)
+
+    Returns:
+        따옴표로 감싼 ETag (예: "3f2a...")
+    """
+    source = ":".join(str(part) for part in parts).encode()
+    return f'"{hashlib.blake2b(source, digest_size=8).hexdigest()}"'
+
+
+def parse_etags(header: str) -> list[str]:
+    """If-Match / If-None-Match 헤더 값을 ETag 목록으로 분리"""
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+def etag_matches(header: str, etag: str, weak: bool = False) -> bool:
+    """
+    조건부 요청 헤더와 현재 ETag 비교
+
+    Args:
+        header: If-None-Match 또는 If-Match 헤더 값
+        etag: 현재 리소스의 ETag
+        weak: True면 약한 비교 (If-None-Match), False면 강한 비교 (If-Match)
+
+    Returns:
+        일치 여부
+    """
+    for tag in parse_etags(header):
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            if weak and tag[2:] == etag:
+                return True
+        elif tag == etag:
+            return True
+    return False
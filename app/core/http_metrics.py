@@ -0,0 +1,103 @@
+"""
+HTTP 요청 메트릭
+
+라우트 템플릿(예: /api/v1/users/{user_id})별 요청 수, 상태 코드 클래스, 처리 중 요청 수,
+응답 시간을 수집하는 ASGI 미들웨어입니다.
+
+- 라벨은 실제 경로가 아닌 라우트 템플릿을 사용하므로 라벨 조합 수가 라우트 수로 제한됩니다.
+  매칭되는 라우트가 없는 요청(404)은 UNMATCHED_ROUTE 하나로 집계합니다.
+- method 라벨도 표준 메서드만 그대로 쓰고, 그 외 임의의 메서드는 OTHER_METHOD 하나로 집계합니다.
+- 미들웨어는 이벤트 루프 스레드에서만 기록하므로 Lock 없이 child 값을 갱신합니다.
+- 라벨 조합별 child는 처음 한 번만 조회하고 미들웨어에 보관해 재사용합니다.
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import Counter, Gauge, Histogram
+
+# 매칭되는 라우트가 없는 요청의 route 라벨
+UNMATCHED_ROUTE = "<unmatched>"
+
+# 표준 메서드 외의 method 라벨
+OTHER_METHOD = "other"
+STANDARD_METHODS = frozenset(
+    ("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "TRACE", "CONNECT")
+)
+
+# status_code // 100 → status 라벨
+STATUS_CLASSES = ("1xx", "1xx", "2xx", "3xx", "4xx", "5xx")
+
+http_requests = Counter(
+    "http_requests_total",
+    "HTTP requests by route template and status class",
+    ("method", "route", "status"),
+)
+http_request_duration = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ("method", "route"),
+)
+http_requests_in_flight = Gauge(
+    "http_requests_in_flight", "HTTP requests currently being processed", ("method",)
+)
+
+
+class PrometheusMiddleware:
+    """요청별 메트릭을 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._in_flight: dict[str, object] = {}
+        self._durations: dict[tuple[str, str], object] = {}
+        self._counts: dict[tuple[str, str, str], object] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        if method not in STANDARD_METHODS:
+            method = OTHER_METHOD
+        in_flight = self._in_flight.get(method)
+        if in_flight is None:
+            in_flight = self._in_flight[method] = http_requests_in_flight.labels(method)
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            in_flight.dec()
+            # 라우팅 후 FastAPI가 scope["route"]에 매칭된 APIRoute를 남김
+            route = scope.get("route")
+            path = route.path if route is not None else UNMATCHED_ROUTE
+            self._record(method, path, status_code, elapsed)
+
+    def _record(self, method: str, route: str, status_code: int, elapsed: float) -> None:
+        """라벨 조합별 child를 재사용해 요청 수와 응답 시간 기록"""
+        duration_key = (method, route)
+        duration = self._durations.get(duration_key)
+        if duration is None:
+            duration = self._durations[duration_key] = http_request_duration.labels(
+                method, route
+            )
+        duration.observe(elapsed)
+
+        status_class = STATUS_CLASSES[min(status_code // 100, 5)]
+        count_key = (method, route, status_class)
+        count = self._counts.get(count_key)
+        if count is None:
+            count = self._counts[count_key] = http_requests.labels(*count_key)
+        count.inc()
@@ -0,0 +1,412 @@
+"""
+Idempotency-Key 처리
+
+클라이언트가 네트워크 오류 후 같은 Idempotency-Key로 재시도하면, 처음 요청의 응답을
+저장소에서 그대로 반환(replay)합니다. 재시도는 서비스 계층을 다시 실행하지 않습니다.
+
+- 저장소는 CacheBackend를 사용합니다. 기본값은 프로세스 내 LRUCache(IDEMPOTENCY_MAX_KEYS,
+  IDEMPOTENCY_TTL_SECONDS)이며, 멀티 워커에서 워커 간 재시도를 처리하려면 공유 저장소
+  (예: Redis) CacheBackend 구현으로 교체합니다.
+- 처음 요청은 CacheBackend.add로 키를 선점(pending)하고 실행합니다. 실행 중인 키는 프로세스 내
+  목록에도 등록하므로, 저장소에서 pending 항목이 제거(eviction)되어도 같은 프로세스의 중복 요청은
+  실행되지 않습니다.
+- 같은 프로세스에서 실행 중인 키의 요청은 폴링하지 않고 완료 이벤트를 기다립니다. 다른 프로세스가
+  실행 중인 키(공유 저장소)만 저장소를 폴링합니다.
+- 키는 클라이언트 범위(idempotency_scope)와 함께 저장하므로, 다른 클라이언트가 같은 키를 보내도
+  서로의 응답을 받거나 충돌하지 않습니다.
+- 키마다 요청 내용의 지문(fingerprint)을 저장해, 같은 키로 다른 내용을 보내면 422를 반환합니다.
+- 5xx 응답과 예외는 저장하지 않고 키를 해제하므로 재시도하면 다시 실행합니다.
+- 다른 프로세스가 선점한 키가 IDEMPOTENCY_LOCK_SECONDS 안에 끝나지 않으면(프로세스 종료 등) 다음
+  요청이 compare-and-set으로 키를 넘겨받습니다. 넘겨받은 뒤에는 원래 요청이 늦게 끝나도 결과를
+  덮어쓰지 않습니다.
+- 메트릭은 스레드 풀에서도 기록하므로 _metrics_lock으로 직렬화합니다.
+"""
+
+import asyncio
+import base64
+import hashlib
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+
+import orjson
+from fastapi import HTTPException, Request, status
+from starlette.responses import Response
+
+from app.core.cache import CacheBackend, LRUCache
+from app.core.config import get_settings
+from app.core.metrics import Counter
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+# 저장된 응답과 함께 반환할 헤더
+STORED_HEADERS = ("content-type", "etag", "location")
+
+# 키 선점 결과
+CLAIMED = "claimed"  # 이 요청이 실행
+RUNNING_HERE = "running_here"  # 같은 프로세스의 다른 요청이 실행 중 (완료 이벤트 대기)
+RUNNING_ELSEWHERE = "running_elsewhere"  # 다른 프로세스가 실행 중 (저장소 폴링)
+COMPLETED = "completed"  # 저장된 응답 있음
+
+idempotency_requests = Counter(
+    "idempotency_requests_total",
+    "Requests carrying an Idempotency-Key by outcome",
+    ("outcome",),
+)
+
+# 동기 라우트(스레드 풀)에서도 기록하므로 메트릭 갱신을 직렬화
+_metrics_lock = threading.Lock()
+
+
+def _count(outcome: str) -> None:
+    with _metrics_lock:
+        idempotency_requests.labels(outcome).inc()
+
+
+def request_fingerprint(*parts: object) -> str:
+    """
+    요청 내용 지문
+
+    Args:
+        parts: 요청을 구분하는 값 (메서드, 경로, JSON 직렬화 가능한 본문 등)
+
+    Returns:
+        SHA-256 hex digest
+    """
+    return hashlib.sha256(orjson.dumps(parts, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+class _Claim:
+    """이 프로세스에서 실행 중인 키와 완료 이벤트"""
+
+    __slots__ = ("fingerprint", "pending", "done", "lock", "async_waiters")
+
+    def __init__(self, fingerprint: str, pending: bytes):
+        self.fingerprint = fingerprint
+        self.pending = pending  # 저장소에 기록한 pending 항목 (compare-and-set 기준값)
+        self.done = threading.Event()
+        self.lock = threading.Lock()
+        self.async_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    def finish(self) -> None:
+        """완료 표시 후 기다리는 스레드 / 코루틴을 깨움"""
+        with self.lock:
+            self.done.set()
+            waiters, self.async_waiters = self.async_waiters, []
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_resolve, future)
+
+    async def wait_async(self, timeout: float) -> None:
+        """완료될 때까지 최대 timeout초 대기 (이벤트 루프를 막지 않음)"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self.lock:
+            if self.done.is_set():
+                return
+            self.async_waiters.append((loop, future))
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self.lock:
+                if (loop, future) in self.async_waiters:
+                    self.async_waiters.remove((loop, future))
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class IdempotencyStore:
+    """
+    Idempotency-Key별 처리 상태와 응답 저장소
+
+    Args:
+        backend: 값 저장소 (add / compare_and_set이 원자적이어야 동시 요청 중 하나만 실행됨)
+        lock_seconds: 다른 프로세스가 선점 후 이 시간이 지나도 끝내지 않은 키는 넘겨받음
+        wait_seconds: 같은 키의 처리 중 요청을 기다리는 최대 시간
+        poll_interval: 다른 프로세스가 처리 중인 키를 기다리는 동안 저장소 확인 간격 (초)
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        lock_seconds: float = 30.0,
+        wait_seconds: float = 10.0,
+        poll_interval: float = 0.02,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.backend = backend
+        self.lock_seconds = lock_seconds
+        self.wait_seconds = wait_seconds
+        self.poll_interval = poll_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._running: dict[str, _Claim] = {}
+
+    def run(self, key: str, fingerprint: str, produce: Callable[[], Response]) -> Response:
+        """
+        키의 처음 요청이면 produce()를 실행해 응답을 저장하고, 이미 처리된 키면 저장된 응답 반환
+
+        Raises:
+            HTTPException: 다른 내용으로 재사용된 키(422), 처리 중 대기 시간 초과(409)
+        """
+        deadline = time.monotonic() + self.wait_seconds
+        while True:
+            state, value = self._claim(key, fingerprint)
+            if state == CLAIMED:
+                break
+            if state == COMPLETED:
+                return self._replay(value)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise self._in_progress()
+            if state == RUNNING_HERE:
+                value.done.wait(remaining)
+            else:
+                time.sleep(min(self.poll_interval, remaining))
+
+        claim = value
+        try:
+            response = produce()
+        except HTTPException as e:
+            self._complete_error(key, claim, e)
+            raise
+        except BaseException:
+            self._release(key, claim)
+            raise
+        self._complete(key, claim, response)
+        return response
+
+    async def run_async(
+        self, key: str, fingerprint: str, produce: Callable[[], Awaitable[Response]]
+    ) -> Response:
+        """run과 동일 (async 라우트용, 대기 중 이벤트 루프를 막지 않음)"""
+        deadline = time.monotonic() + self.wait_seconds
+        while True:
+            state, value = self._claim(key, fingerprint)
+            if state == CLAIMED:
+                break
+            if state == COMPLETED:
+                return self._replay(value)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise self._in_progress()
+            if state == RUNNING_HERE:
+                await value.wait_async(remaining)
+            else:
+                await asyncio.sleep(min(self.poll_interval, remaining))
+
+        claim = value
+        try:
+            response = await produce()
+        except HTTPException as e:
+            self._complete_error(key, claim, e)
+            raise
+        except BaseException:
+            self._release(key, claim)
+            raise
+        self._complete(key, claim, response)
+        return response
+
+    def _claim(self, key: str, fingerprint: str) -> tuple[str, object]:
+        """
+        키 선점 시도
+
+        Returns:
+            (CLAIMED, 선점한 _Claim), (RUNNING_HERE, 실행 중인 _Claim),
+            (RUNNING_ELSEWHERE, None), (COMPLETED, 저장된 항목) 중 하나
+
+        Raises:
+            HTTPException: 다른 내용으로 재사용된 키(422)
+        """
+        with self._lock:
+            claim = self._running.get(key)
+            if claim is not None:
+                self._check_fingerprint(claim.fingerprint, fingerprint)
+                return RUNNING_HERE, claim
+            pending = self._pending(fingerprint)
+            if self.backend.add(key, pending):
+                return CLAIMED, self._register(key, fingerprint, pending)
+
+        raw = self.backend.get(key)
+        if raw is None:  # 그 사이 만료 / 해제됨
+            return self._claim(key, fingerprint)
+        stored = orjson.loads(raw)
+        self._check_fingerprint(stored["fingerprint"], fingerprint)
+        if stored.get("status") is not None:
+            return COMPLETED, stored
+        if self._clock() - stored["started_at"] <= self.lock_seconds:
+            return RUNNING_ELSEWHERE, None
+
+        # 다른 프로세스가 선점한 뒤 끝내지 못함 (프로세스 종료 등) → 항목이 그대로일 때만 넘겨받음
+        with self._lock:
+            if key not in self._running:
+                pending = self._pending(fingerprint)
+                if self.backend.compare_and_set(key, raw, pending):
+                    return CLAIMED, self._register(key, fingerprint, pending)
+        return self._claim(key, fingerprint)
+
+    def _pending(self, fingerprint: str) -> bytes:
+        return orjson.dumps({"fingerprint": fingerprint, "started_at": self._clock()})
+
+    def _register(self, key: str, fingerprint: str, pending: bytes) -> _Claim:
+        """Lock을 잡은 상태에서 선점한 키를 실행 중 목록에 등록"""
+        _count("executed")
+        claim = self._running[key] = _Claim(fingerprint, pending)
+        return claim
+
+    def _finish(self, key: str, claim: _Claim) -> None:
+        """실행 중 목록에서 제거하고 기다리는 요청을 깨움"""
+        with self._lock:
+            if self._running.get(key) is claim:
+                del self._running[key]
+        claim.finish()
+
+    def _release(self, key: str, claim: _Claim) -> None:
+        """저장하지 않고 키 해제 (다른 요청이 넘겨받았으면 그대로 둠)"""
+        try:
+            self.backend.compare_and_set(key, claim.pending, None)
+        finally:
+            self._finish(key, claim)
+
+    def _complete(self, key: str, claim: _Claim, response: Response) -> None:
+        if response.status_code >= 500:
+            self._release(key, claim)
+            return
+        headers = [
+            (name, value)
+            for name, value in response.headers.items()
+            if name in STORED_HEADERS
+        ]
+        self._store(key, claim, response.status_code, response.body, headers)
+
+    def _complete_error(self, key: str, claim: _Claim, exc: HTTPException) -> None:
+        if exc.status_code >= 500:
+            self._release(key, claim)
+            return
+        headers = list((exc.headers or {}).items())
+        headers.append(("content-type", "application/json"))
+        body = orjson.dumps({"detail": exc.detail})
+        self._store(key, claim, exc.status_code, body, headers)
+
+    def _store(
+        self,
+        key: str,
+        claim: _Claim,
+        status_code: int,
+        body: bytes,
+        headers: list[tuple[str, str]],
+    ) -> None:
+        """
+        응답 저장
+
+        저장소의 항목이 아직 이 요청의 pending 항목일 때만 교체하고, 항목이 제거된 경우에만 새로
+        추가합니다. 다른 요청이 넘겨받은 키는 덮어쓰지 않습니다.
+        """
+        entry = orjson.dumps(
+            {
+                "fingerprint": claim.fingerprint,
+                "status": status_code,
+                "headers": headers,
+                "body": base64.b64encode(body).decode(),
+            }
+        )
+        try:
+            if not self.backend.compare_and_set(key, claim.pending, entry):
+                self.backend.add(key, entry)
+        finally:
+            self._finish(key, claim)
+
+    @staticmethod
+    def _check_fingerprint(stored: str, fingerprint: str) -> None:
+        if stored != fingerprint:
+            _count("mismatch")
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"{IDEMPOTENCY_HEADER} was reused with a different request",
+            )
+
+    @staticmethod
+    def _replay(stored: dict) -> Response:
+        _count("replayed")
+        headers = dict(stored["headers"])
+        headers[REPLAYED_HEADER] = "true"
+        return Response(
+            base64.b64decode(stored["body"]),
+            status_code=stored["status"],
+            headers=headers,
+        )
+
+    @staticmethod
+    def _in_progress() -> HTTPException:
+        _count("in_progress")
+        return HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"A request with this {IDEMPOTENCY_HEADER} is still in progress",
+            headers={"Retry-After": "1"},
+        )
+
+
+def validate_idempotency_key(key: str) -> str:
+    """
+    Idempotency-Key 헤더 값 검증
+
+    Raises:
+        HTTPException: 비어 있거나 너무 긴 경우 400
+    """
+    key = key.strip()
+    if not key or len(key) > MAX_KEY_LENGTH:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{IDEMPOTENCY_HEADER} must be 1-{MAX_KEY_LENGTH} characters",
+        )
+    return key
+
+
+def idempotency_scope(request: Request) -> str:
+    """
+    Idempotency-Key를 저장할 클라이언트 범위
+
+    Authorization 헤더가 있으면 그 해시를, 없으면 클라이언트 주소를 사용합니다.
+    자격 증명 원문은 저장소 키에 남기지 않습니다.
+
+    Args:
+        request: 현재 요청
+
+    Returns:
+        저장소 키 앞에 붙일 클라이언트 식별자
+    """
+    authorization = request.headers.get("authorization")
+    if authorization:
+        return "auth:" + hashlib.sha256(authorization.encode()).hexdigest()
+    host = request.client.host if request.client else "unknown"
+    return f"ip:{host}"
+
+
+@lru_cache()
+def get_idempotency_store() -> IdempotencyStore | None:
+    """
+    Idempotency-Key 저장소 반환 (싱글톤 패턴)
+
+    동기/async 라우터가 같은 인스턴스를 공유합니다.
+
+    Returns:
+        IDEMPOTENCY_ENABLED이면 IdempotencyStore, 아니면 None
+    """
+    settings = get_settings()
+    if not settings.IDEMPOTENCY_ENABLED:
+        return None
+    backend = LRUCache(
+        max_size=settings.IDEMPOTENCY_MAX_KEYS,
+        ttl_seconds=settings.IDEMPOTENCY_TTL_SECONDS,
+    )
+    return IdempotencyStore(
+        backend,
+        lock_seconds=settings.IDEMPOTENCY_LOCK_SECONDS,
+        wait_seconds=settings.IDEMPOTENCY_WAIT_SECONDS,
+    )
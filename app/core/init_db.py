@@ -1,47 +1,173 @@
 """
 데이터베이스 초기화
 
-서버 시작 시 데이터베이스 테이블을 생성하고 초기 데이터를 설정합니다.
+서버 시작 시 DB_SCHEMA_MODE에 따라 스키마를 준비하고 초기 데이터를 설정합니다.
+
+- create_all: 엔티티 메타데이터로 없는 테이블 생성 (개발용, 테이블마다 카탈로그 조회)
+- check: alembic_version 한 번 조회로 스키마가 마이그레이션 head인지 확인 (운영용)
+- migrate: 시작 시 alembic upgrade head 실행 (PostgreSQL은 advisory lock으로 워커 간 직렬화)
+- none: 아무것도 하지 않음 (배포 파이프라인에서 마이그레이션을 실행하는 경우)
 """
 
+import logging
+import time
+from collections.abc import Callable
+from functools import lru_cache
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
 from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
 from app.core.database import engine, Base, SessionLocal
 from app.core.config import get_settings
+from app.core.metrics import Histogram
 
 # 모든 엔티티 import (Base.metadata에 등록하기 위함)
 from app.features.user.entity import User  # noqa: F401
 
+logger = logging.getLogger("app.db")
 settings = get_settings()
 
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+# 여러 워커가 동시에 migrate 모드로 시작할 때 사용하는 advisory lock 키
+MIGRATION_LOCK_KEY = 0x6D696772
+
+startup_duration = Histogram(
+    "app_startup_duration_seconds",
+    "Process cold start time by phase (import, schema, total)",
+    ("phase",),
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+
+class SchemaVersionError(RuntimeError):
+    """DB 스키마 리비전이 마이그레이션 head와 다름"""
+
+
+@lru_cache()
+def get_alembic_config() -> Config:
+    """alembic.ini 설정 (DATABASE_URL은 migrations/env.py에서 Settings로 읽음)"""
+    config = Config(str(ALEMBIC_INI))
+    config.attributes["configure_logger"] = False  # 애플리케이션 로깅 설정 유지
+    return config
+
+
+def include_object_for(dialect_name: str) -> Callable[..., bool]:
+    """
+    autogenerate 비교 필터 생성 (alembic include_object)
+
+    다른 dialect 전용 인덱스(ddl_if)는 마이그레이션 대상 DB에 생성되지 않으므로 비교에서 제외합니다.
+
+    Args:
+        dialect_name: 마이그레이션 대상 DB dialect 이름
+    """
+
+    def include_object(object, name, type_, reflected, compare_to) -> bool:
+        if type_ == "index" and not reflected and object._ddl_if is not None:
+            dialects = object._ddl_if.dialect or ()
+            dialects = (dialects,) if isinstance(dialects, str) else dialects
+            return dialect_name in dialects
+        return True
+
+    return include_object
+
+
+def get_head_revisions() -> set[str]:
+    """마이그레이션 스크립트의 head 리비전 (DB 조회 없음)"""
+    return set(ScriptDirectory.from_config(get_alembic_config()).get_heads())
+
+
+def get_current_revisions(bind: Engine = engine) -> set[str]:
+    """
+    DB에 기록된 현재 리비전 조회 (alembic_version 한 번 조회)
+
+    Args:
+        bind: 조회할 DB 엔진
+
+    Returns:
+        리비전 집합 (alembic_version 테이블이 없으면 빈 집합)
+    """
+    with bind.connect() as conn:
+        try:
+            rows = conn.execute(text("SELECT version_num FROM alembic_version"))
+        except DBAPIError:
+            return set()
+        return {row[0] for row in rows}
+
+
+def check_schema_version(bind: Engine = engine) -> None:
+    """
+    스키마가 마이그레이션 head인지 확인
+
+    Args:
+        bind: 확인할 DB 엔진
+
+    Raises:
+        SchemaVersionError: 리비전이 다르거나 마이그레이션되지 않은 DB
+    """
+    current, heads = get_current_revisions(bind), get_head_revisions()
+    if current != heads:
+        raise SchemaVersionError(
+            f"Database schema revision {sorted(current) or 'none'} does not match "
+            f"migration head {sorted(heads)}; run `alembic upgrade head`"
+        )
+
+
+def run_migrations(bind: Engine = engine) -> None:
+    """alembic upgrade head 실행 (PostgreSQL은 advisory lock으로 동시 실행 방지)"""
+    config = get_alembic_config()
+    with bind.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            conn.execute(
+                text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATION_LOCK_KEY}
+            )
+        config.attributes["connection"] = conn
+        try:
+            command.upgrade(config, "head")
+        finally:
+            config.attributes.pop("connection", None)
+
 
 def init_database():
     """
     데이터베이스 초기화
 
-    1. 데이터베이스 연결 확인
-    2. 테이블 생성 (존재하지 않는 경우)
-    3. 초기 데이터 설정 (필요시)
+    1. DB_SCHEMA_MODE에 따라 스키마 준비 / 확인
+    2. 초기 데이터 설정 (필요시)
+
+    소요 시간은 app_startup_duration_seconds{phase="schema"}로 기록합니다.
     """
-    print("🔄 Initializing database...")
+    mode = settings.DB_SCHEMA_MODE
+    logger.info("Initializing database (schema mode: %s)", mode)
+    started = time.perf_counter()
 
     try:
-        # 데이터베이스 연결 확인
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
-            print("✅ Database connection successful")
-
-        # 테이블 생성
-        Base.metadata.create_all(bind=engine)
-        print("✅ Database tables created")
+        if mode == "create_all":
+            Base.metadata.create_all(bind=engine)
+            logger.info("Database tables created")
+        elif mode == "check":
+            check_schema_version()
+            logger.info("Database schema is up to date")
+        elif mode == "migrate":
+            run_migrations()
+            logger.info("Database migrated to head")
+        elif mode != "none":
+            raise ValueError(f"Unknown DB_SCHEMA_MODE: {mode}")
 
         # 초기 데이터 설정 (필요시)
         # _create_initial_data()
 
-        print("✅ Database initialization complete")
+        logger.info("Database initialization complete")
 
-    except Exception as e:
-        print(f"❌ Database initialization failed: {e}")
+    except Exception:
+        logger.exception("Database initialization failed")
         raise
+    finally:
+        startup_duration.labels("schema").observe(time.perf_counter() - started)
 
 
 def _create_initial_data():
@@ -66,12 +192,12 @@ def _create_initial_data():
         #         is_active=True
         #     )
         #     UserRepository.create(db, admin_user)
-        #     print("✅ Initial admin user created")
+        #     logger.info("Initial admin user created")
 
         pass
 
-    except Exception as e:
-        print(f"❌ Initial data creation failed: {e}")
+    except Exception:
+        logger.exception("Initial data creation failed")
         db.rollback()
     finally:
         db.close()
@@ -84,4 +210,4 @@ def drop_all_tables():
     주의: 테스트 환경에서만 사용해야 합니다!
     """
     Base.metadata.drop_all(bind=engine)
-    print("⚠️  All tables dropped")
+    logger.warning("All tables dropped")
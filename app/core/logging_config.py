@@ -0,0 +1,192 @@
+"""
+구조화 로깅 설정
+
+로그 레코드를 JSON 한 줄로 출력하고, 출력 I/O는 백그라운드 스레드에서 처리합니다.
+
+- 루트 로거에는 QueueHandler만 등록하므로 요청 경로에서는 큐에 넣는 비용만 듭니다.
+  실제 포맷/출력은 QueueListener 스레드가 담당합니다.
+- 리스너 스레드는 fork 후 자식 프로세스로 복제되지 않으므로 lifespan 시작 시(워커마다)
+  configure_logging을 호출하고, 종료 시 stop_logging으로 남은 로그를 내보냅니다.
+- RequestIdMiddleware가 요청마다 ID(X-Request-ID)를 ContextVar에 저장하고,
+  RequestIdFilter가 로그 레코드에 request_id로 추가합니다.
+- uvicorn 로거도 루트로 전달해 같은 형식으로 출력합니다.
+"""
+
+import logging
+import queue
+import re
+import sys
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import IO
+
+import orjson
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+REQUEST_ID_HEADER = "X-Request-ID"
+# 클라이언트가 보낸 요청 ID는 이 형식일 때만 사용 (로그 주입 방지)
+REQUEST_ID_PATTERN = re.compile(r"[A-Za-z0-9._-]{1,128}")
+UVICORN_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+# LogRecord 기본 속성 (그 외 속성은 extra로 전달된 필드로 출력)
+_RECORD_ATTRS = frozenset(
+    logging.LogRecord("", 0, "", 0, "", None, None).__dict__
+) | {"message", "asctime", "request_id"}
+
+_request_id: ContextVar[str | None] = ContextVar("request_id", default=None)
+_listener: QueueListener | None = None
+
+
+def get_request_id() -> str | None:
+    """현재 요청의 ID (요청 컨텍스트 밖이면 None)"""
+    return _request_id.get()
+
+
+class RequestIdFilter(logging.Filter):
+    """로그 레코드에 현재 요청 ID 추가 (로그를 남긴 스레드에서 실행되어야 함)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = _request_id.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드를 JSON 한 줄로 변환"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "process": record.process,
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id is not None:
+            entry["request_id"] = request_id
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return orjson.dumps(entry, default=str).decode()
+
+
+class _QueueHandler(QueueHandler):
+    """
+    포맷은 리스너 스레드에 맡기는 QueueHandler
+
+    기본 QueueHandler.prepare는 큐에 넣기 전에 메시지를 포맷하므로, 메시지 인자만
+    합치고 예외 정보는 문자열로 바꿔(스레드 간 traceback 객체 공유 방지) 전달합니다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def configure_logging(
+    level: str = "INFO",
+    json_format: bool = True,
+    sql_level: str = "WARNING",
+    stream: IO[str] | None = None,
+) -> QueueListener:
+    """
+    루트 로거를 큐 기반 핸들러로 구성하고 리스너 스레드 시작
+
+    다시 호출하면 이전 핸들러와 리스너를 교체합니다.
+
+    Args:
+        level: 루트 로그 레벨
+        json_format: True면 JSON 한 줄, False면 사람이 읽기 쉬운 텍스트
+        sql_level: app.sql 로거 레벨 (DEBUG면 샘플링된 SQL 문 기록)
+        stream: 출력 대상 (기본 stdout)
+
+    Returns:
+        시작된 QueueListener
+    """
+    global _listener
+    stop_logging()
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(
+        JsonFormatter()
+        if json_format
+        else logging.Formatter(
+            "%(asctime)s %(levelname)s [%(name)s] [%(request_id)s] %(message)s"
+        )
+    )
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = _QueueHandler(log_queue)
+    handler.addFilter(RequestIdFilter())
+
+    root = logging.getLogger()
+    root.addHandler(handler)
+    root.setLevel(level.upper())
+    logging.getLogger("app.sql").setLevel(sql_level.upper())
+    for name in UVICORN_LOGGERS:
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers.clear()
+        uvicorn_logger.propagate = True
+
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def stop_logging() -> None:
+    """큐 핸들러를 제거하고 리스너 스레드를 멈춰 큐에 남은 로그 출력"""
+    global _listener
+    root = logging.getLogger()
+    for handler in [h for h in root.handlers if isinstance(h, _QueueHandler)]:
+        root.removeHandler(handler)
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+class RequestIdMiddleware:
+    """
+    요청 ID를 지정하는 ASGI 미들웨어
+
+    요청의 X-Request-ID가 올바른 형식이면 그대로 사용하고, 없으면 새로 생성합니다.
+    요청 처리 중 로그에 request_id로 기록되며 응답 헤더로도 반환합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        header = next(
+            (value for key, value in scope["headers"] if key == b"x-request-id"), None
+        )
+        request_id = header.decode("latin-1") if header is not None else ""
+        if not REQUEST_ID_PATTERN.fullmatch(request_id):
+            request_id = uuid.uuid4().hex
+        token = _request_id.set(request_id)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_id.reset(token)
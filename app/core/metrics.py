@@ -0,0 +1,474 @@
+"""
+애플리케이션 메트릭
+
+프로세스(워커) 단위로 집계하는 Counter / Gauge / Histogram과 전역 레지스트리를 정의합니다.
+
+- 라벨 조합별 child 객체는 최초 1회만 생성하고 이후에는 재사용하므로
+  기록 시점에는 객체를 할당하지 않습니다.
+- child의 기록 연산에는 Lock이 없습니다. 이벤트 루프처럼 단일 스레드에서 기록하거나,
+  여러 스레드에서 기록하는 경우 호출하는 쪽에서 직렬화해야 합니다.
+
+출력은 Prometheus text format(0.0.4)을 사용합니다. 여러 워커 프로세스로 실행할 때는
+각 워커가 공유 디렉터리에 스냅샷(JSON)을 주기적으로 기록하고, 스크레이프 시 모든
+워커의 스냅샷을 합산합니다.
+"""
+
+import asyncio
+import json
+import math
+import os
+import threading
+from bisect import bisect_left
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+# 기본 히스토그램 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class CounterChild:
+    """단조 증가 카운터 값"""
+
+    __slots__ = ("value", "function")
+
+    def __init__(self):
+        self.value = 0.0
+        self.function: Callable[[], float] | None = None
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """조회 시점마다 function() 결과를 값으로 사용 (외부에서 집계하는 카운터용)"""
+        self.function = function
+
+    def get(self) -> float:
+        if self.function is not None:
+            return float(self.function())
+        return self.value
+
+    def reset(self) -> None:
+        self.value = 0.0
+
+
+class GaugeChild:
+    """증감 가능한 값 (또는 조회 시점에 계산하는 콜백)"""
+
+    __slots__ = ("value", "function")
+
+    def __init__(self):
+        self.value = 0.0
+        self.function: Callable[[], float] | None = None
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """조회 시점마다 function() 결과를 값으로 사용"""
+        self.function = function
+
+    def get(self) -> float:
+        if self.function is not None:
+            return float(self.function())
+        return self.value
+
+    def reset(self) -> None:
+        self.value = 0.0
+
+
+class HistogramChild:
+    """고정 버킷 히스토그램 값 (버킷별 비누적 카운트 저장)"""
+
+    __slots__ = ("upper_bounds", "bucket_counts", "sum", "count")
+
+    def __init__(self, upper_bounds: tuple[float, ...]):
+        self.upper_bounds = upper_bounds
+        self.bucket_counts = [0] * (len(upper_bounds) + 1)  # 마지막은 +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect_left(self.upper_bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def reset(self) -> None:
+        self.bucket_counts = [0] * (len(self.upper_bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def quantile(self, q: float) -> float:
+        """버킷 상한 기준 근사 분위수 (관측값이 없으면 0)"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for upper_bound, bucket_count in zip(self.upper_bounds, self.bucket_counts):
+            seen += bucket_count
+            if seen >= rank:
+                return upper_bound
+        return float("inf")
+
+
+class Metric:
+    """라벨별 child를 관리하는 메트릭 공통 클래스"""
+
+    kind = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        registry: "MetricsRegistry | None" = None,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+        (registry if registry is not None else REGISTRY).register(self)
+
+    def labels(self, *labelvalues: str) -> Any:
+        """
+        라벨 값 조합에 해당하는 child 반환 (없으면 생성)
+
+        반환된 child를 보관해 두면 이후 기록 시 딕셔너리 조회도 생략할 수 있습니다.
+        """
+        child = self._children.get(labelvalues)
+        if child is None:
+            if len(labelvalues) != len(self.labelnames):
+                raise ValueError(f"{self.name}: expected labels {self.labelnames}")
+            with self._lock:
+                child = self._children.setdefault(labelvalues, self._new_child())
+        return child
+
+    def children(self) -> Iterator[tuple[dict[str, str], Any]]:
+        """(라벨 딕셔너리, child) 목록"""
+        for labelvalues, child in list(self._children.items()):
+            yield dict(zip(self.labelnames, labelvalues)), child
+
+    def clear(self) -> None:
+        """모든 child 제거"""
+        with self._lock:
+            self._children.clear()
+
+    def reset(self) -> None:
+        """child는 유지하고 기록된 값만 0으로 초기화 (보관된 child 참조와 콜백 유지)"""
+        for child in list(self._children.values()):
+            child.reset()
+
+    def _new_child(self) -> Any:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """단조 증가 카운터"""
+
+    kind = "counter"
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """라벨이 없는 카운터 증가"""
+        self.labels().inc(amount)
+
+
+class Gauge(Metric):
+    """증감 가능한 값"""
+
+    kind = "gauge"
+
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+    def set(self, value: float) -> None:
+        """라벨이 없는 게이지 값 설정"""
+        self.labels().set(value)
+
+
+class Histogram(Metric):
+    """고정 버킷 히스토그램"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        registry: "MetricsRegistry | None" = None,
+    ):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """라벨이 없는 히스토그램 관측값 기록"""
+        self.labels().observe(value)
+
+
+class MetricsRegistry:
+    """메트릭 레지스트리"""
+
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> None:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Duplicate metric: {metric.name}")
+            self._metrics[metric.name] = metric
+
+    def get(self, name: str) -> Metric | None:
+        return self._metrics.get(name)
+
+    def metrics(self) -> list[Metric]:
+        with self._lock:
+            return list(self._metrics.values())
+
+    def reset(self) -> None:
+        """모든 메트릭 값 초기화"""
+        for metric in self.metrics():
+            metric.reset()
+
+
+# 전역 레지스트리
+REGISTRY = MetricsRegistry()
+
+# preload 후 fork된 워커는 부모 프로세스에서 기록된 값을 물려받으므로 0부터 다시 집계
+# (그대로 두면 워커 스냅샷을 합산할 때 부모의 값이 워커 수만큼 중복 집계됨)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=REGISTRY.reset)
+
+# Prometheus text format Content-Type
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def collect(registry: MetricsRegistry | None = None) -> dict[str, dict]:
+    """
+    레지스트리의 현재 값을 직렬화 가능한 스냅샷으로 수집
+
+    Args:
+        registry: 수집할 레지스트리 (기본값: 전역 레지스트리)
+
+    Returns:
+        메트릭 이름별 {kind, documentation, labelnames, buckets, samples}
+        (samples는 [라벨 값 리스트, 값] 목록이며 히스토그램 값은 {buckets, sum, count})
+    """
+    data = {}
+    for metric in (registry if registry is not None else REGISTRY).metrics():
+        samples = []
+        for labelvalues, child in list(metric._children.items()):
+            if metric.kind == "histogram":
+                value = {
+                    "buckets": list(child.bucket_counts),
+                    "sum": child.sum,
+                    "count": child.count,
+                }
+            else:
+                value = child.get()
+            samples.append([list(labelvalues), value])
+        data[metric.name] = {
+            "kind": metric.kind,
+            "documentation": metric.documentation,
+            "labelnames": list(metric.labelnames),
+            "buckets": list(getattr(metric, "buckets", ())),
+            "samples": samples,
+        }
+    return data
+
+
+def merge_snapshots(snapshots: list[tuple[dict[str, dict], bool]]) -> dict[str, dict]:
+    """
+    여러 프로세스의 스냅샷 합산
+
+    카운터와 히스토그램은 종료된 프로세스의 값까지 합산하고(값이 감소하지 않도록),
+    게이지는 실행 중인 프로세스의 값만 합산합니다.
+
+    Args:
+        snapshots: (스냅샷, 프로세스 실행 여부) 목록
+
+    Returns:
+        collect()와 같은 형식의 합산 스냅샷
+    """
+    merged: dict[str, dict] = {}
+    for snapshot, alive in snapshots:
+        for name, metric in snapshot.items():
+            if metric["kind"] == "gauge" and not alive:
+                continue
+            target = merged.setdefault(name, {**metric, "samples": {}})
+            for labelvalues, value in metric["samples"]:
+                key = tuple(labelvalues)
+                current = target["samples"].get(key)
+                if current is None:
+                    target["samples"][key] = (
+                        dict(value, buckets=list(value["buckets"]))
+                        if isinstance(value, dict)
+                        else value
+                    )
+                elif isinstance(value, dict):
+                    current["buckets"] = [
+                        a + b for a, b in zip(current["buckets"], value["buckets"])
+                    ]
+                    current["sum"] += value["sum"]
+                    current["count"] += value["count"]
+                else:
+                    target["samples"][key] = current + value
+    for metric in merged.values():
+        metric["samples"] = [
+            [list(key), value] for key, value in metric["samples"].items()
+        ]
+    return merged
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: list[str], values: list[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def render(data: dict[str, dict]) -> str:
+    """
+    스냅샷을 Prometheus text format으로 변환
+
+    Args:
+        data: collect() 또는 merge_snapshots() 결과
+
+    Returns:
+        Prometheus text format 문자열 (히스토그램 버킷은 누적값)
+    """
+    lines = []
+    for name, metric in data.items():
+        lines.append(f"# HELP {name} {metric['documentation']}")
+        lines.append(f"# TYPE {name} {metric['kind']}")
+        labelnames = metric["labelnames"]
+        for labelvalues, value in metric["samples"]:
+            if metric["kind"] != "histogram":
+                labels = _format_labels(labelnames, labelvalues)
+                lines.append(f"{name}{labels} {_format_value(value)}")
+                continue
+            cumulative = 0
+            for upper_bound, bucket_count in zip(
+                metric["buckets"] + [math.inf], value["buckets"]
+            ):
+                cumulative += bucket_count
+                le = f'le="{_format_value(upper_bound)}"'
+                labels = _format_labels(labelnames, labelvalues, le)
+                lines.append(f"{name}_bucket{labels} {cumulative}")
+            labels = _format_labels(labelnames, labelvalues)
+            lines.append(f"{name}_sum{labels} {_format_value(value['sum'])}")
+            lines.append(f"{name}_count{labels} {value['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def _snapshot_path(directory: str, pid: int) -> Path:
+    return Path(directory) / f"metrics_{pid}.json"
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def write_snapshot(directory: str, registry: MetricsRegistry | None = None) -> None:
+    """
+    현재 프로세스의 스냅샷을 공유 디렉터리에 기록
+
+    임시 파일에 쓴 뒤 os.replace로 교체하므로 읽는 쪽이 쓰다 만 파일을 보지 않습니다.
+
+    Args:
+        directory: 워커들이 공유하는 스냅샷 디렉터리
+        registry: 수집할 레지스트리 (기본값: 전역 레지스트리)
+    """
+    pid = os.getpid()
+    path = _snapshot_path(directory, pid)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps({"pid": pid, "metrics": collect(registry)}))
+    os.replace(tmp_path, path)
+
+
+def read_snapshots(directory: str) -> dict[str, dict]:
+    """
+    공유 디렉터리의 모든 워커 스냅샷을 읽어 합산
+
+    Args:
+        directory: 워커들이 공유하는 스냅샷 디렉터리
+
+    Returns:
+        합산 스냅샷
+    """
+    snapshots = []
+    for path in sorted(Path(directory).glob("metrics_*.json")):
+        try:
+            snapshot = json.loads(path.read_text())
+        except (OSError, ValueError):
+            continue
+        snapshots.append((snapshot["metrics"], _pid_alive(snapshot["pid"])))
+    return merge_snapshots(snapshots)
+
+
+def generate_latest(multiproc_dir: str = "") -> str:
+    """
+    /metrics 응답 본문 생성
+
+    Args:
+        multiproc_dir: 멀티 프로세스 스냅샷 디렉터리 (비어 있으면 현재 프로세스 값만 출력)
+
+    Returns:
+        Prometheus text format 문자열
+    """
+    if not multiproc_dir:
+        return render(collect())
+    # 스크레이프를 받은 워커의 값은 최신으로 기록한 뒤 합산
+    write_snapshot(multiproc_dir)
+    return render(read_snapshots(multiproc_dir))
+
+
+async def run_snapshot_writer(directory: str, interval: float) -> None:
+    """
+    스냅샷을 주기적으로 기록하는 백그라운드 작업
+
+    취소되면(종료 시) 마지막 스냅샷을 한 번 더 기록합니다.
+
+    Args:
+        directory: 워커들이 공유하는 스냅샷 디렉터리
+        interval: 기록 주기 (초)
+    """
+    os.makedirs(directory, exist_ok=True)
+    try:
+        while True:
+            write_snapshot(directory)
+            await asyncio.sleep(interval)
+    finally:
+        write_snapshot(directory)
@@ -0,0 +1,49 @@
+"""
+커서 기반 페이지네이션 유틸리티
+
+키셋(keyset) 페이지네이션에 사용하는 불투명(opaque) 커서를 인코딩/디코딩합니다.
+커서는 마지막으로 반환한 행의 정렬 키를 JSON으로 직렬화한 뒤 URL-safe base64로 감싼 문자열입니다.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any
+
+
+def encode_cursor(payload: dict[str, Any]) -> str:
+    """
+    커서 인코딩
+
+    Args:
+        payload: 커서에 담을 정렬 키 값 (JSON 직렬화 가능해야 함)
+
+    Returns:
+        URL-safe base64 커서 문자열 (패딩 제거)
+    """
+    raw = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """
+    커서 디코딩
+
+    Args:
+        cursor: encode_cursor()로 생성한 커서 문자열
+
+    Returns:
+        커서에 담긴 정렬 키 값
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(payload, dict):
+        raise ValueError("Invalid cursor")
+    return payload
@@ -0,0 +1,189 @@
+"""
+DB 커넥션 풀 메트릭
+
+커넥션 풀의 사용량과 체크아웃 대기 시간을 수집합니다.
+
+- 체크아웃 대기 시간 / 타임아웃: InstrumentedQueuePool._do_get에서 측정
+- 커넥션 생성 / 체크아웃 / 무효화 횟수: 풀 이벤트(connect, checkout, invalidate)로 집계
+- checked-out / idle / overflow: 조회 시점에 풀 상태를 읽는 게이지
+
+풀 라벨은 create_engine(pool_logging_name=...)으로 지정하며,
+engine.dispose()로 풀이 재생성되어도 유지됩니다.
+"""
+
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.metrics import Counter, Gauge, Histogram
+
+# 체크아웃 대기 시간 버킷 (초)
+CHECKOUT_WAIT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+pool_checkout_wait = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection",
+    ("pool",),
+    buckets=CHECKOUT_WAIT_BUCKETS,
+)
+pool_checkout_timeouts = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Connection checkouts that hit the pool timeout",
+    ("pool",),
+)
+pool_checkouts = Counter(
+    "db_pool_checkouts_total", "Connections checked out of the pool", ("pool",)
+)
+pool_connects = Counter(
+    "db_pool_connections_created_total", "New DBAPI connections opened", ("pool",)
+)
+pool_invalidations = Counter(
+    "db_pool_invalidations_total", "Pooled connections invalidated", ("pool",)
+)
+pool_size = Gauge("db_pool_size", "Configured pool size", ("pool",))
+pool_checked_out = Gauge(
+    "db_pool_checked_out", "Connections currently checked out", ("pool",)
+)
+pool_idle = Gauge("db_pool_idle", "Idle connections held by the pool", ("pool",))
+pool_overflow = Gauge(
+    "db_pool_overflow", "Connections opened beyond pool_size", ("pool",)
+)
+
+# 스레드 풀의 여러 워커 스레드가 동시에 기록하므로 기록 구간을 직렬화
+_record_lock = threading.Lock()
+
+# 계측된 엔진 (풀 라벨 → 엔진)
+_engines: dict[str, Engine] = {}
+
+
+class _CheckoutTimingMixin:
+    """커넥션 체크아웃 대기 시간을 측정하는 풀 믹스인"""
+
+    def _do_get(self):
+        label = self._orig_logging_name or "default"
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            with _record_lock:
+                pool_checkout_timeouts.labels(label).inc()
+                pool_checkout_wait.labels(label).observe(time.perf_counter() - start)
+            raise
+        with _record_lock:
+            pool_checkout_wait.labels(label).observe(time.perf_counter() - start)
+        return connection
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    """체크아웃 대기 시간을 측정하는 QueuePool"""
+
+
+class InstrumentedAsyncAdaptedQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    """체크아웃 대기 시간을 측정하는 AsyncAdaptedQueuePool"""
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """
+    엔진의 커넥션 풀에 메트릭 수집 연결
+
+    Args:
+        engine: 동기 엔진 (async 엔진은 engine.sync_engine 전달)
+        name: 풀 라벨 (pool_logging_name과 동일하게 지정)
+    """
+    _engines[name] = engine
+
+    def on_connect(dbapi_connection, connection_record):
+        with _record_lock:
+            pool_connects.labels(name).inc()
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        with _record_lock:
+            pool_checkouts.labels(name).inc()
+
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        with _record_lock:
+            pool_invalidations.labels(name).inc()
+
+    event.listen(engine, "connect", on_connect)
+    event.listen(engine, "checkout", on_checkout)
+    event.listen(engine, "invalidate", on_invalidate)
+
+    # dispose() 후에도 새 풀을 읽도록 engine.pool을 조회 시점에 참조
+    if isinstance(engine.pool, QueuePool):
+        pool_size.labels(name).set_function(lambda: engine.pool.size())
+        pool_checked_out.labels(name).set_function(lambda: engine.pool.checkedout())
+        pool_idle.labels(name).set_function(lambda: engine.pool.checkedin())
+        pool_overflow.labels(name).set_function(
+            lambda: max(engine.pool.overflow(), 0)
+        )
+
+
+def pool_status() -> dict[str, dict]:
+    """
+    계측된 풀의 현재 상태 조회
+
+    Returns:
+        풀 라벨별 사용량, 체크아웃 대기 시간 요약, 타임아웃 횟수
+    """
+    status = {}
+    for name, engine in _engines.items():
+        wait = pool_checkout_wait.labels(name)
+        entry = {
+            "pool_class": type(engine.pool).__name__,
+            "checkouts": pool_checkouts.labels(name).value,
+            "connections_created": pool_connects.labels(name).value,
+            "checkout_timeouts": pool_checkout_timeouts.labels(name).value,
+            "checkout_wait_seconds": {
+                "count": wait.count,
+                "sum": wait.sum,
+                "p50": wait.quantile(0.5),
+                "p95": wait.quantile(0.95),
+                "p99": wait.quantile(0.99),
+            },
+        }
+        if isinstance(engine.pool, QueuePool):
+            entry.update(
+                size=engine.pool.size(),
+                checked_out=engine.pool.checkedout(),
+                idle=engine.pool.checkedin(),
+                overflow=max(engine.pool.overflow(), 0),
+            )
+        status[name] = entry
+    return status
+
+
+def checkout_wait_totals() -> tuple[int, float, float]:
+    """
+    모든 계측 풀의 누적 체크아웃 대기 통계 (구간 평균은 두 시점의 차이로 계산)
+
+    Returns:
+        (체크아웃 횟수, 대기 시간 합계(초), 타임아웃 횟수)
+    """
+    count, total, timeouts = 0, 0.0, 0.0
+    with _record_lock:
+        for name in _engines:
+            wait = pool_checkout_wait.labels(name)
+            count += wait.count
+            total += wait.sum
+            timeouts += pool_checkout_timeouts.labels(name).value
+    return count, total, timeouts
@@ -0,0 +1,181 @@
+"""
+요청별 SQL 실행 통계
+
+SQLAlchemy cursor 실행 이벤트로 요청마다 실행된 SQL 수와 소요 시간을 집계합니다.
+
+- 이벤트는 Engine 클래스에 등록하므로 동기 엔진과 async 엔진(sync_engine) 모두 집계됩니다.
+- 요청 단위 통계 객체는 ContextVar로 전달합니다. 동기 엔드포인트가 실행되는 스레드 풀에도
+  컨텍스트가 복사되며, 통계 객체 자체를 공유하므로 스레드에서 갱신한 값이 그대로 보입니다.
+- QueryStatsMiddleware가 응답 헤더(X-DB-Queries, Server-Timing)를 추가하고,
+  같은 SQL이 한 요청에서 기준 횟수를 넘게 반복되면 N+1 의심 경고를 남깁니다.
+- SAVEPOINT 등 트랜잭션 제어 문은 실행 수에 포함하지 않습니다.
+- 청크 단위 일괄 작업처럼 같은 SQL 반복이 의도된 문은 실행 옵션 EXPECTED_REPEAT_OPTION을 지정해
+  N+1 검사에서 제외합니다. (실행 수와 소요 시간에는 포함)
+- 기준 시간을 넘는 SQL은 요청 여부와 관계없이 slow query 로그로 기록합니다.
+- app.sql.statement 로거가 DEBUG로 활성화되어 있으면 SQL 문을 샘플링 비율만큼 기록합니다.
+  (엔진 echo처럼 모든 문을 요청 경로에서 출력하지 않음)
+"""
+
+import logging
+import random
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("app.sql")
+slow_query_logger = logging.getLogger("app.sql.slow")
+statement_logger = logging.getLogger("app.sql.statement")
+
+# 집계에서 제외할 트랜잭션 제어 문 (대문자 접두사)
+TRANSACTION_CONTROL_PREFIXES = ("BEGIN", "SAVEPOINT", "RELEASE", "ROLLBACK TO")
+# 반복 실행이 의도된 문에 지정하는 실행 옵션 (예: stmt.execution_options(expected_repeat=True))
+EXPECTED_REPEAT_OPTION = "expected_repeat"
+
+
+class QueryStats:
+    """요청 하나의 SQL 실행 통계"""
+
+    __slots__ = ("count", "duration", "statements")
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements: dict[str, int] = {}  # SQL → 실행 횟수
+
+    def record(self, statement: str, elapsed: float, expected_repeat: bool = False) -> None:
+        self.count += 1
+        self.duration += elapsed
+        if not expected_repeat:
+            self.statements[statement] = self.statements.get(statement, 0) + 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """threshold번을 넘게 반복된 SQL 목록 (많은 순)"""
+        return sorted(
+            ((sql, count) for sql, count in self.statements.items() if count > threshold),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar(
+    "query_stats", default=None
+)
+
+# slow query 기준 (초), install_query_hooks에서 설정
+_slow_query_threshold = float("inf")
+# SQL 문 로그 샘플링 비율 (0~1), install_query_hooks에서 설정
+_statement_sample_rate = 0.0
+
+
+def get_query_stats() -> QueryStats | None:
+    """현재 요청의 SQL 실행 통계 (요청 컨텍스트 밖이면 None)"""
+    return _current_stats.get()
+
+
+def is_transaction_control(statement: str) -> bool:
+    """트랜잭션 제어 문(BEGIN / SAVEPOINT / RELEASE / ROLLBACK TO) 여부"""
+    return statement.lstrip()[:11].upper().startswith(TRANSACTION_CONTROL_PREFIXES)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._query_start
+    stats = _current_stats.get()
+    if stats is not None and not is_transaction_control(statement):
+        stats.record(
+            statement,
+            elapsed,
+            context.execution_options.get(EXPECTED_REPEAT_OPTION, False),
+        )
+    if elapsed >= _slow_query_threshold:
+        slow_query_logger.warning(
+            "slow query %.1fms%s: %s",
+            elapsed * 1000,
+            " (executemany)" if executemany else "",
+            statement,
+        )
+    elif (
+        _statement_sample_rate > 0
+        and statement_logger.isEnabledFor(logging.DEBUG)
+        and random.random() < _statement_sample_rate
+    ):
+        statement_logger.debug(
+            "%.1fms: %s",
+            elapsed * 1000,
+            statement,
+            extra={"duration_ms": round(elapsed * 1000, 3)},
+        )
+
+
+def install_query_hooks(
+    slow_query_threshold_ms: float, statement_sample_rate: float = 0.0
+) -> None:
+    """
+    Engine 클래스에 cursor 실행 이벤트 등록 (여러 번 호출해도 한 번만 등록)
+
+    Args:
+        slow_query_threshold_ms: slow query 로그 기준 (밀리초, 0 이하면 기록하지 않음)
+        statement_sample_rate: SQL 문 로그 샘플링 비율 (0~1, app.sql.statement 로거가
+            DEBUG일 때만 기록)
+    """
+    global _slow_query_threshold, _statement_sample_rate
+    _slow_query_threshold = (
+        slow_query_threshold_ms / 1000 if slow_query_threshold_ms > 0 else float("inf")
+    )
+    _statement_sample_rate = min(max(statement_sample_rate, 0.0), 1.0)
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryStatsMiddleware:
+    """요청별 SQL 통계를 수집하고 응답 헤더로 노출하는 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp, n_plus_one_threshold: int = 10):
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-DB-Queries"] = str(stats.count)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries"',
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_stats.reset(token)
+            self._warn_repeated(scope, stats)
+
+    def _warn_repeated(self, scope: Scope, stats: QueryStats) -> None:
+        """같은 SQL이 기준 횟수를 넘게 반복된 요청 경고 (N+1 의심)"""
+        if stats.count <= self.n_plus_one_threshold:
+            return
+        for statement, count in stats.repeated(self.n_plus_one_threshold):
+            route = scope.get("route")
+            logger.warning(
+                "possible N+1: %s %s executed the same statement %d times: %s",
+                scope["method"],
+                route.path if route is not None else scope["path"],
+                count,
+                statement,
+            )
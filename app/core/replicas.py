@@ -0,0 +1,409 @@
+"""
+읽기 복제본(Read Replica) 라우팅
+
+DB_REPLICA_URLS에 지정한 복제본으로 읽기 전용 요청의 세션을 분산합니다.
+
+- 읽기 라우트는 get_read_db / get_async_read_db, 쓰기 라우트는 get_db / get_async_db를 사용합니다.
+- 복제본은 라운드 로빈으로 선택하며, 백그라운드 상태 확인(run_replica_health_checks)에서
+  연결 실패 또는 복제 지연이 DB_REPLICA_MAX_LAG_SECONDS를 넘은 복제본은 제외합니다.
+- 세션을 연결하는 시점에 복제본 연결이 실패하면(풀 체크아웃 타임아웃 포함) 해당 복제본을 제외하고
+  primary로 대체합니다.
+- 메트릭은 스레드 풀 / 상태 확인 스레드에서도 기록하므로 _metrics_lock으로 직렬화합니다.
+- Read-your-writes: 쓰기 요청이 성공하면 ReadYourWritesMiddleware가 짧은 수명의 쿠키를
+  설정하고, 쿠키가 남아 있는 동안 해당 클라이언트의 읽기는 primary에서 처리합니다.
+  읽기 세션(get_read_db)만 사용하는 POST(예: POST /batch)는 쓰기로 보지 않습니다.
+  쿠키를 보관하지 않는 API 클라이언트는 X-DB-Primary 요청 헤더로 primary 읽기를 요청합니다.
+"""
+
+import asyncio
+import itertools
+import logging
+import os
+import threading
+from contextvars import ContextVar
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from starlette.datastructures import MutableHeaders
+from starlette.requests import cookie_parser
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import get_settings
+from app.core.database import (
+    REPLICA_SESSION_INFO,
+    AsyncSessionLocal,
+    SessionLocal,
+    get_async_db,
+    get_db,
+    get_engine_options,
+    to_async_url,
+)
+from app.core.metrics import Counter, Gauge
+from app.core.pool_metrics import instrument_engine
+
+logger = logging.getLogger("app.db.replica")
+settings = get_settings()
+
+READ_YOUR_WRITES_COOKIE = "db_primary"
+# 쿠키 대신 요청마다 primary 읽기를 요청하는 헤더 (값과 관계없이 있으면 적용)
+READ_YOUR_WRITES_HEADER = b"x-db-primary"
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+read_routes = Counter(
+    "db_read_routes_total",
+    "Read sessions by target database and routing reason",
+    ("target", "reason"),
+)
+replica_up = Gauge("db_replica_up", "Replica passed the last health check", ("replica",))
+replica_lag = Gauge(
+    "db_replica_lag_seconds",
+    "Replication lag measured by the last health check",
+    ("replica",),
+)
+
+# PostgreSQL 복제 지연 (primary면 0, 수신한 WAL을 모두 재생했으면 0)
+POSTGRES_LAG_SQL = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() THEN 0
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+END
+"""
+
+# 스레드 풀(get_read_db) / 상태 확인 스레드에서 기록하므로 메트릭 갱신을 직렬화
+_metrics_lock = threading.Lock()
+
+_prefer_primary: ContextVar[bool] = ContextVar("prefer_primary", default=False)
+
+
+def measure_replication_lag(conn: Connection) -> float | None:
+    """
+    복제 지연 측정
+
+    Args:
+        conn: 복제본 커넥션
+
+    Returns:
+        지연 시간(초), 복제가 멈춘 경우 None (복제 상태를 알 수 없는 DB는 연결 확인 후 0)
+    """
+    dialect = conn.dialect.name
+    if dialect == "postgresql":
+        return float(conn.execute(text(POSTGRES_LAG_SQL)).scalar())
+    if dialect in ("mysql", "mariadb"):
+        row = conn.execute(text("SHOW REPLICA STATUS")).mappings().first()
+        if row is None:
+            return 0.0
+        lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+        return float(lag) if lag is not None else None
+    conn.execute(text("SELECT 1"))
+    return 0.0
+
+
+class Replica:
+    """복제본 엔진과 마지막 상태 확인 결과"""
+
+    __slots__ = ("name", "engine", "async_engine", "healthy", "lag")
+
+    def __init__(
+        self, name: str, engine: Engine, async_engine: AsyncEngine | None = None
+    ):
+        self.name = name
+        self.engine = engine
+        self.async_engine = async_engine
+        self.healthy = True  # 첫 상태 확인 전에는 사용 가능으로 간주 (연결 실패 시 대체)
+        self.lag: float | None = None
+
+
+class ReplicaSet:
+    """복제본 목록과 라운드 로빈 선택"""
+
+    def __init__(self, replicas: list[Replica], max_lag: float = 5.0):
+        self.replicas = replicas
+        self.max_lag = max_lag
+        self._next = itertools.cycle(range(len(replicas))) if replicas else None
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def choose(self) -> Replica | None:
+        """
+        다음 정상 복제본 선택
+
+        Returns:
+            복제본 (정상 복제본이 없으면 None)
+        """
+        if self._next is None:
+            return None
+        with self._lock:
+            for _ in range(len(self.replicas)):
+                replica = self.replicas[next(self._next)]
+                if replica.healthy:
+                    return replica
+        return None
+
+    def mark_down(self, replica: Replica, reason: str) -> None:
+        """복제본을 다음 상태 확인까지 제외"""
+        if replica.healthy:
+            logger.warning("replica %s marked down: %s", replica.name, reason)
+        replica.healthy = False
+        with _metrics_lock:
+            replica_up.labels(replica.name).set(0)
+
+    def check(self, replica: Replica) -> None:
+        """복제본 하나의 연결 / 복제 지연 확인"""
+        try:
+            with replica.engine.connect() as conn:
+                lag = measure_replication_lag(conn)
+        except DBAPIError as e:
+            self.mark_down(replica, f"health check failed: {e.orig}")
+            return
+        except Exception as e:
+            # 풀 체크아웃 타임아웃, 드라이버 외 오류 등도 복제본을 제외하고 다음 복제본 확인
+            logger.exception("replica %s health check error", replica.name)
+            self.mark_down(replica, f"health check failed: {e!r}")
+            return
+
+        replica.lag = lag
+        with _metrics_lock:
+            replica_lag.labels(replica.name).set(lag if lag is not None else float("inf"))
+        if lag is None or lag > self.max_lag:
+            self.mark_down(replica, f"replication lag {lag}s exceeds {self.max_lag}s")
+            return
+        if not replica.healthy:
+            logger.info("replica %s is back (lag %.1fs)", replica.name, lag)
+        replica.healthy = True
+        with _metrics_lock:
+            replica_up.labels(replica.name).set(1)
+
+    def refresh(self) -> None:
+        """모든 복제본 상태 확인"""
+        for replica in self.replicas:
+            self.check(replica)
+
+    def status(self) -> list[dict]:
+        """복제본별 마지막 상태 확인 결과"""
+        return [
+            {"name": replica.name, "healthy": replica.healthy, "lag_seconds": replica.lag}
+            for replica in self.replicas
+        ]
+
+    def dispose_pools_after_fork(self) -> None:
+        """fork된 자식 프로세스에서 복제본 커넥션 풀 재생성 (close=False, 부모 커넥션 유지)"""
+        for replica in self.replicas:
+            replica.engine.dispose(close=False)
+            if replica.async_engine is not None:
+                replica.async_engine.sync_engine.dispose(close=False)
+
+
+def parse_replica_urls(value: str) -> list[str]:
+    """쉼표로 구분한 복제본 URL 목록 파싱"""
+    return [url.strip() for url in value.split(",") if url.strip()]
+
+
+def create_replica_set() -> ReplicaSet:
+    """Settings의 DB_REPLICA_URLS로 복제본 엔진 생성 (async 엔진은 DB_ASYNC=True일 때만)"""
+    replicas = []
+    for index, url in enumerate(parse_replica_urls(settings.DB_REPLICA_URLS), start=1):
+        name = f"replica_{index}"
+        engine = create_engine(url, **get_engine_options(url, name))
+        instrument_engine(engine, name)
+        async_engine = None
+        if settings.DB_ASYNC:
+            async_url = to_async_url(url)
+            async_engine = create_async_engine(
+                async_url,
+                **get_engine_options(async_url, f"{name}_async", is_async=True),
+            )
+            instrument_engine(async_engine.sync_engine, f"{name}_async")
+        replicas.append(Replica(name, engine, async_engine))
+    return ReplicaSet(replicas, settings.DB_REPLICA_MAX_LAG_SECONDS)
+
+
+replica_set = create_replica_set()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=replica_set.dispose_pools_after_fork)
+
+# 복제본 세션 팩토리 (세션마다 선택한 복제본 엔진을 bind로 전달)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False)
+AsyncReadSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
+
+
+def _route_read() -> tuple[Replica | None, str]:
+    """읽기 요청을 처리할 복제본과 라우팅 사유 (복제본이 None이면 primary)"""
+    if not replica_set:
+        return None, "no_replicas"
+    if _prefer_primary.get():
+        return None, "read_your_writes"
+    replica = replica_set.choose()
+    if replica is None:
+        return None, "replicas_unavailable"
+    return replica, "replica"
+
+
+def _connection_error(error: SQLAlchemyError) -> object:
+    """복제본 연결 실패 사유 (DBAPI 오류면 드라이버 예외)"""
+    return error.orig if isinstance(error, DBAPIError) else error
+
+
+def get_read_db():
+    """
+    읽기 전용 데이터베이스 세션 의존성
+
+    정상 복제본이 있으면 복제본 세션을, 없거나 read-your-writes 기간이면 primary 세션을
+    반환합니다. 복제본 커넥션을 미리 확보해 연결 / 풀 체크아웃이 실패하면 primary로 대체합니다.
+
+    Yields:
+        Session: 데이터베이스 세션
+    """
+    replica, reason = _route_read()
+    db = None
+    if replica is not None:
+        db = ReadSessionLocal(
+            bind=replica.engine, info={REPLICA_SESSION_INFO: replica.name}
+        )
+        try:
+            db.connection()
+        except SQLAlchemyError as e:
+            db.close()
+            db = None
+            replica_set.mark_down(replica, f"connection failed: {_connection_error(e)}")
+            reason = "replica_failed"
+
+    with _metrics_lock:
+        read_routes.labels(replica.name if db is not None else "primary", reason).inc()
+    db = db or SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db():
+    """
+    읽기 전용 async 데이터베이스 세션 의존성 (get_read_db와 동일한 라우팅)
+
+    Yields:
+        AsyncSession: async 데이터베이스 세션
+    """
+    replica, reason = _route_read()
+    db = None
+    if replica is not None and replica.async_engine is not None:
+        db = AsyncReadSessionLocal(
+            bind=replica.async_engine, info={REPLICA_SESSION_INFO: replica.name}
+        )
+        try:
+            await db.connection()
+        except SQLAlchemyError as e:
+            await db.close()
+            db = None
+            replica_set.mark_down(replica, f"connection failed: {_connection_error(e)}")
+            reason = "replica_failed"
+
+    with _metrics_lock:
+        read_routes.labels(replica.name if db is not None else "primary", reason).inc()
+    db = db or AsyncSessionLocal()
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+# 읽기 전용 라우트 판별용 세션 의존성 (uses_read_session)
+READ_SESSION_DEPENDENCIES = {get_read_db, get_async_read_db}
+WRITE_SESSION_DEPENDENCIES = {get_db, get_async_db}
+
+
+async def run_replica_health_checks(interval: float) -> None:
+    """
+    복제본 상태를 주기적으로 확인 (lifespan에서 백그라운드 작업으로 실행)
+
+    확인은 스레드에서 실행하므로 이벤트 루프를 막지 않고, 요청 경로에서는
+    마지막 확인 결과만 읽습니다. 한 번의 확인이 실패해도 작업은 계속 실행됩니다.
+
+    Args:
+        interval: 확인 주기 (초)
+    """
+    while True:
+        try:
+            await asyncio.to_thread(replica_set.refresh)
+        except Exception:
+            logger.exception("replica health check round failed")
+        await asyncio.sleep(interval)
+
+
+def uses_read_session(route: object) -> bool:
+    """
+    라우트가 읽기 세션(get_read_db / get_async_read_db)만 사용하는지 여부
+
+    쓰기 세션(get_db 등)을 함께 사용하지 않는 라우트는 메서드가 POST여도 읽기 전용입니다.
+    """
+    dependant = getattr(route, "dependant", None)
+    if dependant is None:
+        return False
+    calls = set()
+    stack = [dependant]
+    while stack:
+        current = stack.pop()
+        calls.add(current.call)
+        stack.extend(current.dependencies)
+    return bool(calls & READ_SESSION_DEPENDENCIES) and not (calls & WRITE_SESSION_DEPENDENCIES)
+
+
+class ReadYourWritesMiddleware:
+    """
+    쓰기 직후 같은 클라이언트의 읽기를 primary로 보내는 ASGI 미들웨어
+
+    성공한 쓰기 요청(GET/HEAD/OPTIONS 외, 상태 코드 400 미만, 읽기 전용 라우트 제외)의 응답에
+    window초 동안 유효한 쿠키를 설정하고, 쿠키 또는 X-DB-Primary 헤더가 있는 요청은
+    get_read_db가 primary 세션을 사용하도록 표시합니다.
+    """
+
+    def __init__(self, app: ASGIApp, window: float = 5.0):
+        self.app = app
+        self.cookie = (
+            f"{READ_YOUR_WRITES_COOKIE}=1; Max-Age={max(int(window), 1)}; "
+            "Path=/; HttpOnly; SameSite=Lax"
+        )
+        self._read_only: dict[int, bool] = {}  # id(route) → 읽기 전용 여부
+
+    def _is_read_only(self, route: object) -> bool:
+        key = id(route)
+        read_only = self._read_only.get(key)
+        if read_only is None:
+            read_only = self._read_only[key] = uses_read_session(route)
+        return read_only
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        prefer_primary = False
+        for key, value in scope["headers"]:
+            if key == READ_YOUR_WRITES_HEADER:
+                prefer_primary = True
+            elif key == b"cookie" and READ_YOUR_WRITES_COOKIE in cookie_parser(
+                value.decode("latin-1")
+            ):
+                prefer_primary = True
+        token = _prefer_primary.set(prefer_primary)
+        is_write = scope["method"] not in SAFE_METHODS
+
+        async def send_wrapper(message: Message) -> None:
+            if (
+                is_write
+                and message["type"] == "http.response.start"
+                and message["status"] < 400
+                and not self._is_read_only(scope.get("route"))
+            ):
+                MutableHeaders(scope=message).append("Set-Cookie", self.cookie)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _prefer_primary.reset(token)
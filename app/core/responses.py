@@ -0,0 +1,45 @@
+"""
+응답 클래스
+
+pydantic 모델을 FastAPI의 response_model 재검증과 jsonable_encoder를 거치지 않고
+pydantic-core로 바로 JSON bytes로 직렬화하는 응답 클래스를 정의합니다.
+
+라우트에서 Response 객체를 반환하면 FastAPI는 response_model 처리를 건너뛰므로,
+response_model은 OpenAPI 문서용으로만 사용됩니다.
+"""
+
+from typing import Any
+
+from pydantic import TypeAdapter
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+
+
+class PydanticJSONResponse(Response):
+    """pydantic 모델(또는 TypeAdapter로 직렬화할 값)을 JSON으로 반환하는 응답"""
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+        adapter: TypeAdapter | None = None,
+        background: BackgroundTask | None = None,
+    ):
+        """
+        Args:
+            content: pydantic 모델, 또는 adapter로 직렬화할 값 (예: 모델 리스트)
+            status_code: HTTP 상태 코드
+            headers: 추가 응답 헤더
+            adapter: 모델이 아닌 값을 직렬화할 TypeAdapter
+            background: 응답 후 실행할 작업
+        """
+        self.adapter = adapter
+        super().__init__(content, status_code, headers, background=background)
+
+    def render(self, content: Any) -> bytes:
+        if self.adapter is not None:
+            return self.adapter.dump_json(content)
+        return content.__pydantic_serializer__.to_json(content)
@@ -0,0 +1,77 @@
+"""
+워커 수 / 커넥션 풀 크기 계산
+
+gunicorn 설정(gunicorn.conf.py)과 DB 엔진 생성이 같은 계산을 사용하므로
+워커 수와 워커별 커넥션 풀 크기가 항상 일치합니다.
+"""
+
+import os
+
+from app.core.config import Settings, get_settings
+
+
+def available_cpus() -> int:
+    """현재 프로세스가 사용할 수 있는 CPU 수 (CPU affinity / 컨테이너 cpuset 반영)"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def get_worker_count(settings: Settings | None = None) -> int:
+    """
+    워커 프로세스 수
+
+    async 워커는 한 프로세스가 여러 요청을 동시에 처리하므로 CPU당 하나를 기본값으로 사용합니다.
+
+    Args:
+        settings: 설정 (None이면 get_settings())
+
+    Returns:
+        WEB_CONCURRENCY, 지정하지 않았으면 사용 가능한 CPU 수
+    """
+    settings = settings or get_settings()
+    return settings.WEB_CONCURRENCY if settings.WEB_CONCURRENCY > 0 else available_cpus()
+
+
+def get_pool_limits(
+    settings: Settings | None = None, workers: int | None = None
+) -> tuple[int, int]:
+    """
+    워커별 커넥션 풀 크기
+
+    DB_MAX_CONNECTIONS가 지정되면 이를 워커 수로 나눈 값을 넘지 않도록
+    pool_size를 먼저 채우고 남은 만큼만 max_overflow로 허용합니다.
+
+    Args:
+        settings: 설정 (None이면 get_settings())
+        workers: 워커 수 (None이면 get_worker_count())
+
+    Returns:
+        (pool_size, max_overflow)
+    """
+    settings = settings or get_settings()
+    if settings.DB_MAX_CONNECTIONS <= 0:
+        return settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW
+
+    workers = workers or get_worker_count(settings)
+    per_worker = max(settings.DB_MAX_CONNECTIONS // workers, 1)
+    pool_size = min(settings.DB_POOL_SIZE, per_worker)
+    max_overflow = min(settings.DB_MAX_OVERFLOW, per_worker - pool_size)
+    return pool_size, max_overflow
+
+
+def get_concurrency_limit(settings: Settings | None = None) -> int:
+    """
+    워커별 최대 동시 처리 요청 수 (수락 제어 한도의 상한)
+
+    Args:
+        settings: 설정 (None이면 get_settings())
+
+    Returns:
+        ADMISSION_MAX_CONCURRENCY, 지정하지 않았으면 워커별 커넥션 수(pool_size + max_overflow)의 2배
+    """
+    settings = settings or get_settings()
+    if settings.ADMISSION_MAX_CONCURRENCY > 0:
+        return settings.ADMISSION_MAX_CONCURRENCY
+    pool_size, max_overflow = get_pool_limits(settings)
+    return max(2 * (pool_size + max_overflow), 1)
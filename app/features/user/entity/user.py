@@ -4,7 +4,7 @@ User 엔티티 정의
 사용자의 기본 정보를 저장하는 ORM 모델입니다.
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import DDL, Column, Integer, String, Boolean, DateTime, Index, event
 from sqlalchemy.sql import func
 from app.core.database import Base
 
@@ -13,6 +13,14 @@ class User(Base):
     """사용자 엔티티"""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # 목록 정렬 키 + 동순위 정렬(id) 키셋 페이지네이션용
+        Index("ix_users_created_at_id", "created_at", "id"),
+        Index("ix_users_name_id", "name", "id"),
+        # 활성화 상태 필터 + 정렬 / 나이 범위
+        Index("ix_users_is_active_created_at_id", "is_active", "created_at", "id"),
+        Index("ix_users_is_active_age", "is_active", "age"),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     email = Column(String(255), unique=True, index=True, nullable=False)
@@ -31,3 +39,39 @@ class User(Base):
 
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email}, name={self.name})>"
+
+
+# 이름/이메일 검색용 인덱스 (이메일은 소문자로 저장하므로 컬럼 그대로 사용)
+# - PostgreSQL: pg_trgm GIN 인덱스 (부분 일치 / 유사도 검색),
+#   text_pattern_ops B-tree 인덱스 (짧은 검색어의 LIKE 접두사 검색)
+# - 그 외: lower(name) 표현식 인덱스 (접두사 범위 검색)
+event.listen(
+    User.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+Index(
+    "ix_users_email_trgm",
+    User.email,
+    postgresql_using="gin",
+    postgresql_ops={"email": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+Index(
+    "ix_users_name_lower_trgm",
+    func.lower(User.name).label("name_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"name_lower": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+Index(
+    "ix_users_email_pattern",
+    User.email,
+    postgresql_ops={"email": "text_pattern_ops"},
+).ddl_if(dialect="postgresql")
+Index(
+    "ix_users_name_lower_pattern",
+    func.lower(User.name).label("name_lower"),
+    postgresql_ops={"name_lower": "text_pattern_ops"},
+).ddl_if(dialect="postgresql")
+Index("ix_users_name_lower", func.lower(User.name)).ddl_if(
+    dialect=("sqlite", "mysql", "mariadb")
+)
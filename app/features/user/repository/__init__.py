@@ -1,3 +1,4 @@
 from app.features.user.repository.user_repository import UserRepository
+from app.features.user.repository.user_async_repository import AsyncUserRepository
 
-__all__ = ["UserRepository"]
+__all__ = ["UserRepository", "AsyncUserRepository"]
@@ -0,0 +1,310 @@
+"""
+User Async Repository
+
+AsyncSession 기반으로 데이터베이스 CRUD 작업을 담당하는 Repository 계층입니다.
+UserRepository와 동일한 동작을 await 가능한 형태로 제공합니다.
+"""
+
+from typing import Any
+
+from sqlalchemy import Row, delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import is_unique_violation
+from app.features.user.entity import User
+from app.features.user.repository.user_repository import (
+    build_count_query,
+    build_list_query,
+    explain_rows_sql,
+    insert_ignoring_duplicates,
+    parse_explain_rows,
+)
+from app.features.user.schema import UserCreate, UserUpdate, UserListFilter, UserSort
+
+
+class AsyncUserRepository:
+    """사용자 데이터 접근 계층 (async)"""
+
+    @staticmethod
+    async def create(db: AsyncSession, user_data: UserCreate) -> User:
+        """
+        사용자 생성
+
+        INSERT ... RETURNING 한 번으로 생성된 행(서버 기본값 포함)을 받습니다.
+
+        Args:
+            db: async 데이터베이스 세션
+            user_data: 사용자 생성 데이터
+
+        Returns:
+            생성된 User 엔티티
+
+        Raises:
+            IntegrityError: 이메일 중복 등 제약 조건 위반 (롤백 후 전파)
+        """
+        values = {
+            "email": user_data.email.lower(),  # 이메일 소문자 정규화
+            "name": user_data.name,
+            "age": user_data.age,
+            "is_active": user_data.is_active,
+        }
+        try:
+            if db.get_bind().dialect.insert_returning:
+                db_user = await db.scalar(insert(User).values(**values).returning(User))
+            else:
+                db_user = User(**values)
+                db.add(db_user)
+                await db.flush()
+                await db.refresh(db_user)
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            raise
+        return db_user
+
+    @staticmethod
+    async def create_many(db: AsyncSession, rows: list[dict]) -> dict[str, User]:
+        """
+        여러 사용자를 한 트랜잭션으로 생성 (그룹 커밋, UserRepository.create_many 참고)
+
+        Args:
+            db: async 데이터베이스 세션
+            rows: 삽입할 행 (email은 소문자로 정규화되어 있고 서로 달라야 함)
+
+        Returns:
+            실제로 삽입된 행의 {email: User} 매핑
+
+        Raises:
+            IntegrityError: 이메일 중복 외의 제약 조건 위반 (롤백 후 전파)
+        """
+        if not rows:
+            return {}
+
+        dialect = db.get_bind().dialect
+        stmt = insert_ignoring_duplicates(dialect)
+        try:
+            if stmt is not None and dialect.insert_returning:
+                result = await db.scalars(stmt.returning(User), rows)
+                created = {user.email: user for user in result}
+            else:
+                created = {}
+                for row in rows:
+                    db_user = User(**row)
+                    try:
+                        async with db.begin_nested():
+                            db.add(db_user)
+                    except IntegrityError as e:
+                        if not is_unique_violation(e):
+                            raise
+                        continue
+                    created[db_user.email] = db_user
+                for db_user in created.values():
+                    await db.refresh(db_user)
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            raise
+        return created
+
+    @staticmethod
+    async def get_by_id(db: AsyncSession, user_id: int) -> User | None:
+        """
+        ID로 사용자 조회
+
+        Args:
+            db: async 데이터베이스 세션
+            user_id: 사용자 ID
+
+        Returns:
+            User 엔티티 또는 None
+        """
+        return await db.scalar(select(User).where(User.id == user_id))
+
+    @staticmethod
+    async def get_by_email(db: AsyncSession, email: str) -> User | None:
+        """
+        이메일로 사용자 조회
+
+        Args:
+            db: async 데이터베이스 세션
+            email: 사용자 이메일
+
+        Returns:
+            User 엔티티 또는 None
+        """
+        return await db.scalar(select(User).where(User.email == email.lower()))
+
+    @staticmethod
+    async def get_etag_fields(
+        db: AsyncSession, user_id: int, for_update: bool = False
+    ) -> Row | None:
+        """
+        ETag 계산에 필요한 컬럼만 조회 (엔티티를 만들지 않음)
+
+        Args:
+            db: async 데이터베이스 세션
+            user_id: 사용자 ID
+            for_update: True면 행 잠금 (SELECT ... FOR UPDATE, 같은 트랜잭션의 수정/삭제 전 검증용)
+
+        Returns:
+            응답 필드 Row 또는 None (사용자가 없으면)
+        """
+        stmt = select(
+            User.id,
+            User.email,
+            User.name,
+            User.age,
+            User.is_active,
+            User.created_at,
+            User.updated_at,
+        ).where(User.id == user_id)
+        if for_update:
+            stmt = stmt.with_for_update()
+        return (await db.execute(stmt)).first()
+
+    @staticmethod
+    async def get_all(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        filters: UserListFilter | None = None,
+        sort: UserSort = "id",
+    ) -> list[User]:
+        """
+        사용자 목록 조회
+
+        Args:
+            db: async 데이터베이스 세션
+            skip: 건너뛸 항목 수
+            limit: 조회할 최대 항목 수
+            filters: 목록 필터
+            sort: 정렬 키
+
+        Returns:
+            User 엔티티 리스트
+        """
+        stmt = build_list_query(filters, sort).offset(skip).limit(limit)
+        return list(await db.scalars(stmt))
+
+    @staticmethod
+    async def get_page_after(
+        db: AsyncSession,
+        after: tuple[Any, int] | None,
+        limit: int,
+        filters: UserListFilter | None = None,
+        sort: UserSort = "id",
+    ) -> list[User]:
+        """
+        키셋 페이지네이션 사용자 목록 조회
+
+        Args:
+            db: async 데이터베이스 세션
+            after: 이전 페이지 마지막 행의 (정렬 키 값, id) (첫 페이지면 None)
+            limit: 조회할 최대 항목 수
+            filters: 목록 필터
+            sort: 정렬 키
+
+        Returns:
+            정렬 순서의 User 엔티티 리스트
+        """
+        stmt = build_list_query(filters, sort, after).limit(limit)
+        return list(await db.scalars(stmt))
+
+    @staticmethod
+    async def count(db: AsyncSession, filters: UserListFilter | None = None) -> int:
+        """
+        필터에 해당하는 사용자 수 조회 (COUNT(*))
+
+        Args:
+            db: async 데이터베이스 세션
+            filters: 목록 필터
+
+        Returns:
+            사용자 수
+        """
+        return await db.scalar(build_count_query(filters))
+
+    @staticmethod
+    async def estimate_count(
+        db: AsyncSession, filters: UserListFilter | None = None
+    ) -> int | None:
+        """
+        필터에 해당하는 사용자 수 추정 (PostgreSQL 플래너 통계)
+
+        Args:
+            db: async 데이터베이스 세션
+            filters: 목록 필터
+
+        Returns:
+            예상 행 수 (PostgreSQL이 아니면 None)
+        """
+        dialect = db.get_bind().dialect
+        if dialect.name != "postgresql":
+            return None
+        sql, params = explain_rows_sql(filters, dialect)
+        connection = await db.connection()
+        plan = (await connection.exec_driver_sql(sql, params)).scalar()
+        return parse_explain_rows(plan)
+
+    @staticmethod
+    async def update(
+        db: AsyncSession, user_id: int, user_data: UserUpdate
+    ) -> User | None:
+        """
+        사용자 정보 수정
+
+        UPDATE ... RETURNING 한 번으로 수정된 행을 받습니다.
+
+        Args:
+            db: async 데이터베이스 세션
+            user_id: 사용자 ID
+            user_data: 수정할 데이터
+
+        Returns:
+            수정된 User 엔티티 또는 None
+
+        Raises:
+            IntegrityError: 이메일 중복 등 제약 조건 위반 (롤백 후 전파)
+        """
+        # 제공된 필드만 업데이트
+        update_data = user_data.model_dump(exclude_unset=True)
+        if "email" in update_data:
+            update_data["email"] = update_data["email"].lower()  # 이메일 소문자 정규화
+
+        if not update_data:
+            return await db.scalar(select(User).where(User.id == user_id))
+
+        stmt = update(User).where(User.id == user_id).values(**update_data)
+        try:
+            if db.get_bind().dialect.update_returning:
+                db_user = await db.scalar(stmt.returning(User))
+            else:
+                await db.execute(stmt)
+                db_user = await db.scalar(select(User).where(User.id == user_id))
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            raise
+        return db_user
+
+    @staticmethod
+    async def delete(db: AsyncSession, user_id: int) -> bool:
+        """
+        사용자 삭제
+
+        DELETE ... RETURNING 한 번으로 삭제 여부를 확인합니다.
+
+        Args:
+            db: async 데이터베이스 세션
+            user_id: 사용자 ID
+
+        Returns:
+            삭제 성공 여부
+        """
+        stmt = delete(User).where(User.id == user_id)
+        if db.get_bind().dialect.delete_returning:
+            deleted = await db.scalar(stmt.returning(User.id)) is not None
+        else:
+            deleted = (await db.execute(stmt)).rowcount > 0
+        await db.commit()
+        return deleted
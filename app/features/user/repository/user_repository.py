@@ -4,9 +4,314 @@ User Repository
 데이터베이스 CRUD 작업을 담당하는 Repository 계층입니다.
 """
 
+import json
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    Delete,
+    Insert,
+    Integer,
+    Row,
+    Select,
+    Update,
+    any_,
+    bindparam,
+    case,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.engine import Dialect
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
+from app.core.database import is_unique_violation
+from app.core.query_stats import EXPECTED_REPEAT_OPTION
 from app.features.user.entity import User
-from app.features.user.schema import UserCreate, UserUpdate
+from app.features.user.schema import UserCreate, UserUpdate, UserListFilter, UserSort
+
+# 정렬 키 → 컬럼 (NULL이 없는 컬럼만 허용, 동순위는 id로 정렬)
+SORT_COLUMNS = {"id": User.id, "created_at": User.created_at, "name": User.name}
+
+
+def filter_conditions(filters: UserListFilter | None) -> list[ColumnElement[bool]]:
+    """
+    목록 필터를 WHERE 조건 목록으로 변환
+
+    Args:
+        filters: 목록 필터 (None이면 조건 없음)
+
+    Returns:
+        WHERE 조건 목록
+    """
+    if filters is None:
+        return []
+    conditions = []
+    if filters.is_active is not None:
+        conditions.append(User.is_active == filters.is_active)
+    if filters.min_age is not None:
+        conditions.append(User.age >= filters.min_age)
+    if filters.max_age is not None:
+        conditions.append(User.age <= filters.max_age)
+    if filters.created_from is not None:
+        conditions.append(User.created_at >= filters.created_from)
+    if filters.created_to is not None:
+        conditions.append(User.created_at < filters.created_to)
+    return conditions
+
+
+def id_in_condition(
+    user_ids: Sequence[int], dialect_name: str, name: str = "user_ids"
+) -> ColumnElement[bool]:
+    """
+    ID 목록 조건 생성
+
+    PostgreSQL은 배열 파라미터 하나로 바인딩하는 = ANY(...)를 사용해 ID 개수가 달라도
+    같은 SQL 문장을 재사용합니다. 그 외 DB는 IN을 사용합니다.
+
+    Args:
+        user_ids: 사용자 ID 목록
+        dialect_name: DB 방언 이름
+        name: 바인드 파라미터 이름 (한 문장에 ID 목록 조건이 여러 개면 서로 달라야 함)
+    """
+    if dialect_name == "postgresql":
+        return User.id == any_(
+            bindparam(name, list(user_ids), type_=postgresql.ARRAY(Integer))
+        )
+    return User.id.in_(user_ids)
+
+
+def build_list_query(
+    filters: UserListFilter | None = None,
+    sort: UserSort = "id",
+    after: tuple[Any, int] | None = None,
+) -> Select:
+    """
+    필터 / 정렬 / 키셋 조건을 적용한 목록 조회 쿼리 생성
+
+    정렬 키가 id가 아니면 (정렬 키, id) 행 값 비교로 다음 페이지를 찾으므로
+    같은 순서의 복합 인덱스(ix_users_created_at_id 등)를 그대로 따라 읽습니다.
+
+    Args:
+        filters: 목록 필터
+        sort: 정렬 키 ("-" 접두사는 내림차순)
+        after: 이전 페이지 마지막 행의 (정렬 키 값, id) (첫 페이지 / offset 방식이면 None)
+
+    Returns:
+        SELECT 쿼리 (LIMIT / OFFSET 미적용)
+    """
+    descending = sort.startswith("-")
+    column = SORT_COLUMNS[sort.lstrip("-")]
+    keys = [User.id] if column is User.id else [column, User.id]
+
+    stmt = select(User).where(*filter_conditions(filters))
+    if after is not None:
+        value, last_id = after
+        if column is User.id:
+            key, bound = User.id, last_id
+        else:
+            key, bound = tuple_(column, User.id), tuple_(value, last_id)
+        stmt = stmt.where(key < bound if descending else key > bound)
+    return stmt.order_by(*(key.desc() if descending else key for key in keys))
+
+
+def selection_conditions(
+    dialect_name: str,
+    filters: UserListFilter | None = None,
+    user_ids: Sequence[int] | None = None,
+) -> list[ColumnElement[bool]]:
+    """일괄 수정/삭제 대상 조건 (목록 필터 AND ID 목록)"""
+    conditions = filter_conditions(filters)
+    if user_ids is not None:
+        conditions.append(id_in_condition(user_ids, dialect_name))
+    return conditions
+
+
+def _write_in_chunks(
+    db: Session,
+    stmt: Update | Delete,
+    conditions: list[ColumnElement[bool]],
+    chunk_size: int,
+    returning: bool,
+) -> Iterator[tuple[int, list[int]]]:
+    """
+    UPDATE / DELETE를 ID 키셋 청크로 나눠 실행
+
+    청크마다 대상 ID를 기본 키 순서로 chunk_size개 조회한 뒤, 그 ID 범위에 조건을 다시 적용해
+    UPDATE / DELETE 한 번을 실행하고 커밋합니다. 트랜잭션이 짧아 행 잠금이 오래 유지되지 않고,
+    조회와 실행 사이에 바뀐 행은 조건을 다시 확인하므로 잘못 수정/삭제되지 않습니다.
+    청크를 커밋한 뒤 yield하므로 중간에 실패해도 앞선 청크는 반영된 상태입니다.
+    청크마다 같은 SQL을 반복하므로 N+1 검사에서 제외합니다. (EXPECTED_REPEAT_OPTION)
+
+    Yields:
+        청크별 (영향받은 행 수, 영향받은 ID 목록 (RETURNING 미지원 DB는 청크의 대상 ID 전체))
+    """
+    dialect_name = db.get_bind().dialect.name
+    stmt = stmt.execution_options(
+        synchronize_session=False, **{EXPECTED_REPEAT_OPTION: True}
+    )
+    last_id = None
+    while True:
+        chunk_query = (
+            select(User.id)
+            .where(*conditions)
+            .execution_options(**{EXPECTED_REPEAT_OPTION: True})
+        )
+        if last_id is not None:
+            chunk_query = chunk_query.where(User.id > last_id)
+        chunk_ids = list(db.scalars(chunk_query.order_by(User.id).limit(chunk_size)))
+        if not chunk_ids:
+            db.rollback()
+            return
+
+        chunk_stmt = stmt.where(
+            id_in_condition(chunk_ids, dialect_name, name="chunk_ids"), *conditions
+        )
+        if returning:
+            affected_ids = list(db.scalars(chunk_stmt.returning(User.id)))
+            affected = len(affected_ids)
+        else:
+            affected = db.execute(chunk_stmt).rowcount
+            affected_ids = chunk_ids
+        db.commit()
+        yield affected, affected_ids
+
+        if len(chunk_ids) < chunk_size:
+            return
+        last_id = chunk_ids[-1]
+
+
+def build_count_query(filters: UserListFilter | None = None) -> Select:
+    """필터를 적용한 COUNT(*) 쿼리 생성"""
+    return select(func.count()).select_from(User).where(*filter_conditions(filters))
+
+
+def explain_rows_sql(filters: UserListFilter | None, dialect: Dialect) -> tuple[str, Any]:
+    """
+    PostgreSQL 플래너 예상 행 수 조회용 EXPLAIN SQL 생성
+
+    드라이버 SQL(exec_driver_sql)로 실행할 수 있도록 드라이버 파라미터 형식으로 반환합니다.
+
+    Returns:
+        (EXPLAIN SQL, 드라이버 파라미터)
+    """
+    stmt = select(User.id).where(*filter_conditions(filters))
+    compiled = stmt.compile(dialect=dialect)
+    params = compiled.params
+    if compiled.positional:
+        params = tuple(params[name] for name in compiled.positiontup)
+    return f"EXPLAIN (FORMAT JSON) {compiled}", params
+
+
+def parse_explain_rows(plan: Any) -> int:
+    """EXPLAIN (FORMAT JSON) 결과에서 최상위 노드의 예상 행 수 추출"""
+    if isinstance(plan, (str, bytes)):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def escape_like(value: str, escape: str = "/") -> str:
+    """LIKE 패턴 특수 문자(%, _, 이스케이프 문자) 이스케이프"""
+    for char in (escape, "%", "_"):
+        value = value.replace(char, escape + char)
+    return value
+
+
+def prefix_condition(column: ColumnElement[str], prefix: str) -> ColumnElement[bool]:
+    """
+    접두사 일치 조건을 범위 비교로 생성
+
+    `column >= prefix AND column < (마지막 문자 + 1)` 형태라서 LIKE 최적화 여부와 무관하게
+    일반 B-tree (표현식) 인덱스로 범위 탐색할 수 있습니다.
+    """
+    last = ord(prefix[-1])
+    if last >= 0x10FFFF:
+        return column >= prefix
+    return (column >= prefix) & (column < prefix[:-1] + chr(last + 1))
+
+
+def build_search_query(
+    q: str, limit: int, dialect_name: str, contains_min_length: int = 3
+) -> Select:
+    """
+    이름/이메일 검색 쿼리 생성 (관련도 순)
+
+    정렬 순서: 완전 일치 → 접두사 일치 → 부분 일치 (PostgreSQL은 이어서 trigram 유사도),
+    동순위는 이름, id 순입니다.
+
+    - PostgreSQL: pg_trgm GIN 인덱스로 부분 일치(LIKE '%q%')와 오타를 허용하는 유사도
+      일치(lower(name) % q)를 함께 찾습니다. contains_min_length자 미만 검색어는 trigram이
+      없어 GIN 인덱스가 전체 탐색이 되므로, text_pattern_ops B-tree 인덱스를 쓰는
+      접두사 일치(LIKE 'q%')만 찾습니다.
+    - 그 외: 접두사 일치는 인덱스 범위 탐색으로 찾고, 부분 일치는 인덱스를 쓸 수 없으므로
+      검색어가 contains_min_length자 이상일 때만 포함합니다.
+
+    Args:
+        q: 소문자로 정규화한 검색어
+        limit: 최대 결과 수
+        dialect_name: DB dialect 이름
+        contains_min_length: 부분 일치를 적용할 최소 검색어 길이
+
+    Returns:
+        SELECT 쿼리
+    """
+    name = func.lower(User.name)
+    escaped = escape_like(q)
+    starts = User.email.like(f"{escaped}%", escape="/") | name.like(
+        f"{escaped}%", escape="/"
+    )
+    contains = User.email.like(f"%{escaped}%", escape="/") | name.like(
+        f"%{escaped}%", escape="/"
+    )
+    rank = case(((User.email == q) | (name == q), 0), (starts, 1), else_=2)
+
+    if dialect_name == "postgresql" and len(q) >= contains_min_length:
+        condition = contains | name.op("%")(q)
+        order_by = [
+            rank,
+            func.greatest(func.similarity(User.email, q), func.similarity(name, q)).desc(),
+        ]
+    elif dialect_name == "postgresql":
+        # 범위 비교는 데이터베이스 collation 순서를 따르므로 text_pattern_ops 인덱스로 LIKE 접두사 검색
+        condition = starts
+        order_by = [rank]
+    else:
+        prefix = prefix_condition(User.email, q) | prefix_condition(name, q)
+        condition = contains if len(q) >= contains_min_length else prefix
+        order_by = [rank]
+
+    return (
+        select(User)
+        .where(condition)
+        .order_by(*order_by, User.name, User.id)
+        .limit(limit)
+    )
+
+
+def insert_ignoring_duplicates(dialect: Dialect, target: Any = User) -> Insert | None:
+    """
+    이메일이 이미 존재하는 행을 건너뛰는 INSERT 생성
+
+    Args:
+        dialect: 실행할 DB 방언
+        target: INSERT 대상 (User 엔티티 또는 users 테이블)
+
+    Returns:
+        PostgreSQL/SQLite는 INSERT ... ON CONFLICT (email) DO NOTHING, 그 외 DB는 None
+    """
+    if dialect.name == "postgresql":
+        insert_ = postgresql.insert
+    elif dialect.name == "sqlite":
+        insert_ = sqlite.insert
+    else:
+        return None
+    return insert_(target).on_conflict_do_nothing(index_elements=[User.__table__.c.email])
 
 
 class UserRepository:
@@ -17,22 +322,37 @@ class UserRepository:
         """
         사용자 생성
 
+        INSERT ... RETURNING 한 번으로 생성된 행(서버 기본값 포함)을 받습니다.
+        이메일 중복은 UNIQUE 제약 조건으로 검출되며 IntegrityError가 전파됩니다.
+
         Args:
             db: 데이터베이스 세션
             user_data: 사용자 생성 데이터
 
         Returns:
             생성된 User 엔티티
+
+        Raises:
+            IntegrityError: 이메일 중복 등 제약 조건 위반 (롤백 후 전파)
         """
-        db_user = User(
-            email=user_data.email.lower(),  # 이메일 소문자 정규화
-            name=user_data.name,
-            age=user_data.age,
-            is_active=user_data.is_active,
-        )
-        db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        values = {
+            "email": user_data.email.lower(),  # 이메일 소문자 정규화
+            "name": user_data.name,
+            "age": user_data.age,
+            "is_active": user_data.is_active,
+        }
+        try:
+            if db.get_bind().dialect.insert_returning:
+                db_user = db.scalar(insert(User).values(**values).returning(User))
+            else:
+                db_user = User(**values)
+                db.add(db_user)
+                db.flush()
+                db.refresh(db_user)
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise
         return db_user
 
     @staticmethod
@@ -64,7 +384,187 @@ class UserRepository:
         return db.query(User).filter(User.email == email.lower()).first()
 
     @staticmethod
-    def get_all(db: Session, skip: int = 0, limit: int = 100) -> list[User]:
+    def search(
+        db: Session, q: str, limit: int, contains_min_length: int = 3
+    ) -> list[User]:
+        """
+        이름/이메일 검색 (관련도 순)
+
+        Args:
+            db: 데이터베이스 세션
+            q: 소문자로 정규화한 검색어
+            limit: 최대 결과 수
+            contains_min_length: 부분 일치를 적용할 최소 검색어 길이 (PostgreSQL 외)
+
+        Returns:
+            관련도 순 User 엔티티 리스트
+        """
+        stmt = build_search_query(
+            q, limit, db.get_bind().dialect.name, contains_min_length
+        )
+        return list(db.scalars(stmt))
+
+    @staticmethod
+    def get_etag_fields(
+        db: Session, user_id: int, for_update: bool = False
+    ) -> Row | None:
+        """
+        ETag 계산에 필요한 컬럼만 조회 (엔티티를 만들지 않음)
+
+        Args:
+            db: 데이터베이스 세션
+            user_id: 사용자 ID
+            for_update: True면 행 잠금 (SELECT ... FOR UPDATE, 같은 트랜잭션의 수정/삭제 전 검증용)
+
+        Returns:
+            응답 필드 Row 또는 None (사용자가 없으면)
+        """
+        stmt = select(
+            User.id,
+            User.email,
+            User.name,
+            User.age,
+            User.is_active,
+            User.created_at,
+            User.updated_at,
+        ).where(User.id == user_id)
+        if for_update:
+            stmt = stmt.with_for_update()
+        return db.execute(stmt).first()
+
+    @staticmethod
+    def get_by_ids(db: Session, user_ids: Sequence[int]) -> list[User]:
+        """
+        ID 목록으로 사용자 조회
+
+        한 번의 IN 쿼리로 조회합니다. (PostgreSQL은 배열 파라미터 하나로 바인딩하는
+        = ANY(...)를 사용해 ID 개수가 달라도 같은 SQL 문장을 재사용합니다)
+
+        Args:
+            db: 데이터베이스 세션
+            user_ids: 사용자 ID 목록 (중복 없음)
+
+        Returns:
+            존재하는 User 엔티티 리스트 (순서 보장 없음)
+        """
+        if not user_ids:
+            return []
+        condition = id_in_condition(user_ids, db.get_bind().dialect.name)
+        return list(db.scalars(select(User).where(condition)))
+
+    @staticmethod
+    def get_existing_emails(db: Session, emails: list[str]) -> set[str]:
+        """
+        이미 등록된 이메일 조회
+
+        일괄 생성 시 중복 이메일을 한 번의 쿼리로 찾기 위해 사용합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            emails: 소문자로 정규화된 이메일 목록
+
+        Returns:
+            이미 존재하는 이메일 집합
+        """
+        if not emails:
+            return set()
+        return set(db.scalars(select(User.email).where(User.email.in_(emails))))
+
+    @staticmethod
+    def bulk_create(db: Session, rows: list[dict]) -> dict[str, int]:
+        """
+        사용자 일괄 생성
+
+        다중 행 INSERT(executemany → insertmanyvalues)로 한 번에 삽입하고 커밋합니다.
+        PostgreSQL/SQLite에서는 ON CONFLICT DO NOTHING으로 동시 요청과의 이메일 경합을
+        무시하고, RETURNING으로 실제 삽입된 행의 ID를 받습니다.
+
+        Args:
+            db: 데이터베이스 세션
+            rows: 삽입할 행 (email은 소문자로 정규화되어 있어야 함)
+
+        Returns:
+            실제로 삽입된 행의 {email: id} 매핑
+        """
+        if not rows:
+            return {}
+
+        table = User.__table__
+        dialect = db.get_bind().dialect
+        stmt = insert_ignoring_duplicates(dialect, table)
+        if stmt is None:
+            stmt = insert(table)
+
+        if dialect.insert_returning:
+            result = db.execute(stmt.returning(table.c.id, table.c.email), rows)
+            inserted = {email: user_id for user_id, email in result}
+            db.commit()
+            return inserted
+
+        # RETURNING 미지원 DB (MySQL 등): 삽입 후 ID를 다시 조회
+        db.execute(stmt, rows)
+        db.commit()
+        emails = [row["email"] for row in rows]
+        result = db.execute(
+            select(table.c.email, table.c.id).where(table.c.email.in_(emails))
+        )
+        return dict(result.tuples())
+
+    @staticmethod
+    def create_many(db: Session, rows: list[dict]) -> dict[str, User]:
+        """
+        여러 사용자를 한 트랜잭션으로 생성 (그룹 커밋)
+
+        PostgreSQL/SQLite는 다중 행 INSERT ... ON CONFLICT DO NOTHING RETURNING 한 번으로
+        삽입하고 이미 존재하는 이메일의 행은 건너뜁니다. 그 외 DB는 행마다 SAVEPOINT 안에서
+        삽입해 중복 행만 롤백합니다. 어느 경우든 커밋은 한 번입니다.
+
+        Args:
+            db: 데이터베이스 세션
+            rows: 삽입할 행 (email은 소문자로 정규화되어 있고 서로 달라야 함)
+
+        Returns:
+            실제로 삽입된 행의 {email: User} 매핑
+
+        Raises:
+            IntegrityError: 이메일 중복 외의 제약 조건 위반 (롤백 후 전파)
+        """
+        if not rows:
+            return {}
+
+        dialect = db.get_bind().dialect
+        stmt = insert_ignoring_duplicates(dialect)
+        try:
+            if stmt is not None and dialect.insert_returning:
+                created = {user.email: user for user in db.scalars(stmt.returning(User), rows)}
+            else:
+                created = {}
+                for row in rows:
+                    db_user = User(**row)
+                    try:
+                        with db.begin_nested():
+                            db.add(db_user)
+                    except IntegrityError as e:
+                        if not is_unique_violation(e):
+                            raise
+                        continue
+                    created[db_user.email] = db_user
+                for db_user in created.values():
+                    db.refresh(db_user)
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise
+        return created
+
+    @staticmethod
+    def get_all(
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        filters: UserListFilter | None = None,
+        sort: UserSort = "id",
+    ) -> list[User]:
         """
         사용자 목록 조회
 
@@ -72,17 +572,112 @@ class UserRepository:
             db: 데이터베이스 세션
             skip: 건너뛸 항목 수
             limit: 조회할 최대 항목 수
+            filters: 목록 필터
+            sort: 정렬 키
 
         Returns:
             User 엔티티 리스트
         """
-        return db.query(User).offset(skip).limit(limit).all()
+        stmt = build_list_query(filters, sort).offset(skip).limit(limit)
+        return list(db.scalars(stmt))
+
+    @staticmethod
+    def get_page_after(
+        db: Session,
+        after: tuple[Any, int] | None,
+        limit: int,
+        filters: UserListFilter | None = None,
+        sort: UserSort = "id",
+    ) -> list[User]:
+        """
+        키셋 페이지네이션 사용자 목록 조회
+
+        OFFSET 대신 (정렬 키, id) 인덱스를 따라 `after` 다음 행부터 탐색하므로
+        페이지 깊이와 무관하게 일정한 비용으로 조회합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            after: 이전 페이지 마지막 행의 (정렬 키 값, id) (첫 페이지면 None)
+            limit: 조회할 최대 항목 수
+            filters: 목록 필터
+            sort: 정렬 키
+
+        Returns:
+            정렬 순서의 User 엔티티 리스트
+        """
+        return list(db.scalars(build_list_query(filters, sort, after).limit(limit)))
+
+    @staticmethod
+    def count(db: Session, filters: UserListFilter | None = None) -> int:
+        """
+        필터에 해당하는 사용자 수 조회 (COUNT(*))
+
+        Args:
+            db: 데이터베이스 세션
+            filters: 목록 필터
+
+        Returns:
+            사용자 수
+        """
+        return db.scalar(build_count_query(filters))
+
+    @staticmethod
+    def estimate_count(db: Session, filters: UserListFilter | None = None) -> int | None:
+        """
+        필터에 해당하는 사용자 수 추정 (PostgreSQL 플래너 통계)
+
+        EXPLAIN만 실행하므로 행을 읽지 않습니다. 통계는 ANALYZE 시점 기준이라
+        정확하지 않을 수 있습니다.
+
+        Args:
+            db: 데이터베이스 세션
+            filters: 목록 필터
+
+        Returns:
+            예상 행 수 (PostgreSQL이 아니면 None)
+        """
+        dialect = db.get_bind().dialect
+        if dialect.name != "postgresql":
+            return None
+        sql, params = explain_rows_sql(filters, dialect)
+        plan = db.connection().exec_driver_sql(sql, params).scalar()
+        return parse_explain_rows(plan)
+
+    @staticmethod
+    def stream_all(db: Session, batch_size: int = 1000) -> Iterator[Sequence[Row]]:
+        """
+        전체 사용자 스트리밍 조회
+
+        ORM 엔티티 대신 컬럼 행을 서버 사이드 커서(yield_per → stream_results)로
+        batch_size 단위로 가져오므로 전체 행 수와 무관하게 메모리 사용량이 일정합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            batch_size: 한 번에 가져올 행 수
+
+        Yields:
+            ID 오름차순 사용자 행 묶음
+        """
+        stmt = select(
+            User.id,
+            User.email,
+            User.name,
+            User.age,
+            User.is_active,
+            User.created_at,
+            User.updated_at,
+        ).order_by(User.id)
+        result = db.execute(stmt, execution_options={"yield_per": batch_size})
+        yield from result.partitions()
 
     @staticmethod
     def update(db: Session, user_id: int, user_data: UserUpdate) -> User | None:
         """
         사용자 정보 수정
 
+        UPDATE ... RETURNING 한 번으로 수정된 행을 받습니다.
+        수정할 필드가 없으면 현재 행을 조회만 합니다.
+
         Args:
             db: 데이터베이스 세션
             user_id: 사용자 ID
@@ -90,28 +685,101 @@ class UserRepository:
 
         Returns:
             수정된 User 엔티티 또는 None
-        """
-        db_user = db.query(User).filter(User.id == user_id).first()
-        if not db_user:
-            return None
 
+        Raises:
+            IntegrityError: 이메일 중복 등 제약 조건 위반 (롤백 후 전파)
+        """
         # 제공된 필드만 업데이트
         update_data = user_data.model_dump(exclude_unset=True)
         if "email" in update_data:
             update_data["email"] = update_data["email"].lower()  # 이메일 소문자 정규화
 
-        for field, value in update_data.items():
-            setattr(db_user, field, value)
+        if not update_data:
+            return db.query(User).filter(User.id == user_id).first()
 
-        db.commit()
-        db.refresh(db_user)
+        stmt = update(User).where(User.id == user_id).values(**update_data)
+        try:
+            if db.get_bind().dialect.update_returning:
+                db_user = db.scalar(stmt.returning(User))
+            else:
+                db.execute(stmt)
+                db_user = db.query(User).filter(User.id == user_id).first()
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise
         return db_user
 
+    @staticmethod
+    def update_in_chunks(
+        db: Session,
+        values: dict[str, Any],
+        filters: UserListFilter | None = None,
+        user_ids: Sequence[int] | None = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[tuple[int, list[int]]]:
+        """
+        조건에 맞는 사용자를 chunk_size개씩 나눠 일괄 수정
+
+        이미 같은 값인 행은 수정하지 않으므로 중간에 중단된 작업을 다시 실행해도 안전합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            values: 수정할 컬럼 값
+            filters: 목록 필터
+            user_ids: 대상 사용자 ID 목록 (None이면 필터만 적용)
+            chunk_size: 트랜잭션 하나로 처리할 최대 행 수
+
+        Yields:
+            청크별 (수정된 행 수, 캐시를 무효화할 사용자 ID 목록)
+        """
+        conditions = selection_conditions(db.get_bind().dialect.name, filters, user_ids)
+        conditions.append(
+            or_(*(getattr(User, key).is_distinct_from(value) for key, value in values.items()))
+        )
+        yield from _write_in_chunks(
+            db,
+            update(User).values(**values),
+            conditions,
+            chunk_size,
+            db.get_bind().dialect.update_returning,
+        )
+
+    @staticmethod
+    def delete_in_chunks(
+        db: Session,
+        filters: UserListFilter | None = None,
+        user_ids: Sequence[int] | None = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[tuple[int, list[int]]]:
+        """
+        조건에 맞는 사용자를 chunk_size개씩 나눠 일괄 삭제
+
+        Args:
+            db: 데이터베이스 세션
+            filters: 목록 필터
+            user_ids: 대상 사용자 ID 목록 (None이면 필터만 적용)
+            chunk_size: 트랜잭션 하나로 처리할 최대 행 수
+
+        Yields:
+            청크별 (삭제된 행 수, 캐시를 무효화할 사용자 ID 목록)
+        """
+        conditions = selection_conditions(db.get_bind().dialect.name, filters, user_ids)
+        yield from _write_in_chunks(
+            db,
+            delete(User),
+            conditions,
+            chunk_size,
+            db.get_bind().dialect.delete_returning,
+        )
+
     @staticmethod
     def delete(db: Session, user_id: int) -> bool:
         """
         사용자 삭제
 
+        DELETE ... RETURNING 한 번으로 삭제 여부를 확인합니다.
+
         Args:
             db: 데이터베이스 세션
             user_id: 사용자 ID
@@ -119,10 +787,10 @@ class UserRepository:
         Returns:
             삭제 성공 여부
         """
-        db_user = db.query(User).filter(User.id == user_id).first()
-        if not db_user:
-            return False
-
-        db.delete(db_user)
+        stmt = delete(User).where(User.id == user_id)
+        if db.get_bind().dialect.delete_returning:
+            deleted = db.scalar(stmt.returning(User.id)) is not None
+        else:
+            deleted = db.execute(stmt).rowcount > 0
         db.commit()
-        return True
+        return deleted
@@ -1,3 +1,4 @@
 from app.features.user.router.user_router import router
+from app.features.user.router.user_async_router import router as async_router
 
-__all__ = ["router"]
+__all__ = ["router", "async_router"]
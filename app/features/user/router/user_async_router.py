@@ -0,0 +1,221 @@
+"""
+User Async Router
+
+DB_ASYNC=True일 때 등록되는 async 사용자 관리 API 엔드포인트입니다.
+
+동기 router보다 먼저 등록되어 동일한 경로의 요청을 가로챕니다.
+`{user_id:int}` 경로 변환기를 사용하므로 정수가 아닌 하위 경로
+(동기 router에만 있는 엔드포인트)는 그대로 동기 router로 전달됩니다.
+"""
+
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache import get_cache
+from app.core.config import get_settings
+from app.core.dependencies import get_async_db, get_async_read_db
+from app.core.etag import etag_matches
+from app.core.idempotency import (
+    IDEMPOTENCY_HEADER,
+    get_idempotency_store,
+    idempotency_scope,
+    request_fingerprint,
+    validate_idempotency_key,
+)
+from app.core.responses import PydanticJSONResponse
+from app.features.user.router.user_query import (
+    CountMode,
+    get_count_mode,
+    get_user_filter,
+    total_count_headers,
+)
+from app.features.user.service import AsyncUserService, user_etag
+from app.features.user.schema import (
+    UserCreate,
+    UserUpdate,
+    UserResponse,
+    UserCursorPage,
+    UserListFilter,
+    UserSort,
+    user_list_adapter,
+)
+
+settings = get_settings()
+router = APIRouter(prefix="/api/v1/users", tags=["users"])
+user_service = AsyncUserService(
+    cache=get_cache("user"),
+    create_batch_window=(
+        settings.USER_CREATE_BATCH_WINDOW_MS / 1000
+        if settings.USER_CREATE_BATCH_ENABLED
+        else None
+    ),
+    create_batch_max_size=settings.USER_CREATE_BATCH_MAX_SIZE,
+)
+
+
+@router.post(
+    "",
+    response_model=UserResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="사용자 생성",
+    description=(
+        "새로운 사용자를 생성합니다. 이메일 중복 검증이 수행됩니다. "
+        "Idempotency-Key 헤더를 보내면 같은 키의 재시도에는 처음 응답을 그대로 반환합니다."
+    ),
+)
+async def create_user(
+    user_data: UserCreate,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    idempotency_key: str | None = Header(
+        None, alias=IDEMPOTENCY_HEADER, description="재시도 식별 키 (1-255자)"
+    ),
+):
+    """
+    사용자 생성 API (async)
+    """
+
+    async def create() -> Response:
+        return PydanticJSONResponse(
+            await user_service.create_user(db, user_data),
+            status_code=status.HTTP_201_CREATED,
+        )
+
+    store = get_idempotency_store()
+    if idempotency_key is None or store is None:
+        return await create()
+    key = validate_idempotency_key(idempotency_key)
+    fingerprint = request_fingerprint(
+        "POST", router.prefix, user_data.model_dump(mode="json")
+    )
+    return await store.run_async(
+        f"{router.prefix}:{idempotency_scope(request)}:{key}",
+        fingerprint,
+        create,
+    )
+
+
+@router.get(
+    "",
+    response_model=list[UserResponse] | UserCursorPage,
+    status_code=status.HTTP_200_OK,
+    summary="사용자 목록 조회",
+    description=(
+        "등록된 사용자 목록을 조회합니다. offset(skip/limit) 페이지네이션과 "
+        "커서 기반 페이지네이션, 필터와 정렬을 지원하며 "
+        "총 개수를 X-Total-Count 헤더로 반환합니다."
+    ),
+)
+async def get_users(
+    skip: int = 0,
+    limit: int = 100,
+    pagination: Literal["offset", "cursor"] = Query(
+        "offset", description="페이지네이션 방식 (offset | cursor)"
+    ),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor"),
+    sort: UserSort = Query(
+        "id", description="정렬 키 (id | created_at | name, 앞에 -를 붙이면 내림차순)"
+    ),
+    filters: UserListFilter = Depends(get_user_filter),
+    count_mode: CountMode = Depends(get_count_mode),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    사용자 목록 조회 API (async)
+    """
+    headers = None
+    if count_mode != "none":
+        total, is_exact = await user_service.count_users(
+            db, filters, count_mode, settings.USER_COUNT_EXACT_THRESHOLD
+        )
+        headers = total_count_headers(total, is_exact)
+
+    if pagination == "cursor" or cursor is not None:
+        return PydanticJSONResponse(
+            await user_service.get_users_page(db, cursor, limit, filters, sort),
+            headers=headers,
+        )
+    return PydanticJSONResponse(
+        await user_service.get_all_users(db, skip, limit, filters, sort),
+        headers=headers,
+        adapter=user_list_adapter,
+    )
+
+
+@router.get(
+    "/{user_id:int}",
+    response_model=UserResponse,
+    status_code=status.HTTP_200_OK,
+    summary="사용자 단건 조회",
+    description=(
+        "특정 사용자의 정보를 조회합니다. 응답에 ETag를 포함하며, "
+        "If-None-Match가 현재 ETag와 일치하면 본문 없이 304를 반환합니다."
+    ),
+    responses={304: {"description": "변경 없음 (If-None-Match 일치)"}},
+)
+async def get_user(
+    user_id: int,
+    if_none_match: str | None = Header(None, description="이전 응답의 ETag"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    사용자 단건 조회 API (async)
+    """
+    if if_none_match is not None:
+        etag = await user_service.get_user_etag(db, user_id)
+        if etag_matches(if_none_match, etag, weak=True):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+
+    user = await user_service.get_user_by_id(db, user_id)
+    return PydanticJSONResponse(
+        user, headers={"ETag": user_etag(user)}
+    )
+
+
+@router.put(
+    "/{user_id:int}",
+    response_model=UserResponse,
+    status_code=status.HTTP_200_OK,
+    summary="사용자 정보 수정",
+    description=(
+        "사용자 정보를 수정합니다. 제공된 필드만 업데이트됩니다. "
+        "If-Match를 지정하면 현재 ETag와 일치할 때만 수정합니다."
+    ),
+    responses={412: {"description": "If-Match 불일치"}},
+)
+async def update_user(
+    user_id: int,
+    user_data: UserUpdate,
+    if_match: str | None = Header(None, description="수정 전 조회한 ETag"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    사용자 정보 수정 API (async)
+    """
+    user = await user_service.update_user(db, user_id, user_data, if_match)
+    return PydanticJSONResponse(
+        user, headers={"ETag": user_etag(user)}
+    )
+
+
+@router.delete(
+    "/{user_id:int}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="사용자 삭제",
+    description=(
+        "사용자를 삭제합니다. If-Match를 지정하면 현재 ETag와 일치할 때만 삭제합니다."
+    ),
+    responses={412: {"description": "If-Match 불일치"}},
+)
+async def delete_user(
+    user_id: int,
+    if_match: str | None = Header(None, description="삭제 전 조회한 ETag"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    사용자 삭제 API (async)
+    """
+    await user_service.delete_user(db, user_id, if_match)
@@ -0,0 +1,77 @@
+"""
+User 목록 조회 파라미터
+
+동기/async router가 공통으로 사용하는 목록 필터, 정렬, 총 개수 관련 의존성입니다.
+"""
+
+from datetime import datetime
+from typing import Literal
+
+from fastapi import HTTPException, Query, status
+from app.core.config import get_settings
+from app.features.user.schema import UserListFilter
+
+settings = get_settings()
+
+CountMode = Literal["exact", "estimate", "none"]
+
+
+def get_user_filter(
+    is_active: bool | None = Query(None, description="활성화 상태"),
+    min_age: int | None = Query(None, ge=0, le=150, description="최소 나이 (이상)"),
+    max_age: int | None = Query(None, ge=0, le=150, description="최대 나이 (이하)"),
+    created_from: datetime | None = Query(None, description="생성 시각 시작 (이상)"),
+    created_to: datetime | None = Query(None, description="생성 시각 끝 (미만)"),
+) -> UserListFilter:
+    """
+    목록 필터 쿼리 파라미터를 UserListFilter로 변환
+
+    Raises:
+        HTTPException: 범위의 시작이 끝보다 크면 400
+    """
+    if min_age is not None and max_age is not None and min_age > max_age:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="min_age must be less than or equal to max_age",
+        )
+    if created_from is not None and created_to is not None and created_from >= created_to:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="created_from must be earlier than created_to",
+        )
+    return UserListFilter(
+        is_active=is_active,
+        min_age=min_age,
+        max_age=max_age,
+        created_from=created_from,
+        created_to=created_to,
+    )
+
+
+def get_count_mode(
+    count: CountMode | None = Query(
+        None,
+        description=(
+            "X-Total-Count 계산 방식 (exact | estimate | none, "
+            "생략 시 USER_LIST_COUNT_MODE, 커서 다음 페이지는 none)"
+        ),
+    ),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor"),
+) -> CountMode:
+    """
+    총 개수 계산 방식
+
+    쿼리 파라미터가 없으면 설정값을 사용하되, 커서로 다음 페이지를 조회할 때는 계산하지 않습니다.
+    커서 페이지는 O(페이지 크기)로 끝나야 하는데 COUNT는 필터에 맞는 행 수에 비례하기 때문입니다.
+    """
+    if count is not None:
+        return count
+    return "none" if cursor is not None else settings.USER_LIST_COUNT_MODE
+
+
+def total_count_headers(total: int, is_exact: bool) -> dict[str, str]:
+    """X-Total-Count 응답 헤더 (추정값이면 X-Total-Count-Estimated 추가)"""
+    headers = {"X-Total-Count": str(total)}
+    if not is_exact:
+        headers["X-Total-Count-Estimated"] = "true"
+    return headers
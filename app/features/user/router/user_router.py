@@ -4,14 +4,114 @@ User Router
 사용자 관리 API 엔드포인트를 정의하는 Router 계층입니다.
 """
 
-from fastapi import APIRouter, Depends, status
+import json
+from typing import Any, Literal
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from app.core.dependencies import get_db
-from app.features.user.service import UserService
-from app.features.user.schema import UserCreate, UserUpdate, UserResponse
+from app.core.config import get_settings
+from app.core.cache import get_cache
+from app.core.dependencies import get_db, get_read_db
+from app.core.etag import etag_matches
+from app.core.idempotency import (
+    IDEMPOTENCY_HEADER,
+    get_idempotency_store,
+    idempotency_scope,
+    request_fingerprint,
+    validate_idempotency_key,
+)
+from app.core.responses import PydanticJSONResponse
+from app.features.user.router.user_query import (
+    CountMode,
+    get_count_mode,
+    get_user_filter,
+    total_count_headers,
+)
+from app.features.user.service import UserService, user_etag
+from app.features.user.schema import (
+    UserCreate,
+    UserUpdate,
+    UserResponse,
+    UserCursorPage,
+    UserListFilter,
+    UserSort,
+    UserBulkResult,
+    UserBulkUpdate,
+    UserBulkWriteResult,
+    UserBatchRequest,
+    UserBatchResult,
+    user_list_adapter,
+)
 
+settings = get_settings()
 router = APIRouter(prefix="/api/v1/users", tags=["users"])
-user_service = UserService()
+user_service = UserService(
+    cache=get_cache("user"),
+    create_batch_window=(
+        settings.USER_CREATE_BATCH_WINDOW_MS / 1000
+        if settings.USER_CREATE_BATCH_ENABLED
+        else None
+    ),
+    create_batch_max_size=settings.USER_CREATE_BATCH_MAX_SIZE,
+)
+
+NDJSON_MEDIA_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl"}
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+# users.id(Integer) 최대값 (PostgreSQL / MySQL INT)
+MAX_USER_ID = 2**31 - 1
+
+
+async def read_bulk_rows(request: Request) -> list[Any]:
+    """
+    일괄 생성 요청 본문 파싱
+
+    JSON 배열 또는 NDJSON(한 줄에 JSON 객체 하나) 본문을 행 목록으로 변환합니다.
+    NDJSON에서 파싱할 수 없는 줄은 원본 문자열로 남겨 행별 검증에서 invalid 처리됩니다.
+
+    Raises:
+        HTTPException: 본문 형식 오류 시 400, 최대 행 수 초과 시 413
+    """
+    body = await request.body()
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+
+    if content_type in NDJSON_MEDIA_TYPES:
+        rows = []
+        for line in body.splitlines():
+            if not line.strip():
+                continue
+            try:
+                rows.append(json.loads(line))
+            except ValueError:
+                rows.append(line.decode("utf-8", errors="replace"))
+    else:
+        try:
+            rows = json.loads(body)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid JSON body"
+            )
+        if not isinstance(rows, list):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Request body must be a JSON array",
+            )
+
+    if len(rows) > settings.USER_BULK_MAX_ROWS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Too many rows (max {settings.USER_BULK_MAX_ROWS})",
+        )
+    return rows
 
 
 @router.post(
@@ -19,9 +119,19 @@ user_service = UserService()
     response_model=UserResponse,
     status_code=status.HTTP_201_CREATED,
     summary="사용자 생성",
-    description="새로운 사용자를 생성합니다. 이메일 중복 검증이 수행됩니다.",
+    description=(
+        "새로운 사용자를 생성합니다. 이메일 중복 검증이 수행됩니다. "
+        "Idempotency-Key 헤더를 보내면 같은 키의 재시도에는 처음 응답을 그대로 반환합니다."
+    ),
 )
-def create_user(user_data: UserCreate, db: Session = Depends(get_db)):
+def create_user(
+    user_data: UserCreate,
+    request: Request,
+    db: Session = Depends(get_db),
+    idempotency_key: str | None = Header(
+        None, alias=IDEMPOTENCY_HEADER, description="재시도 식별 키 (1-255자)"
+    ),
+):
     """
     사용자 생성 API
 
@@ -30,24 +140,362 @@ def create_user(user_data: UserCreate, db: Session = Depends(get_db)):
     - **age**: 나이 (선택, 0-150)
     - **is_active**: 활성화 상태 (기본값: true)
     """
-    return user_service.create_user(db, user_data)
+
+    def create() -> Response:
+        return PydanticJSONResponse(
+            user_service.create_user(db, user_data), status_code=status.HTTP_201_CREATED
+        )
+
+    store = get_idempotency_store()
+    if idempotency_key is None or store is None:
+        return create()
+    key = validate_idempotency_key(idempotency_key)
+    fingerprint = request_fingerprint(
+        "POST", router.prefix, user_data.model_dump(mode="json")
+    )
+    return store.run(
+        f"{router.prefix}:{idempotency_scope(request)}:{key}",
+        fingerprint,
+        create,
+    )
+
+
+@router.post(
+    "/bulk",
+    response_model=UserBulkResult,
+    status_code=status.HTTP_200_OK,
+    summary="사용자 일괄 생성",
+    description=(
+        "JSON 배열 또는 NDJSON 본문으로 여러 사용자를 한 번에 생성합니다. "
+        "행별로 created / duplicate / invalid 결과를 반환합니다."
+    ),
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/UserCreate"},
+                    }
+                },
+                "application/x-ndjson": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+def bulk_create_users(
+    rows: list[Any] = Depends(read_bulk_rows), db: Session = Depends(get_db)
+):
+    """
+    사용자 일괄 생성 API
+
+    - 본문: `UserCreate` 객체의 JSON 배열, 또는 `Content-Type: application/x-ndjson`
+    - 요청 내 중복 및 기존 이메일은 `duplicate`, 검증 실패 행은 `invalid`
+    - 최대 행 수: `USER_BULK_MAX_ROWS`
+    """
+    return PydanticJSONResponse(
+        user_service.bulk_create_users(db, rows, settings.USER_BULK_CHUNK_SIZE)
+    )
 
 
 @router.get(
     "",
-    response_model=list[UserResponse],
+    response_model=list[UserResponse] | UserCursorPage,
     status_code=status.HTTP_200_OK,
     summary="사용자 목록 조회",
-    description="등록된 사용자 목록을 조회합니다. 페이지네이션을 지원합니다.",
+    description=(
+        "등록된 사용자 목록을 조회합니다. offset(skip/limit) 페이지네이션과 "
+        "커서 기반 페이지네이션, 필터와 정렬을 지원하며 "
+        "총 개수를 X-Total-Count 헤더로 반환합니다."
+    ),
 )
-def get_users(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_users(
+    skip: int = 0,
+    limit: int = 100,
+    pagination: Literal["offset", "cursor"] = Query(
+        "offset", description="페이지네이션 방식 (offset | cursor)"
+    ),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor"),
+    sort: UserSort = Query(
+        "id", description="정렬 키 (id | created_at | name, 앞에 -를 붙이면 내림차순)"
+    ),
+    filters: UserListFilter = Depends(get_user_filter),
+    count_mode: CountMode = Depends(get_count_mode),
+    db: Session = Depends(get_read_db),
+):
     """
     사용자 목록 조회 API
 
-    - **skip**: 건너뛸 항목 수 (기본값: 0)
+    - **skip**: 건너뛸 항목 수 (기본값: 0, offset 방식에서만 사용)
     - **limit**: 조회할 최대 항목 수 (기본값: 100)
+    - **pagination**: `cursor`로 지정하면 `{items, next_cursor}` 형태로 응답
+    - **cursor**: 다음 페이지 커서 (지정 시 cursor 방식으로 동작)
+    - **sort**: 정렬 키 (커서는 발급된 sort와 같은 sort로만 사용 가능)
+    - **is_active / min_age / max_age / created_from / created_to**: 목록 필터
+    - **count**: X-Total-Count 계산 방식. `estimate`는 PostgreSQL 플래너 통계를 사용하며
+      추정값이면 `X-Total-Count-Estimated: true`를 함께 반환
+    """
+    headers = None
+    if count_mode != "none":
+        total, is_exact = user_service.count_users(
+            db, filters, count_mode, settings.USER_COUNT_EXACT_THRESHOLD
+        )
+        headers = total_count_headers(total, is_exact)
+
+    if pagination == "cursor" or cursor is not None:
+        return PydanticJSONResponse(
+            user_service.get_users_page(db, cursor, limit, filters, sort),
+            headers=headers,
+        )
+    return PydanticJSONResponse(
+        user_service.get_all_users(db, skip, limit, filters, sort),
+        headers=headers,
+        adapter=user_list_adapter,
+    )
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="사용자 전체 내보내기",
+    description=(
+        "전체 사용자를 NDJSON 또는 CSV로 스트리밍합니다. "
+        "서버 사이드 커서를 사용하므로 행 수와 무관하게 메모리 사용량이 일정합니다."
+    ),
+)
+def export_users(
+    export_format: Literal["ndjson", "csv"] = Query(
+        "ndjson", alias="format", description="출력 형식 (ndjson | csv)"
+    ),
+    db: Session = Depends(get_read_db),
+):
+    """
+    사용자 전체 내보내기 API
+
+    - **format**: `ndjson` (기본값) 또는 `csv`
+    """
+    return StreamingResponse(
+        user_service.export_users(db, export_format, settings.USER_EXPORT_BATCH_SIZE),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="users.{export_format}"'},
+    )
+
+
+def check_batch_size(user_ids: list[int], max_ids: int | None = None) -> list[int]:
+    """
+    ID 수 / 범위 검증
+
+    Args:
+        user_ids: ID 목록
+        max_ids: 최대 ID 수 (None이면 USER_BATCH_MAX_IDS)
+
+    Raises:
+        HTTPException: ID 컬럼 범위(1 ~ MAX_USER_ID)를 벗어난 ID가 있으면 400,
+            최대 ID 수 초과 시 413
+    """
+    if max_ids is None:
+        max_ids = settings.USER_BATCH_MAX_IDS
+    if len(user_ids) > max_ids:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Too many ids (max {max_ids})",
+        )
+    # DB 정수 범위를 넘는 값은 쿼리 파라미터 바인딩에서 실패하므로 미리 거절
+    if any(not 1 <= user_id <= MAX_USER_ID for user_id in user_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid ids"
+        )
+    return user_ids
+
+
+def split_ids(ids: list[str]) -> list[int]:
+    """
+    쉼표 구분 / 반복 ID 쿼리 파라미터 파싱
+
+    Raises:
+        HTTPException: 정수가 아닌 ID가 있거나 비어 있으면 400
+    """
+    try:
+        user_ids = [
+            int(part) for value in ids for part in value.split(",") if part.strip()
+        ]
+    except ValueError:
+        user_ids = []
+    if not user_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid ids"
+        )
+    return user_ids
+
+
+def parse_batch_ids(
+    ids: list[str] = Query(
+        ...,
+        description="사용자 ID 목록 (쉼표 구분 `ids=1,2,3` 또는 반복 `ids=1&ids=2`)",
+    ),
+) -> list[int]:
+    """
+    일괄 조회 쿼리 파라미터 파싱
+
+    Raises:
+        HTTPException: 정수가 아닌 ID가 있거나 비어 있으면 400, 최대 ID 수 초과 시 413
     """
-    return user_service.get_all_users(db, skip, limit)
+    return check_batch_size(split_ids(ids))
+
+
+@router.get(
+    "/batch",
+    response_model=UserBatchResult,
+    status_code=status.HTTP_200_OK,
+    summary="사용자 일괄 조회",
+    description=(
+        "여러 사용자를 ID 목록으로 한 번에 조회합니다. 요청 순서대로 반환하며 "
+        "존재하지 않는 ID는 missing에 담습니다."
+    ),
+)
+def get_users_batch(
+    user_ids: list[int] = Depends(parse_batch_ids), db: Session = Depends(get_read_db)
+):
+    """
+    사용자 일괄 조회 API
+
+    - **ids**: 사용자 ID 목록 (최대 `USER_BATCH_MAX_IDS`개)
+    """
+    return PydanticJSONResponse(user_service.get_users_by_ids(db, user_ids))
+
+
+@router.post(
+    "/batch",
+    response_model=UserBatchResult,
+    status_code=status.HTTP_200_OK,
+    summary="사용자 일괄 조회 (POST)",
+    description="ID 목록이 길어 쿼리 문자열에 담기 어려울 때 본문으로 전달합니다.",
+)
+def post_users_batch(batch: UserBatchRequest, db: Session = Depends(get_read_db)):
+    """
+    사용자 일괄 조회 API (POST)
+
+    - **ids**: 사용자 ID 목록 (최대 `USER_BATCH_MAX_IDS`개)
+    """
+    user_ids = check_batch_size(batch.ids)
+    return PydanticJSONResponse(user_service.get_users_by_ids(db, user_ids))
+
+
+def parse_target_ids(
+    ids: list[str] | None = Query(
+        None,
+        description="대상 사용자 ID 목록 (쉼표 구분 `ids=1,2,3` 또는 반복 `ids=1&ids=2`)",
+    ),
+) -> list[int] | None:
+    """
+    일괄 수정/삭제 대상 ID 파싱 (지정하지 않으면 None)
+
+    Raises:
+        HTTPException: 정수가 아닌 ID가 있으면 400, 최대 ID 수 초과 시 413
+    """
+    if ids is None:
+        return None
+    return check_batch_size(split_ids(ids), settings.USER_BULK_WRITE_MAX_IDS)
+
+
+@router.patch(
+    "",
+    response_model=UserBulkWriteResult,
+    status_code=status.HTTP_200_OK,
+    summary="사용자 일괄 수정",
+    description=(
+        "목록 조회와 같은 필터 또는 ID 목록에 해당하는 사용자를 한 번에 수정합니다. "
+        "USER_BULK_WRITE_CHUNK_SIZE개씩 나눠 커밋하며 수정된 행 수를 반환합니다."
+    ),
+)
+def bulk_update_users(
+    changes: UserBulkUpdate,
+    filters: UserListFilter = Depends(get_user_filter),
+    user_ids: list[int] | None = Depends(parse_target_ids),
+    db: Session = Depends(get_db),
+):
+    """
+    사용자 일괄 수정 API
+
+    - **is_active / min_age / max_age / created_from / created_to**: 대상 필터 (목록 조회와 동일)
+    - **ids**: 대상 사용자 ID 목록 (최대 `USER_BULK_WRITE_MAX_IDS`개, 필터와 함께 지정하면 둘 다
+      만족하는 사용자)
+    - 본문: 수정할 필드 (`name`, `age`, `is_active`)
+    - 필터와 ID 목록이 모두 없으면 400 (전체 사용자 수정 방지)
+    - 청크마다 커밋하므로 중간에 실패하면 앞선 청크는 반영됩니다. 같은 요청을 다시 보내면
+      남은 사용자만 수정합니다.
+    """
+    return PydanticJSONResponse(
+        user_service.bulk_update_users(
+            db, changes, filters, user_ids, settings.USER_BULK_WRITE_CHUNK_SIZE
+        )
+    )
+
+
+@router.delete(
+    "",
+    response_model=UserBulkWriteResult,
+    status_code=status.HTTP_200_OK,
+    summary="사용자 일괄 삭제",
+    description=(
+        "목록 조회와 같은 필터 또는 ID 목록에 해당하는 사용자를 한 번에 삭제합니다. "
+        "USER_BULK_WRITE_CHUNK_SIZE개씩 나눠 커밋하며 삭제된 행 수를 반환합니다."
+    ),
+)
+def bulk_delete_users(
+    filters: UserListFilter = Depends(get_user_filter),
+    user_ids: list[int] | None = Depends(parse_target_ids),
+    db: Session = Depends(get_db),
+):
+    """
+    사용자 일괄 삭제 API
+
+    - **is_active / min_age / max_age / created_from / created_to**: 대상 필터 (목록 조회와 동일)
+    - **ids**: 대상 사용자 ID 목록 (최대 `USER_BULK_WRITE_MAX_IDS`개, 필터와 함께 지정하면 둘 다
+      만족하는 사용자)
+    - 필터와 ID 목록이 모두 없으면 400 (전체 사용자 삭제 방지)
+    - 청크마다 커밋하므로 중간에 실패하면 앞선 청크는 반영됩니다.
+    """
+    return PydanticJSONResponse(
+        user_service.bulk_delete_users(
+            db, filters, user_ids, settings.USER_BULK_WRITE_CHUNK_SIZE
+        )
+    )
+
+
+@router.get(
+    "/search",
+    response_model=list[UserResponse],
+    status_code=status.HTTP_200_OK,
+    summary="사용자 검색",
+    description=(
+        "이름 또는 이메일의 일부로 사용자를 검색합니다. "
+        "완전 일치, 접두사 일치, 부분 일치 순으로 정렬합니다."
+    ),
+)
+def search_users(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어"),
+    limit: int = Query(
+        20, ge=1, le=settings.USER_SEARCH_MAX_LIMIT, description="최대 결과 수"
+    ),
+    db: Session = Depends(get_read_db),
+):
+    """
+    사용자 검색 API
+
+    - **q**: 이름 또는 이메일 검색어 (대소문자 구분 없음)
+    - **limit**: 최대 결과 수 (최대 `USER_SEARCH_MAX_LIMIT`)
+    - PostgreSQL은 pg_trgm 인덱스로 부분 일치와 오타를 허용하는 유사도 검색을 수행하고,
+      그 외 DB는 검색어가 `USER_SEARCH_CONTAINS_MIN_LENGTH`자보다 짧으면 접두사 일치만 검색
+    """
+    return PydanticJSONResponse(
+        user_service.search_users(
+            db, q, limit, settings.USER_SEARCH_CONTAINS_MIN_LENGTH
+        ),
+        adapter=user_list_adapter,
+    )
 
 
 @router.get(
@@ -55,15 +503,34 @@ def get_users(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
     response_model=UserResponse,
     status_code=status.HTTP_200_OK,
     summary="사용자 단건 조회",
-    description="특정 사용자의 정보를 조회합니다.",
+    description=(
+        "특정 사용자의 정보를 조회합니다. 응답에 ETag를 포함하며, "
+        "If-None-Match가 현재 ETag와 일치하면 본문 없이 304를 반환합니다."
+    ),
+    responses={304: {"description": "변경 없음 (If-None-Match 일치)"}},
 )
-def get_user(user_id: int, db: Session = Depends(get_db)):
+def get_user(
+    user_id: int,
+    if_none_match: str | None = Header(None, description="이전 응답의 ETag"),
+    db: Session = Depends(get_read_db),
+):
     """
     사용자 단건 조회 API
 
     - **user_id**: 사용자 ID
+    - **If-None-Match**: 이전 응답의 ETag (일치하면 304)
     """
-    return user_service.get_user_by_id(db, user_id)
+    if if_none_match is not None:
+        etag = user_service.get_user_etag(db, user_id)
+        if etag_matches(if_none_match, etag, weak=True):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+
+    user = user_service.get_user_by_id(db, user_id)
+    return PydanticJSONResponse(
+        user, headers={"ETag": user_etag(user)}
+    )
 
 
 @router.put(
@@ -71,10 +538,17 @@ def get_user(user_id: int, db: Session = Depends(get_db)):
     response_model=UserResponse,
     status_code=status.HTTP_200_OK,
     summary="사용자 정보 수정",
-    description="사용자 정보를 수정합니다. 제공된 필드만 업데이트됩니다.",
+    description=(
+        "사용자 정보를 수정합니다. 제공된 필드만 업데이트됩니다. "
+        "If-Match를 지정하면 현재 ETag와 일치할 때만 수정합니다."
+    ),
+    responses={412: {"description": "If-Match 불일치"}},
 )
 def update_user(
-    user_id: int, user_data: UserUpdate, db: Session = Depends(get_db)
+    user_id: int,
+    user_data: UserUpdate,
+    if_match: str | None = Header(None, description="수정 전 조회한 ETag"),
+    db: Session = Depends(get_db),
 ):
     """
     사용자 정보 수정 API
@@ -84,20 +558,32 @@ def update_user(
     - **name**: 사용자 이름 (선택)
     - **age**: 나이 (선택)
     - **is_active**: 활성화 상태 (선택)
+    - **If-Match**: 수정 전 조회한 ETag (불일치 시 412)
     """
-    return user_service.update_user(db, user_id, user_data)
+    user = user_service.update_user(db, user_id, user_data, if_match)
+    return PydanticJSONResponse(
+        user, headers={"ETag": user_etag(user)}
+    )
 
 
 @router.delete(
     "/{user_id}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="사용자 삭제",
-    description="사용자를 삭제합니다.",
+    description=(
+        "사용자를 삭제합니다. If-Match를 지정하면 현재 ETag와 일치할 때만 삭제합니다."
+    ),
+    responses={412: {"description": "If-Match 불일치"}},
 )
-def delete_user(user_id: int, db: Session = Depends(get_db)):
+def delete_user(
+    user_id: int,
+    if_match: str | None = Header(None, description="삭제 전 조회한 ETag"),
+    db: Session = Depends(get_db),
+):
     """
     사용자 삭제 API
 
     - **user_id**: 사용자 ID
+    - **If-Match**: 삭제 전 조회한 ETag (불일치 시 412)
     """
-    user_service.delete_user(db, user_id)
+    user_service.delete_user(db, user_id, if_match)
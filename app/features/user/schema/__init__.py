@@ -3,6 +3,31 @@ from app.features.user.schema.user_schema import (
     UserCreate,
     UserUpdate,
     UserResponse,
+    UserCursorPage,
+    UserListFilter,
+    UserSort,
+    UserBulkItemResult,
+    UserBulkResult,
+    UserBulkUpdate,
+    UserBulkWriteResult,
+    UserBatchRequest,
+    UserBatchResult,
+    user_list_adapter,
 )
 
-__all__ = ["UserBase", "UserCreate", "UserUpdate", "UserResponse"]
+__all__ = [
+    "UserBase",
+    "UserCreate",
+    "UserUpdate",
+    "UserResponse",
+    "UserCursorPage",
+    "UserListFilter",
+    "UserSort",
+    "UserBulkItemResult",
+    "UserBulkResult",
+    "UserBulkUpdate",
+    "UserBulkWriteResult",
+    "UserBatchRequest",
+    "UserBatchResult",
+    "user_list_adapter",
+]
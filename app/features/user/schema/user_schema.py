@@ -4,8 +4,9 @@ User Pydantic 스키마 정의
 API 요청/응답에 사용되는 데이터 검증 스키마입니다.
 """
 
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, Field, EmailStr, TypeAdapter, field_validator
 from datetime import datetime
+from typing import Literal
 
 
 class UserBase(BaseModel):
@@ -37,9 +38,102 @@ class UserUpdate(BaseModel):
 class UserResponse(UserBase):
     """사용자 응답 스키마"""
 
+    # 저장 시 검증된 값이므로 응답에서는 이메일 형식 검증(email-validator)을 생략
+    email: str = Field(
+        ..., max_length=255, description="사용자 이메일", json_schema_extra={"format": "email"}
+    )
     id: int
     created_at: datetime
     updated_at: datetime
 
     class Config:
         from_attributes = True  # ORM 모델 → Pydantic 변환 허용
+
+
+# 목록 정렬 키 ("-" 접두사는 내림차순, 동순위는 id로 정렬)
+UserSort = Literal["id", "-id", "created_at", "-created_at", "name", "-name"]
+
+
+class UserListFilter(BaseModel):
+    """사용자 목록 필터 (지정하지 않은 조건은 적용하지 않음)"""
+
+    is_active: bool | None = Field(None, description="활성화 상태")
+    min_age: int | None = Field(None, ge=0, le=150, description="최소 나이 (이상)")
+    max_age: int | None = Field(None, ge=0, le=150, description="최대 나이 (이하)")
+    created_from: datetime | None = Field(None, description="생성 시각 시작 (이상)")
+    created_to: datetime | None = Field(None, description="생성 시각 끝 (미만)")
+
+
+# 사용자 목록 검증/직렬화 (ORM 객체 리스트를 한 번의 호출로 처리)
+user_list_adapter = TypeAdapter(list[UserResponse])
+
+
+class UserCursorPage(BaseModel):
+    """사용자 목록 커서 페이지 응답 스키마"""
+
+    items: list[UserResponse] = Field(..., description="사용자 목록")
+    next_cursor: str | None = Field(
+        None, description="다음 페이지 커서 (마지막 페이지면 null)"
+    )
+
+
+class UserBulkItemResult(BaseModel):
+    """일괄 생성 행별 결과 스키마"""
+
+    index: int = Field(..., description="요청 본문 내 행 번호 (0부터 시작)")
+    status: Literal["created", "duplicate", "invalid"] = Field(
+        ..., description="처리 결과"
+    )
+    id: int | None = Field(None, description="생성된 사용자 ID")
+    email: str | None = Field(None, description="정규화된 이메일")
+    errors: list[str] | None = Field(None, description="검증 오류 목록")
+
+
+class UserBulkResult(BaseModel):
+    """일괄 생성 응답 스키마"""
+
+    created: int = Field(..., description="생성된 행 수")
+    duplicates: int = Field(..., description="이메일 중복 행 수")
+    invalid: int = Field(..., description="검증 실패 행 수")
+    results: list[UserBulkItemResult] = Field(..., description="요청 순서의 행별 결과")
+
+
+class UserBulkUpdate(BaseModel):
+    """일괄 수정 스키마 (지정한 필드만 수정, 이메일은 사용자마다 달라야 하므로 제외)"""
+
+    name: str | None = Field(
+        None, min_length=1, max_length=100, description="사용자 이름"
+    )
+    age: int | None = Field(None, ge=0, le=150, description="나이 (0-150)")
+    is_active: bool | None = Field(None, description="활성화 상태")
+
+    class Config:
+        extra = "forbid"  # email 등 일괄 수정할 수 없는 필드는 422
+
+    @field_validator("name", "is_active")
+    @classmethod
+    def reject_null(cls, value):
+        """NOT NULL 컬럼에 명시적으로 null을 보내면 422 (나이는 null로 지울 수 있음)"""
+        if value is None:
+            raise ValueError("must not be null")
+        return value
+
+
+class UserBulkWriteResult(BaseModel):
+    """일괄 수정/삭제 응답 스키마"""
+
+    affected: int = Field(..., description="수정/삭제된 행 수")
+    chunks: int = Field(..., description="나눠 실행한 트랜잭션 수")
+
+
+class UserBatchRequest(BaseModel):
+    """ID 목록 일괄 조회 요청 스키마"""
+
+    ids: list[int] = Field(..., min_length=1, description="조회할 사용자 ID 목록")
+
+
+class UserBatchResult(BaseModel):
+    """ID 목록 일괄 조회 응답 스키마"""
+
+    items: list[UserResponse] = Field(..., description="요청 순서의 사용자 목록")
+    missing: list[int] = Field(..., description="존재하지 않는 사용자 ID (요청 순서)")
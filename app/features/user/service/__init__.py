@@ -1,3 +1,4 @@
-from app.features.user.service.user_service import UserService
+from app.features.user.service.user_service import UserService, user_etag
+from app.features.user.service.user_async_service import AsyncUserService
 
-__all__ = ["UserService"]
+__all__ = ["UserService", "AsyncUserService", "user_etag"]
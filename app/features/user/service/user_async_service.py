@@ -0,0 +1,341 @@
+"""
+User Async Service
+
+AsyncSession 기반으로 비즈니스 로직을 담당하는 Service 계층입니다.
+UserService와 동일한 검증 규칙과 에러 응답을 유지합니다.
+"""
+
+from typing import Literal
+
+from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.batching import AsyncGroupCommitBatcher
+from app.core.cache import CacheBackend, NullCache
+from app.core.database import is_replica_session, is_unique_violation
+from app.core.etag import etag_matches
+from app.features.user.repository import AsyncUserRepository
+from app.features.user.schema import (
+    UserCreate,
+    UserUpdate,
+    UserResponse,
+    UserCursorPage,
+    UserListFilter,
+    UserSort,
+    user_list_adapter,
+)
+from app.features.user.service.user_service import (
+    parse_cursor,
+    build_cursor_page,
+    grouped_create_results,
+    user_cache_key,
+    user_etag,
+    user_etag_cache_key,
+)
+
+
+class AsyncUserService:
+    """사용자 비즈니스 로직 계층 (async)"""
+
+    def __init__(
+        self,
+        cache: CacheBackend | None = None,
+        create_batch_window: float | None = None,
+        create_batch_max_size: int = 100,
+    ):
+        self.repository = AsyncUserRepository()
+        self.cache = cache if cache is not None else NullCache()
+        # 그룹 커밋: 동시에 도착한 생성 요청을 create_batch_window(초) 동안 모아 한 트랜잭션으로 삽입
+        self.create_batcher = (
+            AsyncGroupCommitBatcher(
+                "user_create_async",
+                self._create_users_grouped,
+                window=create_batch_window,
+                max_size=create_batch_max_size,
+            )
+            if create_batch_window
+            else None
+        )
+
+    async def create_user(self, db: AsyncSession, user_data: UserCreate) -> UserResponse:
+        """
+        사용자 생성
+
+        Args:
+            db: async 데이터베이스 세션
+            user_data: 사용자 생성 데이터
+
+        Returns:
+            생성된 사용자 응답
+
+        Raises:
+            HTTPException: 이메일 중복 시 409
+        """
+        if self.create_batcher is not None:
+            return await self.create_batcher.submit(db, user_data)
+
+        # 이메일 중복은 UNIQUE 제약 조건으로 검증 (조회 후 삽입 경합 없음)
+        try:
+            db_user = await self.repository.create(db, user_data)
+        except IntegrityError as e:
+            if not is_unique_violation(e):
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT, detail="Email already exists"
+            )
+        return UserResponse.model_validate(db_user)
+
+    async def _create_users_grouped(
+        self, db: AsyncSession, items: list[UserCreate]
+    ) -> list[UserResponse | HTTPException]:
+        """그룹 커밋 배치의 사용자 생성 (UserService._create_users_grouped 참고)"""
+        rows = {}
+        for user_data in items:
+            email = user_data.email.lower()  # 이메일 소문자 정규화
+            rows.setdefault(
+                email,
+                {
+                    "email": email,
+                    "name": user_data.name,
+                    "age": user_data.age,
+                    "is_active": user_data.is_active,
+                },
+            )
+        created = await self.repository.create_many(db, list(rows.values()))
+        return grouped_create_results(items, created)
+
+    async def get_user_by_id(self, db: AsyncSession, user_id: int) -> UserResponse:
+        """
+        ID로 사용자 조회
+
+        Args:
+            db: async 데이터베이스 세션
+            user_id: 사용자 ID
+
+        Returns:
+            사용자 응답
+
+        Raises:
+            HTTPException: 사용자를 찾을 수 없으면 404
+        """
+        cache_key = user_cache_key(user_id)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return UserResponse.model_validate_json(cached)
+
+        db_user = await self.repository.get_by_id(db, user_id)
+        if not db_user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+            )
+
+        user = UserResponse.model_validate(db_user)
+        if not is_replica_session(db):  # UserService._fill_cache 참고
+            self.cache.add(cache_key, user.model_dump_json().encode())
+            self.cache.add(user_etag_cache_key(user_id), user_etag(user).encode())
+        return user
+
+    async def get_user_etag(self, db: AsyncSession, user_id: int) -> str:
+        """
+        사용자 ETag 조회 (If-None-Match 처리용)
+
+        캐시에 없으면 ETag 계산에 필요한 컬럼만 조회하므로 응답 본문을 만들지 않습니다.
+
+        Args:
+            db: async 데이터베이스 세션
+            user_id: 사용자 ID
+
+        Returns:
+            현재 ETag
+
+        Raises:
+            HTTPException: 사용자를 찾을 수 없으면 404
+        """
+        etag_key = user_etag_cache_key(user_id)
+        cached = self.cache.get(etag_key)
+        if cached is not None:
+            return cached.decode()
+
+        row = await self.repository.get_etag_fields(db, user_id)
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+            )
+
+        etag = user_etag(row)
+        if not is_replica_session(db):
+            self.cache.add(etag_key, etag.encode())
+        return etag
+
+    async def get_all_users(
+        self,
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        filters: UserListFilter | None = None,
+        sort: UserSort = "id",
+    ) -> list[UserResponse]:
+        """
+        사용자 목록 조회
+
+        Args:
+            db: async 데이터베이스 세션
+            skip: 건너뛸 항목 수
+            limit: 조회할 최대 항목 수
+            filters: 목록 필터
+            sort: 정렬 키
+
+        Returns:
+            사용자 응답 리스트
+        """
+        db_users = await self.repository.get_all(db, skip, limit, filters, sort)
+        return user_list_adapter.validate_python(db_users, from_attributes=True)
+
+    async def get_users_page(
+        self,
+        db: AsyncSession,
+        cursor: str | None = None,
+        limit: int = 100,
+        filters: UserListFilter | None = None,
+        sort: UserSort = "id",
+    ) -> UserCursorPage:
+        """
+        커서 기반 사용자 목록 조회
+
+        Args:
+            db: async 데이터베이스 세션
+            cursor: 이전 응답의 next_cursor (첫 페이지면 None)
+            limit: 조회할 최대 항목 수
+            filters: 목록 필터
+            sort: 정렬 키
+
+        Returns:
+            사용자 목록과 다음 페이지 커서
+
+        Raises:
+            HTTPException: 커서 형식이 올바르지 않으면 400
+        """
+        after = parse_cursor(cursor, sort)
+        db_users = await self.repository.get_page_after(
+            db, after, limit + 1, filters, sort
+        )
+        return build_cursor_page(db_users, limit, sort)
+
+    async def count_users(
+        self,
+        db: AsyncSession,
+        filters: UserListFilter | None = None,
+        mode: Literal["exact", "estimate"] = "exact",
+        exact_threshold: int = 10000,
+    ) -> tuple[int, bool]:
+        """
+        필터에 해당하는 사용자 수 조회 (UserService.count_users와 동일한 규칙)
+
+        Args:
+            db: async 데이터베이스 세션
+            filters: 목록 필터
+            mode: exact(COUNT(*)) 또는 estimate(플래너 통계)
+            exact_threshold: 추정값 대신 COUNT(*)를 실행할 예상 행 수 상한
+
+        Returns:
+            (사용자 수, 정확한 값 여부)
+        """
+        if mode == "estimate":
+            estimate = await self.repository.estimate_count(db, filters)
+            if estimate is not None and estimate >= exact_threshold:
+                return estimate, False
+        return await self.repository.count(db, filters), True
+
+    async def update_user(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        user_data: UserUpdate,
+        if_match: str | None = None,
+    ) -> UserResponse:
+        """
+        사용자 정보 수정
+
+        Args:
+            db: async 데이터베이스 세션
+            user_id: 사용자 ID
+            user_data: 수정할 데이터
+            if_match: If-Match 헤더 값 (지정 시 현재 ETag와 일치할 때만 수정)
+
+        Returns:
+            수정된 사용자 응답
+
+        Raises:
+            HTTPException: 사용자를 찾을 수 없으면 404, 이메일 중복 시 409,
+                If-Match 불일치 시 412
+        """
+        if if_match is not None:
+            await self._check_if_match(db, user_id, if_match)
+
+        try:
+            updated_user = await self.repository.update(db, user_id, user_data)
+        except IntegrityError as e:
+            if not is_unique_violation(e):
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT, detail="Email already exists"
+            )
+
+        if not updated_user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+            )
+
+        user = UserResponse.model_validate(updated_user)
+        self.cache.set(user_cache_key(user_id), user.model_dump_json().encode())
+        self.cache.set(
+            user_etag_cache_key(user_id), user_etag(user).encode()
+        )
+        return user
+
+    async def delete_user(
+        self, db: AsyncSession, user_id: int, if_match: str | None = None
+    ) -> None:
+        """
+        사용자 삭제
+
+        Args:
+            db: async 데이터베이스 세션
+            user_id: 사용자 ID
+            if_match: If-Match 헤더 값 (지정 시 현재 ETag와 일치할 때만 삭제)
+
+        Raises:
+            HTTPException: 사용자를 찾을 수 없으면 404, If-Match 불일치 시 412
+        """
+        if if_match is not None:
+            await self._check_if_match(db, user_id, if_match)
+
+        success = await self.repository.delete(db, user_id)
+        self.cache.delete(user_cache_key(user_id))
+        self.cache.delete(user_etag_cache_key(user_id))
+        if not success:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+            )
+
+    async def _check_if_match(
+        self, db: AsyncSession, user_id: int, if_match: str
+    ) -> None:
+        """
+        If-Match 전제 조건 검증 (행 잠금 후 현재 ETag 비교, 캐시 미사용)
+
+        Raises:
+            HTTPException: 사용자를 찾을 수 없으면 404, ETag 불일치 시 412
+        """
+        row = await self.repository.get_etag_fields(db, user_id, for_update=True)
+        if row is None:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+            )
+        if not etag_matches(if_match, user_etag(row)):
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail="Precondition failed",
+            )
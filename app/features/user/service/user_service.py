@@ -4,18 +4,196 @@ User Service
 비즈니스 로직을 담당하는 Service 계층입니다.
 """
 
+import csv
+import io
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Any, Literal
+
 from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.features.user.repository import UserRepository
-from app.features.user.schema import UserCreate, UserUpdate, UserResponse
+from app.core.batching import GroupCommitBatcher
+from app.core.cache import CacheBackend, NullCache
+from app.core.database import is_replica_session, is_unique_violation
+from app.core.etag import etag_matches, make_etag
+from app.core.pagination import encode_cursor, decode_cursor
+from app.features.user.schema import (
+    UserCreate,
+    UserUpdate,
+    UserResponse,
+    UserCursorPage,
+    UserListFilter,
+    UserSort,
+    UserBulkItemResult,
+    UserBulkResult,
+    UserBulkUpdate,
+    UserBulkWriteResult,
+    UserBatchResult,
+    user_list_adapter,
+)
 from app.features.user.entity import User
 
 
+# 내보내기 컬럼 순서
+EXPORT_FIELDS = ("id", "email", "name", "age", "is_active", "created_at", "updated_at")
+
+
+# ETag를 결정하는 필드 (응답 본문의 모든 필드)
+ETAG_FIELDS = ("id", "email", "name", "age", "is_active", "created_at", "updated_at")
+
+
+def user_cache_key(user_id: int) -> str:
+    """단건 조회 캐시 키"""
+    return f"user:{user_id}"
+
+
+def user_etag_cache_key(user_id: int) -> str:
+    """단건 ETag 캐시 키"""
+    return f"user:{user_id}:etag"
+
+
+def user_etag(user: Any) -> str:
+    """
+    사용자 ETag 생성
+
+    응답 필드(ETAG_FIELDS) 값으로 결정되므로 본문을 직렬화하지 않고도 계산할 수 있습니다.
+    updated_at은 DB에 따라 초 단위로만 저장되므로(SQLite / MySQL DATETIME) 수정 시각만으로는
+    같은 초 안의 수정을 구분하지 못합니다.
+
+    Args:
+        user: ETAG_FIELDS 속성을 가진 객체 (User 엔티티, UserResponse, 조회 Row)
+    """
+    return make_etag(*(getattr(user, field) for field in ETAG_FIELDS))
+
+
+def parse_cursor(cursor: str | None, sort: UserSort = "id") -> tuple[Any, int] | None:
+    """
+    커서에서 이전 페이지 마지막 행의 (정렬 키 값, id) 추출
+
+    Args:
+        cursor: 이전 응답의 next_cursor (첫 페이지면 None)
+        sort: 현재 요청의 정렬 키 (커서를 만든 요청과 같아야 함)
+
+    Returns:
+        (정렬 키 값, 마지막 사용자 ID) 또는 None
+
+    Raises:
+        HTTPException: 커서 형식이 올바르지 않거나 정렬 키가 다르면 400
+    """
+    if not cursor:
+        return None
+    try:
+        payload = decode_cursor(cursor)
+        last_id = int(payload["id"])
+        if payload.get("sort", "id") != sort:
+            raise ValueError("cursor sort mismatch")
+        key = sort.lstrip("-")
+        if key == "id":
+            return last_id, last_id
+        value = payload["value"]
+        if key == "created_at":
+            value = datetime.fromisoformat(value)
+        elif not isinstance(value, str):
+            raise TypeError("invalid cursor value")
+        return value, last_id
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
+
+def build_cursor_page(
+    db_users: list[User], limit: int, sort: UserSort = "id"
+) -> UserCursorPage:
+    """
+    limit + 1개 조회 결과로 커서 페이지 응답 생성
+
+    커서에는 마지막 행의 id와 정렬 키 값을 담습니다.
+
+    Args:
+        db_users: limit + 1개까지 조회한 User 엔티티 리스트
+        limit: 페이지 크기
+        sort: 정렬 키
+
+    Returns:
+        사용자 목록과 다음 페이지 커서
+    """
+    has_more = len(db_users) > limit
+    db_users = db_users[:limit]
+
+    next_cursor = None
+    if has_more and db_users:
+        last = db_users[-1]
+        payload: dict[str, Any] = {"id": last.id}
+        if sort != "id":
+            payload["sort"] = sort
+        key = sort.lstrip("-")
+        if key != "id":
+            value = getattr(last, key)
+            payload["value"] = value.isoformat() if isinstance(value, datetime) else value
+        next_cursor = encode_cursor(payload)
+
+    return UserCursorPage(
+        items=user_list_adapter.validate_python(db_users, from_attributes=True),
+        next_cursor=next_cursor,
+    )
+
+
+def grouped_create_results(
+    items: list[UserCreate], created: dict[str, User]
+) -> list[UserResponse | HTTPException]:
+    """
+    그룹 커밋 배치의 항목별 결과 생성
+
+    Args:
+        items: 배치에 모인 사용자 생성 데이터 (도착 순서)
+        created: 실제로 삽입된 행의 {email: User} 매핑
+
+    Returns:
+        항목 순서의 생성된 사용자 응답 (이메일마다 첫 항목) 또는 이메일 중복 409 HTTPException
+    """
+    results: list[UserResponse | HTTPException] = []
+    claimed: set[str] = set()
+    for user_data in items:
+        email = user_data.email.lower()
+        db_user = created.get(email)
+        if db_user is None or email in claimed:
+            results.append(
+                HTTPException(
+                    status_code=status.HTTP_409_CONFLICT, detail="Email already exists"
+                )
+            )
+        else:
+            claimed.add(email)
+            results.append(UserResponse.model_validate(db_user))
+    return results
+
+
 class UserService:
     """사용자 비즈니스 로직 계층"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache: CacheBackend | None = None,
+        create_batch_window: float | None = None,
+        create_batch_max_size: int = 100,
+    ):
         self.repository = UserRepository()
+        self.cache = cache if cache is not None else NullCache()
+        # 그룹 커밋: 동시에 도착한 생성 요청을 create_batch_window(초) 동안 모아 한 트랜잭션으로 삽입
+        self.create_batcher = (
+            GroupCommitBatcher(
+                "user_create",
+                self._create_users_grouped,
+                window=create_batch_window,
+                max_size=create_batch_max_size,
+            )
+            if create_batch_window
+            else None
+        )
 
     def create_user(self, db: Session, user_data: UserCreate) -> UserResponse:
         """
@@ -31,17 +209,138 @@ class UserService:
         Raises:
             HTTPException: 이메일 중복 시 409
         """
-        # 이메일 중복 검증
-        existing_user = self.repository.get_by_email(db, user_data.email)
-        if existing_user:
+        if self.create_batcher is not None:
+            return self.create_batcher.submit(db, user_data)
+
+        # 이메일 중복은 UNIQUE 제약 조건으로 검증 (조회 후 삽입 경합 없음)
+        try:
+            db_user = self.repository.create(db, user_data)
+        except IntegrityError as e:
+            if not is_unique_violation(e):
+                raise
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT, detail="Email already exists"
             )
-
-        # 사용자 생성
-        db_user = self.repository.create(db, user_data)
         return UserResponse.model_validate(db_user)
 
+    def _create_users_grouped(
+        self, db: Session, items: list[UserCreate]
+    ) -> list[UserResponse | HTTPException]:
+        """
+        그룹 커밋 배치의 사용자 생성 (create_batcher의 flush)
+
+        배치 안에서 같은 이메일이 여러 번 나오면 먼저 도착한 항목만 삽입합니다.
+
+        Args:
+            db: 리더 요청의 데이터베이스 세션
+            items: 배치에 모인 사용자 생성 데이터 (도착 순서)
+
+        Returns:
+            항목 순서의 생성된 사용자 응답 또는 이메일 중복 409 HTTPException
+        """
+        rows = {}
+        for user_data in items:
+            email = user_data.email.lower()  # 이메일 소문자 정규화
+            rows.setdefault(
+                email,
+                {
+                    "email": email,
+                    "name": user_data.name,
+                    "age": user_data.age,
+                    "is_active": user_data.is_active,
+                },
+            )
+        created = self.repository.create_many(db, list(rows.values()))
+        return grouped_create_results(items, created)
+
+    def bulk_create_users(
+        self, db: Session, rows: list[Any], chunk_size: int = 1000
+    ) -> UserBulkResult:
+        """
+        사용자 일괄 생성
+
+        1. 모든 행을 UserCreate로 검증 (실패 행은 invalid)
+        2. 요청 내 중복 이메일은 첫 행만 남기고 duplicate
+        3. 기존 이메일을 한 번의 쿼리로 조회하여 duplicate
+        4. 남은 행을 chunk_size 단위 다중 행 INSERT로 삽입
+
+        Args:
+            db: 데이터베이스 세션
+            rows: 요청 본문의 행 목록 (검증 전 원본)
+            chunk_size: INSERT 한 번에 묶을 행 수
+
+        Returns:
+            요청 순서의 행별 결과와 집계
+        """
+        results: list[UserBulkItemResult | None] = [None] * len(rows)
+        pending: dict[str, tuple[int, UserCreate]] = {}
+
+        for index, row in enumerate(rows):
+            try:
+                user_data = UserCreate.model_validate(row)
+            except ValidationError as e:
+                results[index] = UserBulkItemResult(
+                    index=index,
+                    status="invalid",
+                    errors=[
+                        f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+                        for error in e.errors()
+                    ],
+                )
+                continue
+
+            email = user_data.email.lower()  # 이메일 소문자 정규화
+            if email in pending:
+                results[index] = UserBulkItemResult(
+                    index=index, status="duplicate", email=email
+                )
+                continue
+            pending[email] = (index, user_data)
+
+        # 이메일 중복 검증 (단일 쿼리)
+        for email in self.repository.get_existing_emails(db, list(pending)):
+            index, _ = pending.pop(email)
+            results[index] = UserBulkItemResult(
+                index=index, status="duplicate", email=email
+            )
+
+        # 사용자 일괄 생성
+        items = list(pending.items())
+        for start in range(0, len(items), chunk_size):
+            chunk = items[start : start + chunk_size]
+            inserted = self.repository.bulk_create(
+                db,
+                [
+                    {
+                        "email": email,
+                        "name": user_data.name,
+                        "age": user_data.age,
+                        "is_active": user_data.is_active,
+                    }
+                    for email, (_, user_data) in chunk
+                ],
+            )
+            for email, (index, _) in chunk:
+                # 조회 이후 다른 요청이 먼저 삽입한 이메일은 삽입되지 않음
+                user_id = inserted.get(email)
+                results[index] = UserBulkItemResult(
+                    index=index,
+                    status="created" if user_id is not None else "duplicate",
+                    id=user_id,
+                    email=email,
+                )
+
+        counts = {"created": 0, "duplicate": 0, "invalid": 0}
+        for result in results:
+            counts[result.status] += 1
+
+        return UserBulkResult(
+            created=counts["created"],
+            duplicates=counts["duplicate"],
+            invalid=counts["invalid"],
+            results=results,
+        )
+
     def get_user_by_id(self, db: Session, user_id: int) -> UserResponse:
         """
         ID로 사용자 조회
@@ -56,16 +355,135 @@ class UserService:
         Raises:
             HTTPException: 사용자를 찾을 수 없으면 404
         """
+        cache_key = user_cache_key(user_id)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return UserResponse.model_validate_json(cached)
+
         db_user = self.repository.get_by_id(db, user_id)
         if not db_user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
             )
 
-        return UserResponse.model_validate(db_user)
+        user = UserResponse.model_validate(db_user)
+        self._fill_cache(db, user)
+        return user
+
+    def get_users_by_ids(self, db: Session, user_ids: list[int]) -> UserBatchResult:
+        """
+        ID 목록으로 사용자 일괄 조회
+
+        캐시에 있는 사용자는 캐시에서, 나머지는 한 번의 쿼리로 조회합니다.
+        중복 ID는 처음 나온 위치 기준으로 한 번만 반환합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            user_ids: 사용자 ID 목록
+
+        Returns:
+            요청 순서의 사용자 목록과 존재하지 않는 ID 목록
+        """
+        unique_ids = list(dict.fromkeys(user_ids))
+        users: dict[int, UserResponse] = {}
+        uncached_ids = []
+        for user_id in unique_ids:
+            cached = self.cache.get(user_cache_key(user_id))
+            if cached is not None:
+                users[user_id] = UserResponse.model_validate_json(cached)
+            else:
+                uncached_ids.append(user_id)
+
+        for db_user in self.repository.get_by_ids(db, uncached_ids):
+            user = UserResponse.model_validate(db_user)
+            users[user.id] = user
+            self._fill_cache(db, user)
+
+        return UserBatchResult(
+            items=[users[user_id] for user_id in unique_ids if user_id in users],
+            missing=[user_id for user_id in unique_ids if user_id not in users],
+        )
+
+    def search_users(
+        self, db: Session, q: str, limit: int = 20, contains_min_length: int = 3
+    ) -> list[UserResponse]:
+        """
+        이름/이메일 검색 (관련도 순)
+
+        Args:
+            db: 데이터베이스 세션
+            q: 검색어 (대소문자 구분 없음)
+            limit: 최대 결과 수
+            contains_min_length: 부분 일치를 적용할 최소 검색어 길이 (PostgreSQL 외)
+
+        Returns:
+            관련도 순 사용자 응답 리스트
+
+        Raises:
+            HTTPException: 공백만 있는 검색어면 400
+        """
+        query = q.strip().lower()
+        if not query:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Search query must not be blank",
+            )
+        db_users = self.repository.search(db, query, limit, contains_min_length)
+        return user_list_adapter.validate_python(db_users, from_attributes=True)
+
+    def _fill_cache(self, db: Session, user: UserResponse) -> None:
+        """
+        조회 결과로 단건 캐시와 ETag 캐시 채우기 (이미 있으면 유지)
+
+        복제본에서 읽은 값은 채우지 않습니다. 수정/삭제가 캐시를 비운 직후 지연된 복제본의
+        이전 값이 다시 채워지면 복제 지연이 아니라 캐시 TTL 동안 오래된 값을 반환하기 때문입니다.
+        """
+        if is_replica_session(db):
+            return
+        self.cache.add(user_cache_key(user.id), user.model_dump_json().encode())
+        self.cache.add(
+            user_etag_cache_key(user.id), user_etag(user).encode()
+        )
+
+    def get_user_etag(self, db: Session, user_id: int) -> str:
+        """
+        사용자 ETag 조회 (If-None-Match 처리용)
+
+        캐시에 없으면 ETag 계산에 필요한 컬럼만 조회하므로 응답 본문을 만들지 않습니다.
+
+        Args:
+            db: 데이터베이스 세션
+            user_id: 사용자 ID
+
+        Returns:
+            현재 ETag
+
+        Raises:
+            HTTPException: 사용자를 찾을 수 없으면 404
+        """
+        etag_key = user_etag_cache_key(user_id)
+        cached = self.cache.get(etag_key)
+        if cached is not None:
+            return cached.decode()
+
+        row = self.repository.get_etag_fields(db, user_id)
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+            )
+
+        etag = user_etag(row)
+        if not is_replica_session(db):
+            self.cache.add(etag_key, etag.encode())
+        return etag
 
     def get_all_users(
-        self, db: Session, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        filters: UserListFilter | None = None,
+        sort: UserSort = "id",
     ) -> list[UserResponse]:
         """
         사용자 목록 조회
@@ -74,15 +492,137 @@ class UserService:
             db: 데이터베이스 세션
             skip: 건너뛸 항목 수
             limit: 조회할 최대 항목 수
+            filters: 목록 필터
+            sort: 정렬 키
 
         Returns:
             사용자 응답 리스트
         """
-        db_users = self.repository.get_all(db, skip, limit)
-        return [UserResponse.model_validate(user) for user in db_users]
+        db_users = self.repository.get_all(db, skip, limit, filters, sort)
+        return user_list_adapter.validate_python(db_users, from_attributes=True)
+
+    def get_users_page(
+        self,
+        db: Session,
+        cursor: str | None = None,
+        limit: int = 100,
+        filters: UserListFilter | None = None,
+        sort: UserSort = "id",
+    ) -> UserCursorPage:
+        """
+        커서 기반 사용자 목록 조회
+
+        다음 페이지 존재 여부를 판단하기 위해 limit + 1개를 조회합니다.
+        필터는 커서에 담지 않으므로 다음 페이지 요청에도 같은 필터를 지정해야 합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            cursor: 이전 응답의 next_cursor (첫 페이지면 None)
+            limit: 조회할 최대 항목 수
+            filters: 목록 필터
+            sort: 정렬 키
+
+        Returns:
+            사용자 목록과 다음 페이지 커서
+
+        Raises:
+            HTTPException: 커서 형식이 올바르지 않으면 400
+        """
+        after = parse_cursor(cursor, sort)
+        db_users = self.repository.get_page_after(db, after, limit + 1, filters, sort)
+        return build_cursor_page(db_users, limit, sort)
+
+    def count_users(
+        self,
+        db: Session,
+        filters: UserListFilter | None = None,
+        mode: Literal["exact", "estimate"] = "exact",
+        exact_threshold: int = 10000,
+    ) -> tuple[int, bool]:
+        """
+        필터에 해당하는 사용자 수 조회
+
+        estimate 모드에서는 플래너 예상 행 수가 exact_threshold 이상일 때만 추정값을
+        사용하고, 그보다 작으면(정확히 세도 저렴하면) COUNT(*)를 실행합니다.
+        예상 행 수를 얻을 수 없는 DB(PostgreSQL 외)는 항상 COUNT(*)를 사용합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            filters: 목록 필터
+            mode: exact(COUNT(*)) 또는 estimate(플래너 통계)
+            exact_threshold: 추정값 대신 COUNT(*)를 실행할 예상 행 수 상한
+
+        Returns:
+            (사용자 수, 정확한 값 여부)
+        """
+        if mode == "estimate":
+            estimate = self.repository.estimate_count(db, filters)
+            if estimate is not None and estimate >= exact_threshold:
+                return estimate, False
+        return self.repository.count(db, filters), True
+
+    def export_users(
+        self,
+        db: Session,
+        export_format: Literal["ndjson", "csv"] = "ndjson",
+        batch_size: int = 1000,
+    ) -> Iterator[bytes]:
+        """
+        전체 사용자 내보내기 (스트리밍)
+
+        서버 사이드 커서에서 batch_size 단위로 읽어 바로 직렬화하므로
+        첫 바이트가 전체 조회를 기다리지 않고, 메모리 사용량이 일정합니다.
+
+        StreamingResponse 본문은 get_db 의존성 정리 이후에 소비될 수 있으므로
+        세션은 여기서 직접 닫습니다. (닫힌 Session은 재사용 시 새 커넥션을 획득)
+
+        Args:
+            db: 데이터베이스 세션
+            export_format: 출력 형식 (ndjson | csv)
+            batch_size: 한 번에 가져올 행 수
+
+        Yields:
+            직렬화된 응답 본문 조각
+        """
+        try:
+            if export_format == "csv":
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                writer.writerow(EXPORT_FIELDS)
+                yield buffer.getvalue().encode()
+
+                for rows in self.repository.stream_all(db, batch_size):
+                    buffer.seek(0)
+                    buffer.truncate()
+                    writer.writerows(
+                        (
+                            row.id,
+                            row.email,
+                            row.name,
+                            row.age,
+                            "true" if row.is_active else "false",
+                            row.created_at.isoformat(),
+                            row.updated_at.isoformat(),
+                        )
+                        for row in rows
+                    )
+                    yield buffer.getvalue().encode()
+            else:
+                for rows in self.repository.stream_all(db, batch_size):
+                    yield b"".join(
+                        UserResponse.model_validate(row).model_dump_json().encode()
+                        + b"\n"
+                        for row in rows
+                    )
+        finally:
+            db.close()
 
     def update_user(
-        self, db: Session, user_id: int, user_data: UserUpdate
+        self,
+        db: Session,
+        user_id: int,
+        user_data: UserUpdate,
+        if_match: str | None = None,
     ) -> UserResponse:
         """
         사용자 정보 수정
@@ -91,45 +631,175 @@ class UserService:
             db: 데이터베이스 세션
             user_id: 사용자 ID
             user_data: 수정할 데이터
+            if_match: If-Match 헤더 값 (지정 시 현재 ETag와 일치할 때만 수정)
 
         Returns:
             수정된 사용자 응답
 
         Raises:
-            HTTPException: 사용자를 찾을 수 없으면 404, 이메일 중복 시 409
+            HTTPException: 사용자를 찾을 수 없으면 404, 이메일 중복 시 409,
+                If-Match 불일치 시 412
         """
-        # 사용자 존재 여부 확인
-        existing_user = self.repository.get_by_id(db, user_id)
-        if not existing_user:
+        if if_match is not None:
+            self._check_if_match(db, user_id, if_match)
+
+        try:
+            updated_user = self.repository.update(db, user_id, user_data)
+        except IntegrityError as e:
+            if not is_unique_violation(e):
+                raise
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+                status_code=status.HTTP_409_CONFLICT, detail="Email already exists"
             )
 
-        # 이메일 변경 시 중복 검증
-        if user_data.email:
-            email_user = self.repository.get_by_email(db, user_data.email)
-            if email_user and email_user.id != user_id:
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT, detail="Email already exists"
-                )
+        if not updated_user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+            )
 
-        # 사용자 수정
-        updated_user = self.repository.update(db, user_id, user_data)
-        return UserResponse.model_validate(updated_user)
+        user = UserResponse.model_validate(updated_user)
+        self.cache.set(user_cache_key(user_id), user.model_dump_json().encode())
+        self.cache.set(
+            user_etag_cache_key(user_id), user_etag(user).encode()
+        )
+        return user
 
-    def delete_user(self, db: Session, user_id: int) -> None:
+    def delete_user(
+        self, db: Session, user_id: int, if_match: str | None = None
+    ) -> None:
         """
         사용자 삭제
 
         Args:
             db: 데이터베이스 세션
             user_id: 사용자 ID
+            if_match: If-Match 헤더 값 (지정 시 현재 ETag와 일치할 때만 삭제)
 
         Raises:
-            HTTPException: 사용자를 찾을 수 없으면 404
+            HTTPException: 사용자를 찾을 수 없으면 404, If-Match 불일치 시 412
         """
+        if if_match is not None:
+            self._check_if_match(db, user_id, if_match)
+
         success = self.repository.delete(db, user_id)
+        self.cache.delete(user_cache_key(user_id))
+        self.cache.delete(user_etag_cache_key(user_id))
         if not success:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
             )
+
+    def bulk_update_users(
+        self,
+        db: Session,
+        changes: UserBulkUpdate,
+        filters: UserListFilter,
+        user_ids: list[int] | None = None,
+        chunk_size: int = 1000,
+    ) -> UserBulkWriteResult:
+        """
+        필터 / ID 목록에 해당하는 사용자 일괄 수정
+
+        UPDATE ... WHERE를 chunk_size개 단위 트랜잭션으로 나눠 실행하고 청크마다 캐시를 무효화합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            changes: 수정할 필드
+            filters: 목록 필터
+            user_ids: 대상 사용자 ID 목록 (None이면 필터만 적용)
+            chunk_size: 트랜잭션 하나로 처리할 최대 행 수
+
+        Returns:
+            수정된 행 수와 실행한 트랜잭션 수
+
+        Raises:
+            HTTPException: 수정할 필드가 없거나 대상 조건이 없으면 400
+        """
+        values = changes.model_dump(exclude_unset=True)
+        if not values:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="No fields to update"
+            )
+        self._check_selection(filters, user_ids)
+        return self._apply_chunks(
+            self.repository.update_in_chunks(db, values, filters, user_ids, chunk_size)
+        )
+
+    def bulk_delete_users(
+        self,
+        db: Session,
+        filters: UserListFilter,
+        user_ids: list[int] | None = None,
+        chunk_size: int = 1000,
+    ) -> UserBulkWriteResult:
+        """
+        필터 / ID 목록에 해당하는 사용자 일괄 삭제
+
+        DELETE ... WHERE를 chunk_size개 단위 트랜잭션으로 나눠 실행하고 청크마다 캐시를 무효화합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            filters: 목록 필터
+            user_ids: 대상 사용자 ID 목록 (None이면 필터만 적용)
+            chunk_size: 트랜잭션 하나로 처리할 최대 행 수
+
+        Returns:
+            삭제된 행 수와 실행한 트랜잭션 수
+
+        Raises:
+            HTTPException: 대상 조건이 없으면 400
+        """
+        self._check_selection(filters, user_ids)
+        return self._apply_chunks(
+            self.repository.delete_in_chunks(db, filters, user_ids, chunk_size)
+        )
+
+    @staticmethod
+    def _check_selection(filters: UserListFilter, user_ids: list[int] | None) -> None:
+        """
+        일괄 수정/삭제 대상 조건 검증 (조건 없이 전체 사용자를 수정/삭제하지 않도록)
+
+        Raises:
+            HTTPException: ID 목록과 필터가 모두 없으면 400
+        """
+        if not user_ids and not filters.model_dump(exclude_none=True):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="ids or at least one filter is required",
+            )
+
+    def _apply_chunks(self, chunks: Iterator[tuple[int, list[int]]]) -> UserBulkWriteResult:
+        """청크별 결과를 집계하고 영향받은 사용자의 캐시 무효화"""
+        affected = 0
+        count = 0
+        for chunk_affected, user_ids in chunks:
+            affected += chunk_affected
+            count += 1
+            for user_id in user_ids:
+                self.cache.delete(user_cache_key(user_id))
+                self.cache.delete(user_etag_cache_key(user_id))
+        return UserBulkWriteResult(affected=affected, chunks=count)
+
+    def _check_if_match(self, db: Session, user_id: int, if_match: str) -> None:
+        """
+        If-Match 전제 조건 검증
+
+        행을 잠근 채(SELECT ... FOR UPDATE) 현재 ETag를 계산하고, 같은 트랜잭션에서
+        이어지는 수정/삭제가 커밋될 때까지 다른 요청이 끼어들지 못하게 합니다.
+        캐시는 사용하지 않습니다.
+
+        Raises:
+            HTTPException: 사용자를 찾을 수 없으면 404, ETag 불일치 시 412
+        """
+        row = self.repository.get_etag_fields(db, user_id, for_update=True)
+        if row is None:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+            )
+        if not etag_matches(if_match, user_etag(row)):
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail="Precondition failed",
+            )
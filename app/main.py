@@ -4,14 +4,40 @@ FastAPI 애플리케이션 진입점
 서버 시작 시 실행되는 메인 파일입니다.
 """
 
-from fastapi import FastAPI
+import asyncio
+import logging
+import os
+import time
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from contextlib import asynccontextmanager
+from fastapi.responses import ORJSONResponse
+from contextlib import asynccontextmanager, suppress
+from app import STARTED_AT
+from app.core.admission import (
+    AdaptiveConcurrencyLimit,
+    AdmissionControlMiddleware,
+    parse_route_limits,
+)
 from app.core.config import get_settings
-from app.core.init_db import init_database
+from app.core.deadlines import DeadlineMiddleware, parse_route_timeouts
+from app.core.http_metrics import PrometheusMiddleware
+from app.core.init_db import init_database, startup_duration
+from app.core.logging_config import RequestIdMiddleware, configure_logging, stop_logging
+from app.core.metrics import CONTENT_TYPE_LATEST, generate_latest, run_snapshot_writer
+from app.core.query_stats import QueryStatsMiddleware, install_query_hooks
+from app.core.pool_metrics import pool_status
+from app.core.replicas import (
+    ReadYourWritesMiddleware,
+    replica_set,
+    run_replica_health_checks,
+)
+from app.core.workers import get_concurrency_limit
 from app.features.user.router import router as user_router
+from app.features.user.router import async_router as user_async_router
 
 settings = get_settings()
+logger = logging.getLogger("app")
 
 
 @asynccontextmanager
@@ -19,15 +45,46 @@ async def lifespan(app: FastAPI):
     """
     애플리케이션 수명 주기 관리
 
-    서버 시작 시 데이터베이스 초기화를 수행합니다.
+    서버 시작 시 로깅(워커마다 리스너 스레드 시작)과 데이터베이스 초기화를 수행합니다.
+    멀티 워커 메트릭 모드에서는 워커별 스냅샷 기록 작업을,
+    읽기 복제본이 있으면 복제본 상태 확인 작업을 실행합니다.
+    모듈 import부터 요청을 받을 준비가 될 때까지의 시간을 콜드 스타트 메트릭으로 기록합니다.
     """
     # Startup
-    print("🚀 Starting FastAPI server...")
+    configure_logging(
+        settings.LOG_LEVEL,
+        json_format=settings.LOG_JSON,
+        sql_level=settings.SQL_LOG_LEVEL,
+    )
+    logger.info("Starting FastAPI server")
+    if IMPORT_DURATION is not None:
+        startup_duration.labels("import").observe(IMPORT_DURATION)
     init_database()
-    print(f"✅ Server started: {settings.APP_NAME} v{settings.APP_VERSION}")
+    background_tasks = []
+    if settings.METRICS_ENABLED and settings.METRICS_MULTIPROC_DIR:
+        background_tasks.append(
+            asyncio.create_task(
+                run_snapshot_writer(
+                    settings.METRICS_MULTIPROC_DIR, settings.METRICS_FLUSH_INTERVAL
+                )
+            )
+        )
+    if replica_set:
+        background_tasks.append(
+            asyncio.create_task(
+                run_replica_health_checks(settings.DB_REPLICA_CHECK_INTERVAL)
+            )
+        )
+    startup_duration.labels("total").observe(time.perf_counter() - STARTED_AT)
+    logger.info("Server started: %s v%s", settings.APP_NAME, settings.APP_VERSION)
     yield
     # Shutdown
-    print("👋 Shutting down server...")
+    logger.info("Shutting down server")
+    for task in background_tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    stop_logging()
 
 
 # FastAPI 앱 생성
@@ -36,20 +93,91 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="3-tier 아키텍처 기반의 FastAPI 서버 템플릿",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # dict 등을 반환하는 라우트의 JSON 인코딩
 )
 
-# CORS 설정
+# 요청별 시간 예산 (남은 시간을 DB statement timeout으로 전달, 초과 시 504)
+if settings.REQUEST_TIMEOUT_SECONDS > 0 or settings.ROUTE_TIMEOUTS:
+    app.add_middleware(
+        DeadlineMiddleware,
+        default_timeout=settings.REQUEST_TIMEOUT_SECONDS,
+        route_timeouts=parse_route_timeouts(settings.ROUTE_TIMEOUTS),
+    )
+
+# 요청별 SQL 실행 통계 (X-DB-Queries / Server-Timing 헤더, slow query / N+1 경고)
+# SQL 문 샘플 로그만 사용하는 경우에도 cursor 실행 이벤트는 등록
+if settings.SQL_STATS_ENABLED or settings.SQL_LOG_SAMPLE_RATE > 0:
+    install_query_hooks(settings.SLOW_QUERY_THRESHOLD_MS, settings.SQL_LOG_SAMPLE_RATE)
+if settings.SQL_STATS_ENABLED:
+    app.add_middleware(
+        QueryStatsMiddleware, n_plus_one_threshold=settings.N_PLUS_ONE_THRESHOLD
+    )
+
+# 읽기 복제본 사용 시 쓰기 직후 같은 클라이언트의 읽기를 primary로 보냄
+if replica_set:
+    app.add_middleware(
+        ReadYourWritesMiddleware, window=settings.READ_YOUR_WRITES_SECONDS
+    )
+
+# 수락 제어 (토큰 버킷 초과 429, 동시 처리 한도 초과 503, 거절된 요청도 메트릭에 집계)
+if settings.ADMISSION_ENABLED:
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        concurrency=AdaptiveConcurrencyLimit(
+            get_concurrency_limit(settings),
+            min_limit=settings.ADMISSION_MIN_CONCURRENCY,
+            wait_target=settings.ADMISSION_POOL_WAIT_TARGET_MS / 1000,
+            interval=settings.ADMISSION_ADJUST_INTERVAL,
+        ),
+        client_rate=settings.ADMISSION_CLIENT_RATE,
+        client_burst=settings.ADMISSION_CLIENT_BURST,
+        route_limits=parse_route_limits(settings.ADMISSION_ROUTE_LIMITS),
+        retry_after=settings.ADMISSION_RETRY_AFTER_SECONDS,
+    )
+
+# 요청 메트릭 (수락 제어 / 시간 예산을 포함한 전체 처리 시간을 측정하도록 바깥쪽에 등록)
+if settings.METRICS_ENABLED:
+    app.add_middleware(PrometheusMiddleware)
+
+# 요청 ID (메트릭을 포함한 모든 미들웨어의 로그에 request_id가 기록되도록 CORS 바로 안쪽에 등록)
+app.add_middleware(RequestIdMiddleware)
+
+# CORS (마지막에 등록해 가장 바깥에서 실행: 수락 제어 429/503, 시간 초과 504처럼 미들웨어가
+# 직접 만든 응답에도 CORS 헤더를 붙이고, preflight는 안쪽 미들웨어를 거치지 않고 응답)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # 운영 환경에서는 특정 도메인만 허용
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[
+        "ETag",
+        "X-Total-Count",
+        "X-Total-Count-Estimated",
+        "X-Request-ID",
+        "Retry-After",
+    ],
 )
 
 # 라우터 등록
+# DB_ASYNC=True면 async 라우터를 먼저 등록하여 동일 경로의 CRUD 요청을 async로 처리
+if settings.DB_ASYNC:
+    app.include_router(user_async_router)
 app.include_router(user_router)
 
+# 애플리케이션 모듈 import / 앱 구성에 걸린 시간 (콜드 스타트의 import 단계)
+IMPORT_DURATION: float | None = time.perf_counter() - STARTED_AT
+
+
+def _restart_startup_clock() -> None:
+    """preload 후 fork된 워커는 import 단계 없이 fork 시점부터 콜드 스타트를 측정"""
+    global STARTED_AT, IMPORT_DURATION
+    STARTED_AT, IMPORT_DURATION = time.perf_counter(), None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_startup_clock)
+
 
 @app.get("/", tags=["health"])
 def health_check():
@@ -75,7 +203,31 @@ def health():
     return {"status": "healthy"}
 
 
+@app.get("/health/db", tags=["health"])
+def health_db():
+    """
+    DB 커넥션 풀 상태 엔드포인트
+
+    풀별 checked-out / idle / overflow 커넥션 수와 체크아웃 대기 시간 요약,
+    읽기 복제본별 마지막 상태 확인 결과(정상 여부, 복제 지연)를 반환합니다.
+    """
+    return {"pools": pool_status(), "replicas": replica_set.status()}
+
+
+@app.get("/metrics", tags=["health"], include_in_schema=False)
+def metrics():
+    """
+    Prometheus 메트릭 엔드포인트
+
+    METRICS_MULTIPROC_DIR이 설정되어 있으면 모든 워커의 스냅샷을 합산해 반환합니다.
+    """
+    return Response(
+        generate_latest(settings.METRICS_MULTIPROC_DIR), media_type=CONTENT_TYPE_LATEST
+    )
+
+
 if __name__ == "__main__":
+    # 개발용 단일 프로세스 실행 (운영은 gunicorn -c gunicorn.conf.py app.main:app)
     import uvicorn
 
     uvicorn.run(
@@ -83,4 +235,5 @@ if __name__ == "__main__":
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.DEBUG,
+        log_config=None,  # uvicorn 로그도 configure_logging 형식으로 출력
     )
@@ -0,0 +1,85 @@
+"""
+User 목록 응답 직렬화 마이크로 벤치마크
+
+GET /api/v1/users?limit=N 응답 본문을 만드는 경로별 소요 시간을 비교합니다. DB 없이
+ORM 객체(User)를 메모리에서 생성하므로 직렬화 비용만 측정합니다.
+
+- fastapi_default: 행마다 model_validate → FastAPI response_model 재검증 +
+  jsonable_encoder → JSONResponse (기존 경로)
+- orjson_default: 위와 같지만 ORJSONResponse로 인코딩
+- direct: TypeAdapter(list[UserResponse])로 한 번에 검증하고 pydantic-core가 바로
+  JSON bytes로 직렬화 (중간 dict 없음)
+
+실행 예시:
+    python -m benchmarks.serialization --rows 100 --number 2000
+"""
+
+import argparse
+import asyncio
+import timeit
+from datetime import datetime
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.features.user.entity import User
+from app.features.user.schema import UserResponse, user_list_adapter
+
+
+def make_users(count: int) -> list[User]:
+    now = datetime(2024, 1, 1, 12, 0, 0, 123456)
+    return [
+        User(
+            id=i,
+            email=f"user{i}@example.com",
+            name=f"사용자{i}",
+            age=20 + i % 50,
+            is_active=True,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="User list serialization benchmark")
+    parser.add_argument("--rows", type=int, default=100, help="응답에 담을 사용자 수")
+    parser.add_argument("--number", type=int, default=2000, help="경로별 반복 횟수")
+    args = parser.parse_args(argv)
+
+    users = make_users(args.rows)
+    field = create_response_field(name="response", type_=list[UserResponse])
+    loop = asyncio.new_event_loop()
+
+    def fastapi_path(response_class):
+        content = [UserResponse.model_validate(user) for user in users]
+        body = loop.run_until_complete(
+            serialize_response(field=field, response_content=content)
+        )
+        return response_class(body).body
+
+    def direct_path():
+        return user_list_adapter.dump_json(
+            user_list_adapter.validate_python(users, from_attributes=True)
+        )
+
+    paths = {
+        "fastapi_default": lambda: fastapi_path(JSONResponse),
+        "orjson_default": lambda: fastapi_path(ORJSONResponse),
+        "direct": direct_path,
+    }
+
+    print(f"{args.rows} rows x {args.number} iterations")
+    baseline = None
+    for name, path in paths.items():
+        path()  # 워밍업
+        per_call = min(timeit.repeat(path, number=args.number, repeat=3)) / args.number
+        baseline = baseline or per_call
+        print(f"  {name:<16}{per_call * 1e6:>10.1f} us/response  x{baseline / per_call:.2f}")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+gunicorn 설정 (운영 멀티 워커 실행)
+
+앱을 마스터 프로세스에서 한 번만 import(preload)한 뒤 워커를 fork합니다.
+
+    gunicorn -c gunicorn.conf.py app.main:app
+
+- 워커 수: WEB_CONCURRENCY (0이면 사용 가능한 CPU 수)
+- 워커별 커넥션 풀: DB_MAX_CONNECTIONS를 워커 수로 나눈 값 이하 (app/core/workers.py)
+- fork 후 자식 프로세스는 커넥션 풀을 새로 만들고(app/core/database.py)
+  메트릭을 0부터 다시 집계합니다(app/core/metrics.py).
+- 워커 수를 바꿀 때는 -w 대신 WEB_CONCURRENCY를 사용해야 풀 크기 계산과 일치합니다.
+"""
+
+import glob
+import os
+
+from app.core.config import get_settings
+from app.core.workers import get_pool_limits, get_worker_count
+
+settings = get_settings()
+
+bind = f"{settings.HOST}:{settings.PORT}"
+workers = get_worker_count(settings)
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+timeout = 30
+graceful_timeout = 30
+keepalive = 5
+
+
+def on_starting(server):
+    """마스터 시작 시 이전 실행의 워커 메트릭 스냅샷 삭제 (종료된 pid의 카운터 중복 방지)"""
+    multiproc_dir = settings.METRICS_MULTIPROC_DIR
+    if multiproc_dir:
+        os.makedirs(multiproc_dir, exist_ok=True)
+        for path in glob.glob(os.path.join(multiproc_dir, "metrics_*.json")):
+            os.remove(path)
+    pool_size, max_overflow = get_pool_limits(settings, workers)
+    server.log.info(
+        "Starting %d workers (db pool per worker: size=%d, max_overflow=%d)",
+        workers,
+        pool_size,
+        max_overflow,
+    )
@@ -0,0 +1,72 @@
+"""
+Alembic 마이그레이션 환경
+
+Settings의 DATABASE_URL과 엔티티 메타데이터(Base.metadata)를 사용합니다.
+프로그램에서 실행할 때(init_db의 migrate 모드)는 config.attributes["connection"]으로
+전달된 커넥션을 그대로 사용합니다.
+"""
+
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.pool import NullPool
+from app.core.config import get_settings
+from app.core.database import Base
+from app.core.init_db import include_object_for
+
+# 모든 엔티티 import (Base.metadata에 등록하기 위함)
+from app.features.user.entity import User  # noqa: F401
+
+config = context.config
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def get_url() -> str:
+    return config.get_main_option("sqlalchemy.url") or get_settings().get_database_url()
+
+
+def run_migrations_offline() -> None:
+    """SQL 스크립트 출력 (alembic upgrade head --sql)"""
+    context.configure(
+        url=get_url(),
+        target_metadata=target_metadata,
+        include_object=include_object_for(make_url(get_url()).get_backend_name()),
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object_for(connection.dialect.name),
+        render_as_batch=connection.dialect.name == "sqlite",  # SQLite ALTER 제약 우회
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """DB에 연결해 마이그레이션 실행"""
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+
+    engine = create_engine(get_url(), poolclass=NullPool)
+    with engine.connect() as connection:
+        do_run_migrations(connection)
+    engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
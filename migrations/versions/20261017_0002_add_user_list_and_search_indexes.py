@@ -0,0 +1,63 @@
+"""add user list and search indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 20:16:14.102361
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    # 목록 정렬 / 필터 인덱스 (키셋 페이지네이션)
+    op.create_index("ix_users_created_at_id", "users", ["created_at", "id"])
+    op.create_index("ix_users_name_id", "users", ["name", "id"])
+    op.create_index(
+        "ix_users_is_active_created_at_id", "users", ["is_active", "created_at", "id"]
+    )
+    op.create_index("ix_users_is_active_age", "users", ["is_active", "age"])
+
+    # 검색 인덱스 (app/features/user/entity/user.py 참고)
+    if dialect == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.create_index(
+            "ix_users_email_trgm",
+            "users",
+            ["email"],
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        )
+        op.create_index(
+            "ix_users_name_lower_trgm",
+            "users",
+            [sa.text("lower(name) gin_trgm_ops")],
+            postgresql_using="gin",
+        )
+    else:
+        op.create_index(
+            "ix_users_name_lower", "users", [sa.func.lower(sa.column("name"))]
+        )
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        op.drop_index("ix_users_name_lower_trgm", table_name="users")
+        op.drop_index("ix_users_email_trgm", table_name="users")
+    else:
+        op.drop_index("ix_users_name_lower", table_name="users")
+    op.drop_index("ix_users_is_active_age", table_name="users")
+    op.drop_index("ix_users_is_active_created_at_id", table_name="users")
+    op.drop_index("ix_users_name_id", table_name="users")
+    op.drop_index("ix_users_created_at_id", table_name="users")
@@ -0,0 +1,42 @@
+"""add user search prefix indexes
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 20:16:14.318540
+
+PostgreSQL 전용: 짧은 검색어의 LIKE 접두사 검색용 text_pattern_ops B-tree 인덱스
+(trigram GIN 인덱스는 3자 미만 검색어에 사용할 수 없음)
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.create_index(
+        "ix_users_email_pattern",
+        "users",
+        ["email"],
+        postgresql_ops={"email": "text_pattern_ops"},
+    )
+    op.create_index(
+        "ix_users_name_lower_pattern",
+        "users",
+        [sa.text("lower(name) text_pattern_ops")],
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("ix_users_name_lower_pattern", table_name="users")
+    op.drop_index("ix_users_email_pattern", table_name="users")
@@ -1,46 +1,187 @@
 """
 pytest 설정 및 공통 fixture 정의
+
+- 스키마는 테스트 세션(xdist 워커)마다 한 번만 생성/삭제합니다.
+- db fixture는 테스트마다 바깥 트랜잭션을 열고 세션의 commit은 SAVEPOINT로 처리한 뒤,
+  테스트 종료 시 바깥 트랜잭션을 롤백해 데이터를 초기화합니다.
+- pytest-xdist 병렬 실행(pytest -n auto) 시 워커마다 별도 데이터베이스를 사용합니다.
+- --sqlite-memory 옵션을 주면 파일 대신 인메모리 SQLite를 사용합니다.
 """
 
+import os
+
+# 앱 import 전에 설정: lifespan에서 개발 DB 스키마 작업을 하지 않음 (테스트 스키마는 fixture가 관리)
+os.environ.setdefault("DB_SCHEMA_MODE", "none")
+# 단건 조회 캐시 동작도 테스트 (기본값은 비활성화)
+os.environ.setdefault("CACHE_ENABLED", "True")
+
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 from app.main import app
-from app.core.database import Base
-from app.core.dependencies import get_db
+from app.core.cache import get_cache
+from app.core.database import Base, to_async_url
+from app.core.dependencies import get_db, get_async_db, get_read_db, get_async_read_db
 from app.core.config import get_settings
+from app.core.idempotency import get_idempotency_store
+from app.features.user.router import router as user_router
+from app.features.user.router import async_router as user_async_router
 
 # 테스트 설정
 settings = get_settings()
 
-# 테스트 데이터베이스 엔진 생성
-TEST_DATABASE_URL = settings.get_test_database_url()
-test_engine = create_engine(TEST_DATABASE_URL, pool_pre_ping=True)
-TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+# 테스트 데이터베이스 URL / 엔진 (pytest_configure에서 워커별로 생성)
+TEST_DATABASE_URL: str = ""
+test_engine: Engine | None = None
 
 
-@pytest.fixture(scope="function")
-def db():
+def pytest_addoption(parser):
+    parser.addoption(
+        "--sqlite-memory",
+        action="store_true",
+        default=False,
+        help="TEST_DATABASE_URL 대신 인메모리 SQLite로 테스트",
+    )
+
+
+def worker_database_url(url: str, worker: str) -> URL:
     """
-    테스트용 데이터베이스 세션 fixture
+    xdist 워커별 테스트 데이터베이스 URL
+
+    Args:
+        url: 기본 테스트 데이터베이스 URL
+        worker: 워커 ID (예: gw0, 병렬 실행이 아니면 빈 문자열)
+
+    Returns:
+        SQLite는 파일 이름, 그 외 DB는 데이터베이스 이름에 워커 ID를 붙인 URL
+    """
+    url = make_url(url)
+    if not worker or not url.database or url.database == ":memory:":
+        return url
+    if url.get_backend_name() == "sqlite":
+        root, ext = os.path.splitext(url.database)
+        return url.set(database=f"{root}_{worker}{ext}")
+    return url.set(database=f"{url.database}_{worker}")
+
+
+def ensure_database(url: URL) -> None:
+    """워커별 데이터베이스가 없으면 생성 (PostgreSQL / MySQL)"""
+    backend = url.get_backend_name()
+    if backend == "postgresql":
+        admin_url = url.set(database="postgres")
+        exists_sql = "SELECT 1 FROM pg_database WHERE datname = :name"
+    elif backend in ("mysql", "mariadb"):
+        admin_url = url.set(database=None)
+        exists_sql = "SELECT 1 FROM information_schema.schemata WHERE schema_name = :name"
+    else:
+        return
+
+    admin_engine = create_engine(admin_url, poolclass=NullPool, isolation_level="AUTOCOMMIT")
+    try:
+        with admin_engine.connect() as conn:
+            if conn.execute(text(exists_sql), {"name": url.database}).first() is None:
+                quoted = conn.dialect.identifier_preparer.quote(url.database)
+                conn.exec_driver_sql(f"CREATE DATABASE {quoted}")
+    finally:
+        admin_engine.dispose()
+
+
+def enable_sqlite_savepoints(engine: Engine) -> None:
+    """
+    pysqlite에서 SAVEPOINT를 사용할 수 있도록 트랜잭션을 SQLAlchemy가 직접 시작
+
+    pysqlite 드라이버는 BEGIN을 지연 실행하므로 SAVEPOINT가 바깥 트랜잭션 밖에서
+    실행될 수 있습니다. (SQLAlchemy 문서의 "Serializable isolation / Savepoints" 참고)
+    """
+
+    @event.listens_for(engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+def pytest_configure(config):
+    """워커별 테스트 엔진 생성 (테스트 모듈 import 전에 실행)"""
+    global TEST_DATABASE_URL, test_engine
+
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+    if config.getoption("sqlite_memory"):
+        url = make_url(
+            f"sqlite:///file:testdb_{worker or 'main'}?mode=memory&cache=shared&uri=true"
+        )
+    else:
+        url = worker_database_url(settings.get_test_database_url(), worker)
+        ensure_database(url)
+
+    TEST_DATABASE_URL = url.render_as_string(hide_password=False)
+    if url.get_backend_name() == "sqlite":
+        test_engine = create_engine(url, connect_args={"check_same_thread": False})
+        enable_sqlite_savepoints(test_engine)
+    else:
+        test_engine = create_engine(url, pool_pre_ping=True)
+
 
-    각 테스트마다 새로운 데이터베이스 세션을 생성하고,
-    테스트 종료 시 롤백하여 데이터를 초기화합니다.
+def clear_caches() -> None:
+    """프로세스 내 캐시 초기화 (테스트 간 데이터가 롤백되므로)"""
+    get_cache("user").clear()
+    store = get_idempotency_store()
+    if store is not None:
+        store.backend.clear()
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """
+    테스트 세션 동안 스키마를 유지하는 엔진 fixture
+
+    테이블은 세션 시작 시 한 번 생성하고 종료 시 삭제합니다.
     """
-    # 테이블 생성
+    # 인메모리 SQLite는 마지막 커넥션이 닫히면 사라지므로 세션 동안 커넥션 하나를 유지
+    keepalive = test_engine.connect()
+    Base.metadata.drop_all(bind=test_engine)
     Base.metadata.create_all(bind=test_engine)
+    try:
+        yield test_engine
+    finally:
+        Base.metadata.drop_all(bind=test_engine)
+        keepalive.close()
+        test_engine.dispose()
 
-    # 세션 생성
-    db = TestSessionLocal()
+
+@pytest.fixture(scope="function")
+def db(db_engine):
+    """
+    테스트용 데이터베이스 세션 fixture
+
+    테스트마다 커넥션의 바깥 트랜잭션 안에서 세션을 실행합니다. 세션의 commit은
+    SAVEPOINT 해제로 처리되므로, 테스트 종료 시 바깥 트랜잭션을 롤백하면
+    테스트 중 기록한 데이터가 모두 사라집니다.
+    """
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    db = Session(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        autoflush=False,
+        expire_on_commit=False,
+    )
+    # 테스트마다 ID가 재사용되므로 단건 조회 캐시 / 저장된 Idempotency-Key 응답도 초기화
+    clear_caches()
 
     try:
         yield db
     finally:
-        db.rollback()
         db.close()
-        # 테이블 삭제 (격리된 테스트 환경)
-        Base.metadata.drop_all(bind=test_engine)
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture(scope="function")
@@ -58,6 +199,49 @@ def client(db):
             pass
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="function")
+def async_client(db_engine):
+    """
+    async 라우터 테스트용 FastAPI 클라이언트 fixture
+
+    DB_ASYNC=True 구성과 동일하게 async 라우터를 동기 라우터보다 먼저 등록한 앱을 사용합니다.
+    async 엔진은 별도 커넥션으로 실제 commit하므로, 트랜잭션 롤백 대신 테스트 종료 시
+    모든 테이블의 행을 삭제합니다.
+    """
+    # 이벤트 루프 간 커넥션 공유를 피하기 위해 풀링하지 않음
+    async_engine = create_async_engine(to_async_url(TEST_DATABASE_URL), poolclass=NullPool)
+    AsyncTestSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+    SyncTestSessionLocal = sessionmaker(
+        autoflush=False, expire_on_commit=False, bind=db_engine
+    )
+    clear_caches()
+
+    async def override_get_async_db():
+        async with AsyncTestSessionLocal() as session:
+            yield session
+
+    def override_get_db():
+        with SyncTestSessionLocal() as session:
+            yield session
+
+    async_app = FastAPI()
+    async_app.include_router(user_async_router)
+    async_app.include_router(user_router)
+    async_app.dependency_overrides[get_async_db] = override_get_async_db
+    async_app.dependency_overrides[get_async_read_db] = override_get_async_db
+    async_app.dependency_overrides[get_db] = override_get_db
+    async_app.dependency_overrides[get_read_db] = override_get_db
+
+    try:
+        with TestClient(async_app) as test_client:
+            yield test_client
+    finally:
+        with db_engine.begin() as conn:
+            for table in reversed(Base.metadata.sorted_tables):
+                conn.execute(table.delete())
@@ -0,0 +1,187 @@
+"""
+수락 제어 (토큰 버킷 / 적응형 동시 처리 한도) 테스트
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.core.admission import (
+    AdaptiveConcurrencyLimit,
+    AdmissionControlMiddleware,
+    TokenBucket,
+    parse_route_limits,
+)
+
+
+class FakeWaitTotals:
+    """누적 체크아웃 통계를 직접 지정하는 wait_totals 대체 함수"""
+
+    def __init__(self):
+        self.totals = (0, 0.0, 0.0)
+
+    def __call__(self) -> tuple[int, float, float]:
+        return self.totals
+
+
+def make_client(**options) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(AdmissionControlMiddleware, **options)
+
+    @app.get("/items")
+    def items():
+        return {}
+
+    @app.post("/items")
+    def create_item():
+        return {}
+
+    @app.get("/health")
+    def health():
+        return {}
+
+    return TestClient(app)
+
+
+class TestTokenBucket:
+    """토큰 버킷 / 경로별 제한 설정 테스트"""
+
+    def test_burst_then_refill(self):
+        bucket = TokenBucket(rate=2, burst=2, now=0.0)
+        assert bucket.take(0.0) == 0 and bucket.take(0.0) == 0
+        assert bucket.take(0.0) == pytest.approx(0.5)
+        assert bucket.take(0.5) == 0
+
+    def test_parse_route_limits(self):
+        limits = parse_route_limits("POST /api/v1/users/bulk=1:5, * /api/v1/users=10")
+        assert [(r.method, r.prefix, r.rate, r.burst) for r in limits] == [
+            ("POST", "/api/v1/users/bulk", 1.0, 5.0),
+            ("*", "/api/v1/users", 10.0, 10.0),
+        ]
+        assert limits[1].matches("GET", "/api/v1/users/1")
+        assert limits[1].matches("GET", "/api/v1/users")
+        assert not limits[1].matches("GET", "/api/v1/usersX")
+
+    @pytest.mark.parametrize("value", ["/api=1", "GET /api", "GET /api=0", "GET /api=x"])
+    def test_parse_route_limits_invalid(self, value):
+        with pytest.raises(ValueError):
+            parse_route_limits(value)
+
+
+class TestRateLimit:
+    """429 응답 테스트"""
+
+    def test_client_rate_limit(self):
+        """클라이언트별 버킷이 비면 429와 Retry-After, 헬스 체크는 제외"""
+        client = make_client(client_rate=0.5, client_burst=2)
+        assert client.get("/items").status_code == 200
+        assert client.get("/items").status_code == 200
+
+        response = client.get("/items")
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "2"
+        assert response.json() == {"detail": "Too many requests"}
+        assert client.get("/health").status_code == 200
+
+    def test_route_limit(self):
+        """경로별 제한은 일치하는 메서드 / 경로에만 적용"""
+        client = make_client(route_limits=parse_route_limits("POST /items=0.1:1"))
+        assert client.post("/items").status_code == 200
+        assert client.post("/items").status_code == 429
+        assert client.get("/items").status_code == 200
+
+    def test_preflight_not_limited(self):
+        """CORS preflight(OPTIONS)는 토큰을 쓰지 않음"""
+        client = make_client(client_rate=0.1, client_burst=1)
+        for _ in range(3):
+            assert client.options("/items").status_code != 429
+        assert client.get("/items").status_code == 200
+
+    def test_rejection_has_cors_headers_in_app(self):
+        """앱에서는 CORS가 가장 바깥이므로 429 응답도 브라우저가 읽을 수 있음"""
+        from fastapi.middleware.cors import CORSMiddleware
+        from app.main import app
+
+        assert app.user_middleware[0].cls is CORSMiddleware
+
+        inner = FastAPI()
+        inner.add_middleware(AdmissionControlMiddleware, client_rate=0.1, client_burst=1)
+        inner.add_middleware(CORSMiddleware, allow_origins=["*"], expose_headers=["Retry-After"])
+
+        @inner.get("/items")
+        def items():
+            return {}
+
+        client = TestClient(inner)
+        headers = {"Origin": "https://example.com"}
+        client.get("/items", headers=headers)
+        response = client.get("/items", headers=headers)
+        assert response.status_code == 429
+        assert response.headers["access-control-allow-origin"] == "*"
+        assert "Retry-After" in response.headers["access-control-expose-headers"]
+
+
+class TestAdaptiveConcurrency:
+    """동시 처리 한도 테스트"""
+
+    def test_rejects_over_limit(self):
+        """한도만큼 처리 중이면 503과 Retry-After"""
+        limit = AdaptiveConcurrencyLimit(1, wait_totals=FakeWaitTotals())
+        app = FastAPI()
+        app.add_middleware(AdmissionControlMiddleware, concurrency=limit, retry_after=3)
+
+        @app.get("/slow")
+        async def slow():
+            await asyncio.sleep(0.2)
+            return {}
+
+        @app.get("/fast")
+        async def fast():
+            return {}
+
+        async def run() -> list[int]:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+                slow_task = asyncio.create_task(c.get("/slow"))
+                await asyncio.sleep(0.05)
+                rejected = await c.get("/fast")
+                assert rejected.headers["Retry-After"] == "3"
+                return [(await slow_task).status_code, rejected.status_code]
+
+        assert asyncio.run(run()) == [200, 503]
+        assert limit.in_flight == 0
+
+    def test_decrease_on_pool_wait_and_recover(self):
+        """풀 대기 시간이 목표를 넘으면 줄이고, 대기 없이 한도까지 쓰면 1씩 늘림"""
+        totals = FakeWaitTotals()
+        limit = AdaptiveConcurrencyLimit(
+            8, min_limit=2, wait_target=0.05, interval=1.0, wait_totals=totals
+        )
+
+        totals.totals = (10, 2.0, 0.0)  # 평균 200ms 대기
+        limit.adjust(now=1.0)
+        assert limit.limit == 6
+
+        totals.totals = (20, 2.1, 1.0)  # 체크아웃 타임아웃
+        limit.adjust(now=2.0)
+        assert limit.limit == 4.5
+
+        for _ in range(4):
+            assert limit.try_acquire()
+        assert not limit.try_acquire()
+        totals.totals = (30, 2.11, 1.0)  # 평균 1ms 대기
+        limit.adjust(now=3.0)
+        assert limit.limit == 5.5
+
+        limit.adjust(now=4.0)  # 한도까지 사용되지 않은 구간은 유지
+        assert limit.limit == 5.5
+
+    def test_lower_bound(self):
+        totals = FakeWaitTotals()
+        limit = AdaptiveConcurrencyLimit(4, min_limit=2, wait_totals=totals)
+        for step in range(1, 6):
+            totals.totals = (step, step * 1.0, 0.0)
+            limit.adjust(now=float(step))
+        assert limit.limit == 2
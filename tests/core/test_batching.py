@@ -0,0 +1,104 @@
+"""
+그룹 커밋 배처 테스트
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.core.batching import (
+    AsyncGroupCommitBatcher,
+    GroupCommitAborted,
+    GroupCommitBatcher,
+)
+
+
+class TestGroupCommitBatcher:
+    """리더 / 팔로워 배치 처리 테스트"""
+
+    def test_full_batch_flushes_once(self):
+        """max_size개가 모이면 window를 기다리지 않고 한 번에 flush"""
+        flushes = []
+
+        def flush(db, items):
+            flushes.append((db, list(items)))
+            return [item * 10 for item in items]
+
+        batcher = GroupCommitBatcher("test", flush, window=5.0, max_size=3)
+        results = {}
+        threads = [
+            threading.Thread(target=lambda i=i: results.update({i: batcher.submit(f"db{i}", i)}))
+            for i in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(2)
+
+        assert results == {0: 0, 1: 10, 2: 20}
+        [(db, items)] = flushes
+        assert sorted(items) == [0, 1, 2]
+        assert db == f"db{items[0]}"  # 첫 요청(리더)의 세션 사용
+
+    def test_item_error_only_for_its_caller(self):
+        batcher = GroupCommitBatcher("test", lambda db, items: [ValueError("dup")], window=0.01)
+        with pytest.raises(ValueError):
+            batcher.submit(None, "a")
+
+    def test_flush_error_raised_and_batcher_reusable(self):
+        calls = []
+
+        def flush(db, items):
+            calls.append(items)
+            if len(calls) == 1:
+                raise RuntimeError("db down")
+            return items
+
+        batcher = GroupCommitBatcher("test", flush, window=0.01)
+        with pytest.raises(RuntimeError):
+            batcher.submit(None, "a")
+        assert batcher.submit(None, "b") == "b"
+
+
+class TestAsyncGroupCommitBatcher:
+    def test_concurrent_submits_share_batch(self):
+        flushes = []
+
+        async def flush(db, items):
+            flushes.append(list(items))
+            return [item.upper() for item in items]
+
+        batcher = AsyncGroupCommitBatcher("test", flush, window=0.05, max_size=10)
+
+        async def run():
+            return await asyncio.gather(*(batcher.submit(None, c) for c in "abc"))
+
+        assert asyncio.run(run()) == ["A", "B", "C"]
+        assert flushes == [["a", "b", "c"]]
+
+    def test_leader_cancel_aborts_followers(self):
+        """리더가 취소되면 리더만 CancelledError, 팔로워는 GroupCommitAborted"""
+        flushes = []
+
+        async def flush(db, items):
+            flushes.append(list(items))
+            return list(items)
+
+        batcher = AsyncGroupCommitBatcher("test", flush, window=0.2, max_size=10)
+
+        async def run():
+            leader = asyncio.create_task(batcher.submit(None, "a"))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(batcher.submit(None, "b"))
+            await asyncio.sleep(0)
+            leader.cancel()
+            results = await asyncio.gather(leader, follower, return_exceptions=True)
+            return results, await batcher.submit(None, "c")
+
+        (leader_result, follower_result), after = asyncio.run(run())
+        assert isinstance(leader_result, asyncio.CancelledError)
+        assert isinstance(follower_result, GroupCommitAborted)
+        assert isinstance(follower_result.__cause__, asyncio.CancelledError)
+        assert after == "c"
+        assert flushes == [["c"]]
@@ -0,0 +1,107 @@
+"""
+캐시 백엔드 테스트
+
+LRUCache의 TTL, 용량 제한 및 카운터 동작에 대한 단위 테스트입니다.
+"""
+
+from app.core.cache import LRUCache, NullCache
+from app.core.config import Settings
+
+
+class FakeClock:
+    """테스트용 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUCache:
+    """LRUCache 테스트"""
+
+    def test_hit_and_miss(self):
+        """조회 적중/실패 카운터"""
+        cache = LRUCache(max_size=10, ttl_seconds=60)
+        assert cache.get("a") is None
+        cache.set("a", b"1")
+        assert cache.get("a") == b"1"
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["size"] == 1
+
+    def test_ttl_expiration(self):
+        """TTL이 지난 항목은 조회되지 않음"""
+        clock = FakeClock()
+        cache = LRUCache(max_size=10, ttl_seconds=5, clock=clock)
+        cache.set("a", b"1")
+
+        clock.now = 4.9
+        assert cache.get("a") == b"1"
+        clock.now = 5.0
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_lru_eviction(self):
+        """용량 초과 시 가장 오래 사용되지 않은 항목 제거"""
+        cache = LRUCache(max_size=2, ttl_seconds=60)
+        cache.set("a", b"1")
+        cache.set("b", b"2")
+        cache.get("a")  # a를 최근 사용으로 갱신
+        cache.set("c", b"3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1"
+        assert cache.get("c") == b"3"
+        assert cache.stats()["evictions"] == 1
+
+    def test_add_does_not_overwrite(self):
+        """add는 유효한 기존 값을 덮어쓰지 않음"""
+        clock = FakeClock()
+        cache = LRUCache(max_size=10, ttl_seconds=5, clock=clock)
+        cache.set("a", b"new")
+        assert cache.add("a", b"stale") is False
+        assert cache.get("a") == b"new"
+
+        clock.now = 10
+        assert cache.add("a", b"fresh") is True
+        assert cache.get("a") == b"fresh"
+
+    def test_compare_and_set(self):
+        """저장된 값이 예상 값일 때만 교체 / 삭제"""
+        cache = LRUCache(max_size=10, ttl_seconds=60)
+        cache.set("a", b"1")
+        assert cache.compare_and_set("a", b"0", b"2") is False
+        assert cache.compare_and_set("a", b"1", b"2") is True
+        assert cache.get("a") == b"2"
+        assert cache.compare_and_set("a", b"2", None) is True
+        assert cache.get("a") is None
+        assert cache.compare_and_set("a", b"2", b"3") is False
+
+    def test_delete_and_clear(self):
+        """삭제 및 전체 삭제"""
+        cache = LRUCache(max_size=10, ttl_seconds=60)
+        cache.set("a", b"1")
+        cache.set("b", b"2")
+        cache.delete("a")
+        assert cache.get("a") is None
+        cache.clear()
+        assert cache.stats()["size"] == 0
+
+
+class TestNullCache:
+    """NullCache 테스트"""
+
+    def test_never_stores(self):
+        """값을 저장하지 않음"""
+        cache = NullCache()
+        cache.set("a", b"1")
+        assert cache.get("a") is None
+
+    def test_disabled_by_default(self, monkeypatch):
+        """프로세스 내 캐시는 워커 간 무효화되지 않으므로 기본값은 비활성화"""
+        monkeypatch.delenv("CACHE_ENABLED", raising=False)
+        assert Settings(_env_file=None).CACHE_ENABLED is False
@@ -0,0 +1,161 @@
+"""
+요청별 시간 예산 / DB statement timeout 테스트
+"""
+
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from app.core import deadlines
+from app.core.config import get_settings
+from app.core.deadlines import (
+    DeadlineMiddleware,
+    parse_route_timeouts,
+    request_timeouts,
+)
+
+# 마감 시각까지 끝나지 않는 쿼리 (progress handler가 없으면 수 초 후 종료)
+SLOW_QUERY = """
+WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c WHERE x < 50000000)
+SELECT count(*) FROM c
+"""
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'deadline.db'}", pool_size=1)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(engine):
+    SessionFactory = sessionmaker(bind=engine)
+    app = FastAPI()
+    app.add_middleware(
+        DeadlineMiddleware,
+        default_timeout=0.1,
+        route_timeouts=parse_route_timeouts("GET /unlimited=0"),
+    )
+
+    @app.get("/slow")
+    def slow():
+        with SessionFactory() as db:
+            return {"count": db.execute(text(SLOW_QUERY)).scalar()}
+
+    @app.get("/late")
+    def late():
+        time.sleep(0.15)
+        with SessionFactory() as db:
+            return {"value": db.execute(text("SELECT 1")).scalar()}
+
+    @app.get("/unlimited")
+    def unlimited():
+        return {"remaining": deadlines.remaining_time()}
+
+    return TestClient(app)
+
+
+def timeouts(route: str, reason: str) -> float:
+    return request_timeouts.labels("GET", route, reason).value
+
+
+class TestRouteTimeouts:
+    """시간 예산 설정 테스트"""
+
+    def test_parse_and_match(self):
+        rules = parse_route_timeouts("GET /api/v1/users/export=300, * /api/v1=10")
+        assert rules == [("GET", "/api/v1/users/export", 300.0), ("*", "/api/v1", 10.0)]
+
+        middleware = DeadlineMiddleware(None, default_timeout=30, route_timeouts=rules)
+        assert middleware.budget("GET", "/api/v1/users/export") == 300
+        assert middleware.budget("POST", "/api/v1/users") == 10
+        assert middleware.budget("GET", "/health") == 30
+        assert middleware.budget("GET", "/api/v1x") == 30
+
+    def test_exact_match_rule(self):
+        """$로 끝나는 규칙은 컬렉션 경로에만 적용 (하위 경로 / 비슷한 이름 제외)"""
+        rules = parse_route_timeouts("DELETE /api/v1/users$=300")
+        middleware = DeadlineMiddleware(None, default_timeout=30, route_timeouts=rules)
+        assert middleware.budget("DELETE", "/api/v1/users") == 300
+        assert middleware.budget("DELETE", "/api/v1/users/1") == 30
+        assert middleware.budget("DELETE", "/api/v1/usersX") == 30
+
+    def test_default_bulk_rules_only_for_collection(self):
+        """기본 설정의 일괄 수정/삭제 규칙은 단건 수정/삭제에 적용되지 않음"""
+        rules = parse_route_timeouts(get_settings().ROUTE_TIMEOUTS)
+        middleware = DeadlineMiddleware(None, default_timeout=30, route_timeouts=rules)
+        assert middleware.budget("PATCH", "/api/v1/users") == 300
+        assert middleware.budget("DELETE", "/api/v1/users") == 300
+        assert middleware.budget("PATCH", "/api/v1/users/1") == 30
+        assert middleware.budget("DELETE", "/api/v1/users/1") == 30
+
+    @pytest.mark.parametrize("value", ["GET /api", "/api=1", "GET /api=x"])
+    def test_parse_invalid(self, value):
+        with pytest.raises(ValueError):
+            parse_route_timeouts(value)
+
+    def test_no_deadline_when_budget_is_zero(self, client):
+        assert client.get("/unlimited").json() == {"remaining": None}
+
+
+class TestStatementTimeout:
+    """시간 초과 시 504 응답 / 커넥션 반환 테스트"""
+
+    def test_running_query_cancelled(self, client, engine):
+        """실행 중인 쿼리가 마감 시각에 중단되고 커넥션은 풀에 정상 반환"""
+        before = timeouts("/slow", "statement_timeout")
+        started = time.monotonic()
+        response = client.get("/slow")
+
+        assert response.status_code == 504
+        assert response.json() == {"detail": "Request deadline exceeded"}
+        assert time.monotonic() - started < 2
+        assert timeouts("/slow", "statement_timeout") == before + 1
+
+        assert engine.pool.checkedout() == 0
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT 1")).scalar() == 1
+
+    def test_budget_exhausted_before_query(self, client):
+        """예산을 다 쓴 뒤에는 쿼리를 보내지 않고 504"""
+        before = timeouts("/late", "budget_exhausted")
+        response = client.get("/late")
+        assert response.status_code == 504
+        assert timeouts("/late", "budget_exhausted") == before + 1
+
+    def test_postgresql_sets_local_statement_timeout(self):
+        """PostgreSQL은 문마다 실행 직전의 남은 시간을 SET LOCAL statement_timeout으로 전달"""
+
+        class FakeConnection:
+            class dialect:
+                name = "postgresql"
+
+        class FakeCursor:
+            def __init__(self):
+                self.statements = []
+
+            def execute(self, statement):
+                self.statements.append(statement)
+
+        def apply(cursor: FakeCursor) -> int:
+            deadlines._apply_statement_timeout(
+                FakeConnection(), cursor, "SELECT 1", {}, None, False
+            )
+            return int(cursor.statements[-1].rsplit(" ", 1)[1])
+
+        cursor = FakeCursor()
+        token = deadlines._deadline.set(time.monotonic() + 2.0)
+        try:
+            first = apply(cursor)
+            time.sleep(0.2)
+            second = apply(cursor)  # 같은 트랜잭션의 다음 문은 줄어든 예산
+        finally:
+            deadlines._deadline.reset(token)
+
+        assert all(s.startswith("SET LOCAL statement_timeout = ") for s in cursor.statements)
+        assert 1900 <= first <= 2000
+        assert second <= first - 150
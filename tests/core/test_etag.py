@@ -0,0 +1,31 @@
+"""
+ETag 비교 테스트
+"""
+
+from app.core.etag import etag_matches, make_etag
+
+
+class TestEtag:
+    """조건부 요청 헤더 비교 테스트"""
+
+    def test_make_etag_is_stable(self):
+        """같은 값이면 같은 ETag"""
+        assert make_etag(1, "2024-01-01T00:00:00") == make_etag(
+            1, "2024-01-01T00:00:00"
+        )
+        assert make_etag(1, "2024-01-01T00:00:00") != make_etag(
+            1, "2024-01-01T00:00:01"
+        )
+
+    def test_strong_comparison(self):
+        """If-Match는 강한 비교 (약한 ETag 불일치)"""
+        etag = make_etag(1)
+        assert etag_matches(f'"other", {etag}', etag)
+        assert not etag_matches(f"W/{etag}", etag)
+        assert etag_matches("*", etag)
+
+    def test_weak_comparison(self):
+        """If-None-Match는 약한 비교"""
+        etag = make_etag(1)
+        assert etag_matches(f"W/{etag}", etag, weak=True)
+        assert not etag_matches('"other"', etag, weak=True)
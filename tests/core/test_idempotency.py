@@ -0,0 +1,156 @@
+"""
+Idempotency-Key 저장소 테스트
+"""
+
+import asyncio
+import threading
+
+import orjson
+import pytest
+from fastapi import HTTPException
+from starlette.responses import Response
+
+from app.core.cache import LRUCache
+from app.core.idempotency import IdempotencyStore, request_fingerprint
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def store():
+    return IdempotencyStore(LRUCache(), wait_seconds=2.0, poll_interval=0.005)
+
+
+class TestIdempotencyStore:
+    """선점 / 대기 / 재실행 테스트"""
+
+    def test_fingerprint_ignores_key_order(self):
+        assert request_fingerprint({"a": 1, "b": 2}) == request_fingerprint({"b": 2, "a": 1})
+        assert request_fingerprint({"a": 1}) != request_fingerprint({"a": 2})
+
+    def test_concurrent_duplicate_waits_for_first(self, store):
+        """처리 중인 키의 요청은 기다렸다가 같은 응답을 받음 (실행은 한 번)"""
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def produce() -> Response:
+            calls.append(1)
+            started.set()
+            release.wait(2)
+            return Response(b'{"id":1}', status_code=201, media_type="application/json")
+
+        results = []
+        first = threading.Thread(
+            target=lambda: results.append(store.run("k", "fp", produce))
+        )
+        first.start()
+        started.wait(2)
+        second = threading.Thread(
+            target=lambda: results.append(store.run("k", "fp", produce))
+        )
+        second.start()
+        release.set()
+        first.join()
+        second.join()
+
+        assert len(calls) == 1
+        assert [r.body for r in results] == [b'{"id":1}', b'{"id":1}']
+        assert [r.headers.get("idempotent-replayed") for r in results] == [None, "true"]
+
+    def test_wait_timeout(self):
+        """처리 중인 요청이 대기 시간 안에 끝나지 않으면 409"""
+        store = IdempotencyStore(LRUCache(), wait_seconds=0.02, poll_interval=0.005)
+        store._claim("k", "fp")
+        with pytest.raises(HTTPException) as exc_info:
+            store.run("k", "fp", lambda: Response(b""))
+        assert exc_info.value.status_code == 409
+
+    def test_server_error_releases_key(self, store):
+        """예외 / 5xx는 저장하지 않아 재시도 시 다시 실행"""
+
+        def fail() -> Response:
+            raise RuntimeError("db down")
+
+        with pytest.raises(RuntimeError):
+            store.run("k", "fp", fail)
+        assert store.run("k", "fp", lambda: Response(b"", status_code=503)).status_code == 503
+        assert store.run("k", "fp", lambda: Response(b"ok")).body == b"ok"
+
+    def test_stale_lock_taken_over(self):
+        """다른 프로세스가 선점 후 lock_seconds가 지나도 끝내지 않은 키는 다음 요청이 실행"""
+        clock = Clock()
+        backend = LRUCache()
+        store = IdempotencyStore(backend, lock_seconds=30, clock=clock)
+        backend.set("k", orjson.dumps({"fingerprint": "fp", "started_at": clock.now}))
+        clock.now += 31
+        assert store.run("k", "fp", lambda: Response(b"ok")).body == b"ok"
+
+    def test_running_key_not_taken_over(self):
+        """같은 프로세스에서 실행 중인 키는 lock_seconds가 지나도 넘겨주지 않음"""
+        clock = Clock()
+        store = IdempotencyStore(LRUCache(), lock_seconds=30, wait_seconds=0.02, clock=clock)
+        store._claim("k", "fp")
+        clock.now += 31
+        with pytest.raises(HTTPException) as exc_info:
+            store.run("k", "fp", lambda: Response(b""))
+        assert exc_info.value.status_code == 409
+
+    def test_evicted_pending_claim_not_duplicated(self):
+        """저장소에서 pending 항목이 밀려나도 실행 중인 키는 다시 실행하지 않음"""
+        backend = LRUCache(max_size=1)
+        store = IdempotencyStore(backend, wait_seconds=0.02)
+        store._claim("k", "fp")
+        backend.set("other", b"x")  # "k" eviction
+        assert backend.get("k") is None
+        with pytest.raises(HTTPException) as exc_info:
+            store.run("k", "fp", lambda: Response(b"again"))
+        assert exc_info.value.status_code == 409
+
+    def test_late_original_does_not_overwrite_takeover(self):
+        """키를 넘겨받은 뒤 원래 요청이 늦게 끝나도 저장된 응답을 덮어쓰지 않음"""
+        clock = Clock()
+        backend = LRUCache()
+        original = IdempotencyStore(backend, lock_seconds=30, clock=clock)
+        _, claim = original._claim("k", "fp")
+        clock.now += 31
+        other = IdempotencyStore(backend, lock_seconds=30, clock=clock)
+        assert other.run("k", "fp", lambda: Response(b"new")).body == b"new"
+
+        original._complete("k", claim, Response(b"old"))
+        assert other.run("k", "fp", lambda: Response(b"")).body == b"new"
+
+    def test_async_waiter_woken_without_polling(self):
+        """같은 프로세스의 대기 요청은 폴링 간격과 무관하게 완료 즉시 응답"""
+        store = IdempotencyStore(LRUCache(), wait_seconds=5.0, poll_interval=10.0)
+        calls = []
+
+        async def produce() -> Response:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return Response(b"once")
+
+        async def run() -> list[Response]:
+            return await asyncio.gather(
+                store.run_async("k", "fp", produce), store.run_async("k", "fp", produce)
+            )
+
+        results = asyncio.run(asyncio.wait_for(run(), 2))
+        assert len(calls) == 1
+        assert [r.body for r in results] == [b"once", b"once"]
+
+    def test_run_async(self, store):
+        async def produce() -> Response:
+            return Response(b"async", status_code=201)
+
+        async def run() -> list[Response]:
+            return [await store.run_async("k", "fp", produce) for _ in range(2)]
+
+        first, replay = asyncio.run(run())
+        assert first.body == replay.body == b"async"
+        assert replay.status_code == 201 and replay.headers["idempotent-replayed"] == "true"
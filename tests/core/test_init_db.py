@@ -0,0 +1,79 @@
+"""
+스키마 마이그레이션 / 버전 확인 테스트
+"""
+
+import warnings
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
+from app.core.database import Base
+from app.core.init_db import (
+    SchemaVersionError,
+    check_schema_version,
+    get_alembic_config,
+    get_current_revisions,
+    get_head_revisions,
+    include_object_for,
+    run_migrations,
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'schema.db'}", poolclass=NullPool)
+    yield engine
+    engine.dispose()
+
+
+class TestSchemaVersion:
+    """DB_SCHEMA_MODE=check / migrate 테스트"""
+
+    def test_check_fails_before_migration(self, engine):
+        """마이그레이션되지 않은 DB는 check 실패"""
+        assert get_current_revisions(engine) == set()
+        with pytest.raises(SchemaVersionError):
+            check_schema_version(engine)
+
+    def test_migrate_then_check(self, engine):
+        """upgrade head 후에는 check 통과, 다시 실행해도 변화 없음"""
+        run_migrations(engine)
+        assert get_current_revisions(engine) == get_head_revisions()
+        check_schema_version(engine)
+        run_migrations(engine)
+        check_schema_version(engine)
+
+    def test_migrations_match_entities(self, engine):
+        """마이그레이션 결과 스키마가 엔티티 메타데이터와 일치"""
+        run_migrations(engine)
+        assert _schema_diff(engine) == []
+
+    def test_stamp_baseline_then_upgrade(self, engine):
+        """마이그레이션 도입 전 DB는 0001로 표시 후 upgrade head로 나머지 리비전 적용"""
+        config = get_alembic_config()
+        with engine.begin() as conn:
+            config.attributes["connection"] = conn
+            try:
+                command.upgrade(config, "0001")
+                conn.exec_driver_sql("DROP TABLE alembic_version")  # 기존 create_all DB 상태
+                command.stamp(config, "0001")
+            finally:
+                config.attributes.pop("connection", None)
+
+        run_migrations(engine)
+        assert get_current_revisions(engine) == get_head_revisions()
+        assert _schema_diff(engine) == []
+
+
+def _schema_diff(engine) -> list:
+    """DB 스키마와 엔티티 메타데이터 차이"""
+    with engine.connect() as conn, warnings.catch_warnings():
+        # SQLite는 표현식 인덱스를 리플렉션할 수 없어 비교에서 제외됨
+        warnings.simplefilter("ignore")
+        context = MigrationContext.configure(
+            conn, opts={"include_object": include_object_for("sqlite")}
+        )
+        return compare_metadata(context, Base.metadata)
@@ -0,0 +1,126 @@
+"""
+구조화 로깅 / 요청 ID / SQL 샘플 로그 테스트
+"""
+
+import io
+import logging
+
+import orjson
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.core.config import get_settings
+from app.core.logging_config import (
+    RequestIdMiddleware,
+    configure_logging,
+    get_request_id,
+    stop_logging,
+)
+from app.core.query_stats import install_query_hooks
+from tests.conftest import test_engine
+
+
+@pytest.fixture
+def log_stream():
+    """configure_logging 출력을 담는 버퍼 (테스트 후 핸들러 제거)"""
+    stream = io.StringIO()
+    configure_logging("INFO", stream=stream)
+    yield stream
+    stop_logging()
+
+
+def json_lines(stream: io.StringIO) -> list[dict]:
+    stop_logging()  # 큐에 남은 로그를 모두 출력
+    return [orjson.loads(line) for line in stream.getvalue().splitlines()]
+
+
+@pytest.fixture
+def request_id_client():
+    app = FastAPI()
+    app.add_middleware(RequestIdMiddleware)
+
+    @app.get("/log")
+    def log():
+        logging.getLogger("app.test").info("handled", extra={"user_id": 7})
+        return {"request_id": get_request_id()}
+
+    return TestClient(app)
+
+
+class TestJsonLogging:
+    """JSON 형식 / 큐 기반 출력 테스트"""
+
+    def test_json_line(self, log_stream):
+        """레코드마다 JSON 한 줄, extra 필드 포함"""
+        logging.getLogger("app.test").warning("hello %s", "world", extra={"count": 3})
+        [entry] = json_lines(log_stream)
+        assert entry["level"] == "WARNING"
+        assert entry["logger"] == "app.test"
+        assert entry["message"] == "hello world"
+        assert entry["count"] == 3
+        assert "request_id" not in entry
+
+    def test_exception(self, log_stream):
+        """예외 traceback은 exc_info 필드로 출력"""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logging.getLogger("app.test").exception("failed")
+        [entry] = json_lines(log_stream)
+        assert "ValueError: boom" in entry["exc_info"]
+
+
+class TestRequestId:
+    """X-Request-ID 테스트"""
+
+    def test_generated_and_logged(self, request_id_client, log_stream):
+        """요청 ID가 없으면 생성해 응답 헤더와 로그에 기록"""
+        response = request_id_client.get("/log")
+        request_id = response.headers["X-Request-ID"]
+        assert response.json() == {"request_id": request_id}
+
+        [entry] = [e for e in json_lines(log_stream) if e["logger"] == "app.test"]
+        assert entry["request_id"] == request_id
+        assert entry["user_id"] == 7
+
+    def test_client_request_id(self, request_id_client):
+        """올바른 형식의 요청 ID는 그대로 사용하고, 그 외에는 새로 생성"""
+        response = request_id_client.get("/log", headers={"X-Request-ID": "abc-123"})
+        assert response.headers["X-Request-ID"] == "abc-123"
+
+        response = request_id_client.get("/log", headers={"X-Request-ID": "a b\nc"})
+        assert response.headers["X-Request-ID"] != "a b\nc"
+
+
+class TestSqlStatementLog:
+    """SQL 문 샘플 로그 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def restore_hooks(self):
+        yield
+        install_query_hooks(get_settings().SLOW_QUERY_THRESHOLD_MS)
+
+    def execute(self) -> None:
+        with test_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+    def test_sampled_at_debug(self, caplog):
+        """DEBUG이고 샘플링 비율이 1이면 모든 SQL 문 기록"""
+        install_query_hooks(0, statement_sample_rate=1.0)
+        with caplog.at_level(logging.DEBUG, logger="app.sql.statement"):
+            self.execute()
+        records = [r for r in caplog.records if r.name == "app.sql.statement"]
+        assert records and "SELECT 1" in records[-1].getMessage()
+        assert records[-1].duration_ms >= 0
+
+    def test_not_logged_above_debug_or_without_sampling(self, caplog):
+        """로거 레벨이 DEBUG가 아니거나 샘플링 비율이 0이면 기록하지 않음"""
+        install_query_hooks(0, statement_sample_rate=1.0)
+        with caplog.at_level(logging.INFO, logger="app.sql.statement"):
+            self.execute()
+        install_query_hooks(0, statement_sample_rate=0.0)
+        with caplog.at_level(logging.DEBUG, logger="app.sql.statement"):
+            self.execute()
+        assert not [r for r in caplog.records if r.name == "app.sql.statement"]
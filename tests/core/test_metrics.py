@@ -0,0 +1,136 @@
+"""
+메트릭 테스트
+
+Prometheus text format 출력, 멀티 프로세스 스냅샷 합산, /metrics 엔드포인트에 대한 테스트입니다.
+"""
+
+import json
+import os
+
+from app.core.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    collect,
+    merge_snapshots,
+    read_snapshots,
+    render,
+)
+
+
+def make_registry():
+    registry = MetricsRegistry()
+    requests = Counter("requests_total", "Requests", ("route",), registry=registry)
+    in_flight = Gauge("in_flight", "In flight", registry=registry)
+    latency = Histogram(
+        "latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0), registry=registry
+    )
+    return registry, requests, in_flight, latency
+
+
+class TestRender:
+    """Prometheus text format 출력 테스트"""
+
+    def test_counter_and_gauge(self):
+        """카운터 / 게이지 출력"""
+        registry, requests, in_flight, _ = make_registry()
+        requests.labels("/users").inc()
+        requests.labels("/users").inc()
+        in_flight.set(3)
+
+        text = render(collect(registry))
+
+        assert "# TYPE requests_total counter" in text
+        assert 'requests_total{route="/users"} 2.0' in text
+        assert "in_flight 3.0" in text
+
+    def test_histogram_buckets_cumulative(self):
+        """히스토그램 버킷은 누적값으로 출력"""
+        registry, _, _, latency = make_registry()
+        child = latency.labels("/users")
+        for value in (0.05, 0.5, 0.5, 5.0):
+            child.observe(value)
+
+        text = render(collect(registry))
+
+        assert 'latency_seconds_bucket{route="/users",le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{route="/users",le="1.0"} 3' in text
+        assert 'latency_seconds_bucket{route="/users",le="+Inf"} 4' in text
+        assert 'latency_seconds_count{route="/users"} 4' in text
+        assert 'latency_seconds_sum{route="/users"} 6.05' in text
+
+    def test_label_escaping(self):
+        """라벨 값 이스케이프"""
+        registry, requests, _, _ = make_registry()
+        requests.labels('a"b\\c').inc()
+
+        assert 'requests_total{route="a\\"b\\\\c"} 1.0' in render(collect(registry))
+
+
+class TestMultiprocess:
+    """멀티 프로세스 스냅샷 합산 테스트"""
+
+    def test_merge_sums_and_drops_dead_gauges(self):
+        """카운터 / 히스토그램은 모두 합산, 게이지는 실행 중인 프로세스만 합산"""
+        registry, requests, in_flight, latency = make_registry()
+        requests.labels("/users").inc()
+        in_flight.set(2)
+        latency.labels("/users").observe(0.5)
+        snapshot = collect(registry)
+
+        merged = merge_snapshots([(snapshot, True), (snapshot, False)])
+
+        text = render(merged)
+        assert 'requests_total{route="/users"} 2.0' in text
+        assert "in_flight 2.0" in text
+        assert 'latency_seconds_count{route="/users"} 2' in text
+        # 합산이 원본 스냅샷을 변경하지 않음
+        assert snapshot["latency_seconds"]["samples"][0][1]["count"] == 1
+
+    def test_read_snapshots(self, tmp_path):
+        """디렉터리의 워커별 스냅샷 읽기"""
+        registry, requests, _, _ = make_registry()
+        requests.labels("/users").inc()
+        for pid in (os.getpid(), 2**22 + 1):  # 두 번째는 존재하지 않는 pid
+            path = tmp_path / f"metrics_{pid}.json"
+            path.write_text(json.dumps({"pid": pid, "metrics": collect(registry)}))
+
+        text = render(read_snapshots(str(tmp_path)))
+
+        assert 'requests_total{route="/users"} 2.0' in text
+
+
+class TestMetricsEndpoint:
+    """/metrics 엔드포인트 테스트"""
+
+    def test_route_template_labels(self, client):
+        """실제 경로가 아닌 라우트 템플릿으로 집계"""
+        client.get("/api/v1/users/999999")
+        client.get("/no-such-path")
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        text = response.text
+        assert (
+            'http_requests_total{method="GET",route="/api/v1/users/{user_id}",status="4xx"}'
+            in text
+        )
+        assert 'route="<unmatched>",status="4xx"}' in text
+        assert "/api/v1/users/999999" not in text
+        assert (
+            'http_request_duration_seconds_bucket{method="GET",'
+            'route="/api/v1/users/{user_id}",le="+Inf"}' in text
+        )
+        assert 'http_requests_in_flight{method="GET"} 1.0' in text
+        assert 'cache_misses_total{namespace="user"}' in text
+        assert 'db_pool_checked_out{pool="primary"}' in text
+
+    def test_nonstandard_method_label(self, client):
+        """임의의 메서드는 method="other" 하나로 집계"""
+        client.request("FOOBAR", "/api/v1/users")
+        text = client.get("/metrics").text
+        assert "FOOBAR" not in text
+        assert 'http_requests_total{method="other",' in text
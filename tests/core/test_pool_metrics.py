@@ -0,0 +1,76 @@
+"""
+커넥션 풀 메트릭 테스트
+
+InstrumentedQueuePool의 체크아웃 대기 시간 / 타임아웃 집계와 풀 상태 조회에 대한 테스트입니다.
+"""
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.core.pool_metrics import InstrumentedQueuePool, instrument_engine, pool_status
+
+
+@pytest.fixture
+def pool_engine(tmp_path):
+    """pool_size=1, overflow 없음, 짧은 타임아웃의 계측 엔진"""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+        pool_logging_name="test_pool",
+    )
+    instrument_engine(engine, "test_pool")
+    yield engine
+    engine.dispose()
+
+
+class TestPoolMetrics:
+    """커넥션 풀 메트릭 테스트"""
+
+    def test_checkout_recorded(self, pool_engine):
+        """체크아웃 횟수, 대기 시간, 사용 중 커넥션 수 집계"""
+        before = pool_status()["test_pool"]
+
+        with pool_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            status = pool_status()["test_pool"]
+            assert status["checked_out"] == 1
+            assert status["size"] == 1
+
+        status = pool_status()["test_pool"]
+        assert status["checked_out"] == 0
+        assert status["idle"] == 1
+        assert status["checkouts"] == before["checkouts"] + 1
+        wait = status["checkout_wait_seconds"]
+        assert wait["count"] == before["checkout_wait_seconds"]["count"] + 1
+
+    def test_checkout_timeout_counted(self, pool_engine):
+        """풀 고갈 시 타임아웃 집계"""
+        before = pool_status()["test_pool"]["checkout_timeouts"]
+
+        with pool_engine.connect():
+            with pytest.raises(PoolTimeoutError):
+                pool_engine.connect()
+
+        assert pool_status()["test_pool"]["checkout_timeouts"] == before + 1
+
+    def test_label_survives_dispose(self, pool_engine):
+        """dispose()로 풀이 재생성되어도 같은 라벨로 집계"""
+        pool_engine.dispose()
+        assert isinstance(pool_engine.pool, InstrumentedQueuePool)
+        before = pool_status()["test_pool"]["checkout_wait_seconds"]["count"]
+
+        with pool_engine.connect():
+            pass
+
+        assert pool_status()["test_pool"]["checkout_wait_seconds"]["count"] == before + 1
+
+
+def test_health_db_endpoint(client):
+    """풀 상태 엔드포인트"""
+    response = client.get("/health/db")
+    assert response.status_code == 200
+    assert "primary" in response.json()["pools"]
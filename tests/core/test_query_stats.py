@@ -0,0 +1,92 @@
+"""
+요청별 SQL 실행 통계 테스트
+
+응답 헤더, N+1 경고, slow query 로그에 대한 테스트입니다.
+"""
+
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.core.config import get_settings
+from app.core.query_stats import (
+    EXPECTED_REPEAT_OPTION,
+    QueryStatsMiddleware,
+    install_query_hooks,
+)
+from tests.conftest import test_engine
+
+
+@pytest.fixture
+def repeat_client():
+    """같은 SQL을 count번 실행하는 엔드포인트를 가진 앱"""
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware, n_plus_one_threshold=3)
+
+    @app.get("/repeat/{count}")
+    def repeat(count: int):
+        with test_engine.connect() as conn:
+            for _ in range(count):
+                conn.execute(text("SELECT 1"))
+        return {}
+
+    @app.get("/chunks/{count}")
+    def chunks(count: int):
+        stmt = text("SELECT 1").execution_options(**{EXPECTED_REPEAT_OPTION: True})
+        with test_engine.connect() as conn:
+            for _ in range(count):
+                conn.execute(stmt)
+        return {}
+
+    with TestClient(app) as client:
+        yield client
+
+
+class TestQueryStats:
+    """요청별 SQL 실행 통계 테스트"""
+
+    def test_headers(self, client):
+        """응답에 SQL 실행 수와 Server-Timing 헤더 추가"""
+        response = client.post(
+            "/api/v1/users", json={"email": "stats@example.com", "name": "통계"}
+        )
+
+        assert response.status_code == 201
+        assert response.headers["X-DB-Queries"] == "1"
+        assert response.headers["Server-Timing"].startswith("db;dur=")
+
+    def test_n_plus_one_warning(self, repeat_client, caplog):
+        """같은 SQL이 기준 횟수를 넘게 반복되면 경고"""
+        with caplog.at_level(logging.WARNING, logger="app.sql"):
+            response = repeat_client.get("/repeat/3")
+            assert response.headers["X-DB-Queries"] == "3"
+            assert not [r for r in caplog.records if "N+1" in r.getMessage()]
+
+            repeat_client.get("/repeat/4")
+
+        warnings = [r.getMessage() for r in caplog.records if "N+1" in r.getMessage()]
+        assert len(warnings) == 1
+        assert "/repeat/{count}" in warnings[0]
+        assert "4 times: SELECT 1" in warnings[0]
+
+    def test_expected_repeat_not_warned(self, repeat_client, caplog):
+        """반복이 의도된 문(청크 일괄 작업)은 실행 수에만 포함하고 N+1 경고하지 않음"""
+        with caplog.at_level(logging.WARNING, logger="app.sql"):
+            response = repeat_client.get("/chunks/5")
+
+        assert response.headers["X-DB-Queries"] == "5"
+        assert not [r for r in caplog.records if "N+1" in r.getMessage()]
+
+    def test_slow_query_log(self, repeat_client, caplog):
+        """기준 시간을 넘는 SQL은 slow query 로그로 기록"""
+        install_query_hooks(1e-6)
+        try:
+            with caplog.at_level(logging.WARNING, logger="app.sql.slow"):
+                repeat_client.get("/repeat/1")
+        finally:
+            install_query_hooks(get_settings().SLOW_QUERY_THRESHOLD_MS)
+
+        assert any("slow query" in r.getMessage() for r in caplog.records)
@@ -0,0 +1,233 @@
+"""
+읽기 복제본 라우팅 테스트
+"""
+
+import asyncio
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import NullPool
+from app.core import replicas
+from app.core.cache import LRUCache
+from app.core.database import REPLICA_SESSION_INFO
+from app.core.database import engine as primary_engine
+from app.core.replicas import (
+    READ_YOUR_WRITES_COOKIE,
+    READ_YOUR_WRITES_HEADER,
+    ReadYourWritesMiddleware,
+    Replica,
+    ReplicaSet,
+    get_read_db,
+)
+from app.features.user.entity import User
+from app.features.user.service import UserService
+from app.features.user.service.user_service import user_cache_key, user_etag_cache_key
+
+
+@pytest.fixture
+def replica_engines(tmp_path):
+    engines = [
+        create_engine(f"sqlite:///{tmp_path / f'replica{i}.db'}", poolclass=NullPool)
+        for i in range(2)
+    ]
+    yield engines
+    for engine in engines:
+        engine.dispose()
+
+
+@pytest.fixture
+def down_engine(tmp_path):
+    """연결할 수 없는 복제본 (존재하지 않는 디렉터리)"""
+    url = f"sqlite:///{tmp_path / 'missing' / 'replica.db'}"
+    return create_engine(url, poolclass=NullPool)
+
+
+def read_bind(replica_set, monkeypatch) -> object:
+    """get_read_db가 선택한 세션의 엔진"""
+    monkeypatch.setattr(replicas, "replica_set", replica_set)
+    dependency = get_read_db()
+    db = next(dependency)
+    bind = db.get_bind()
+    dependency.close()
+    return bind
+
+
+class TestReplicaSet:
+    """복제본 선택 / 상태 확인 테스트"""
+
+    def test_round_robin(self, replica_engines):
+        """정상 복제본을 번갈아 선택"""
+        replica_set = ReplicaSet(
+            [Replica(f"replica_{i}", engine) for i, engine in enumerate(replica_engines)]
+        )
+        chosen = [replica_set.choose().name for _ in range(4)]
+        assert chosen == ["replica_0", "replica_1", "replica_0", "replica_1"]
+
+    def test_check_marks_unreachable_replica_down(self, replica_engines, down_engine):
+        """연결 실패한 복제본은 제외되고, 모두 실패하면 None"""
+        up, down = Replica("up", replica_engines[0]), Replica("down", down_engine)
+        replica_set = ReplicaSet([down, up])
+        replica_set.refresh()
+        assert not down.healthy and up.healthy
+        assert {replica_set.choose().name for _ in range(3)} == {"up"}
+
+        replica_set.mark_down(up, "test")
+        assert replica_set.choose() is None
+
+    def test_check_lagging_replica(self, replica_engines, monkeypatch):
+        """복제 지연이 기준을 넘으면 제외, 회복하면 다시 사용"""
+        replica = Replica("lagging", replica_engines[0])
+        replica_set = ReplicaSet([replica], max_lag=5.0)
+
+        monkeypatch.setattr(replicas, "measure_replication_lag", lambda conn: 30.0)
+        replica_set.check(replica)
+        assert not replica.healthy and replica.lag == 30.0
+
+        monkeypatch.setattr(replicas, "measure_replication_lag", lambda conn: 0.5)
+        replica_set.check(replica)
+        assert replica.healthy
+
+
+    def test_check_survives_non_dbapi_error(self, replica_engines, monkeypatch):
+        """풀 타임아웃 등 DBAPIError가 아닌 오류도 복제본만 제외하고 나머지 확인은 계속"""
+        failing, up = Replica("failing", replica_engines[0]), Replica("up", replica_engines[1])
+        replica_set = ReplicaSet([failing, up])
+
+        def connect():
+            raise PoolTimeoutError("QueuePool limit reached")
+
+        monkeypatch.setattr(failing.engine, "connect", connect)
+        replica_set.refresh()
+        assert not failing.healthy and up.healthy
+
+    def test_health_check_loop_keeps_running(self, monkeypatch):
+        """한 번의 확인이 예외로 끝나도 백그라운드 작업은 계속 실행"""
+        calls = []
+
+        def refresh():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("bug")
+
+        monkeypatch.setattr(replicas.replica_set, "refresh", refresh)
+
+        async def run():
+            task = asyncio.create_task(replicas.run_replica_health_checks(0.001))
+            while len(calls) < 2:
+                await asyncio.sleep(0.001)
+            task.cancel()
+
+        asyncio.run(asyncio.wait_for(run(), 2))
+        assert len(calls) >= 2
+
+
+class TestReadRouting:
+    """get_read_db 라우팅 테스트"""
+
+    def test_without_replicas_uses_primary(self, monkeypatch):
+        assert read_bind(ReplicaSet([]), monkeypatch) is primary_engine
+
+    def test_uses_replica(self, replica_engines, monkeypatch):
+        replica_set = ReplicaSet([Replica("replica_1", replica_engines[0])])
+        assert read_bind(replica_set, monkeypatch) is replica_engines[0]
+
+    def test_read_your_writes_uses_primary(self, replica_engines, monkeypatch):
+        replica_set = ReplicaSet([Replica("replica_1", replica_engines[0])])
+        token = replicas._prefer_primary.set(True)
+        try:
+            assert read_bind(replica_set, monkeypatch) is primary_engine
+        finally:
+            replicas._prefer_primary.reset(token)
+
+    def test_connection_failure_falls_back_to_primary(self, down_engine, monkeypatch):
+        """복제본 연결 실패 시 요청은 primary로 처리되고 복제본은 제외"""
+        replica = Replica("replica_1", down_engine)
+        replica_set = ReplicaSet([replica])
+        assert read_bind(replica_set, monkeypatch) is primary_engine
+        assert not replica.healthy
+
+
+    def test_pool_timeout_falls_back_to_primary(self, replica_engines, monkeypatch):
+        """복제본 풀 체크아웃 타임아웃(DBAPIError 아님)도 primary로 대체"""
+        replica = Replica("replica_1", replica_engines[0])
+
+        def connect(*args, **kwargs):
+            raise PoolTimeoutError("QueuePool limit reached")
+
+        monkeypatch.setattr(replica.engine, "connect", connect)
+        assert read_bind(ReplicaSet([replica]), monkeypatch) is primary_engine
+        assert not replica.healthy
+
+
+class TestReadYourWritesMiddleware:
+    """쓰기 후 primary 읽기 쿠키 테스트"""
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.add_middleware(ReadYourWritesMiddleware, window=5)
+
+        @app.get("/read")
+        def read():
+            return {"primary": replicas._prefer_primary.get()}
+
+        @app.post("/write")
+        def write(fail: bool = False):
+            if fail:
+                raise HTTPException(status_code=400)
+            return {}
+
+        @app.post("/lookup")
+        def lookup(db=Depends(get_read_db)):
+            return {}
+
+        return TestClient(app)
+
+    def test_successful_write_pins_reads_to_primary(self, client):
+        assert client.get("/read").json() == {"primary": False}
+        response = client.post("/write")
+        assert f"{READ_YOUR_WRITES_COOKIE}=1" in response.headers["set-cookie"]
+        assert "Max-Age=5" in response.headers["set-cookie"]
+        assert client.get("/read").json() == {"primary": True}
+
+    def test_failed_write_does_not_set_cookie(self, client):
+        response = client.post("/write?fail=true")
+        assert "set-cookie" not in response.headers
+        assert client.get("/read").json() == {"primary": False}
+
+    def test_read_only_post_does_not_set_cookie(self, client):
+        """읽기 세션만 사용하는 POST(일괄 조회 등)는 쓰기로 보지 않음"""
+        response = client.post("/lookup")
+        assert response.status_code == 200
+        assert "set-cookie" not in response.headers
+
+    def test_header_opt_in(self, client):
+        """쿠키를 보관하지 않는 클라이언트는 헤더로 primary 읽기 요청"""
+        header = READ_YOUR_WRITES_HEADER.decode()
+        assert client.get("/read", headers={header: "1"}).json() == {"primary": True}
+
+
+class TestReplicaCacheFill:
+    """복제본에서 읽은 값은 공유 캐시에 채우지 않음"""
+
+    def test_replica_reads_do_not_fill_cache(self, db):
+        user = User(email="replica@example.com", name="복제본")
+        db.add(user)
+        db.commit()
+        cache = LRUCache()
+        service = UserService(cache=cache)
+
+        db.info[REPLICA_SESSION_INFO] = "replica0"
+        try:
+            assert service.get_user_by_id(db, user.id).id == user.id
+            service.get_user_etag(db, user.id)
+            assert cache.get(user_cache_key(user.id)) is None
+            assert cache.get(user_etag_cache_key(user.id)) is None
+        finally:
+            del db.info[REPLICA_SESSION_INFO]
+
+        service.get_user_by_id(db, user.id)
+        assert cache.get(user_cache_key(user.id)) is not None
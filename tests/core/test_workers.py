@@ -0,0 +1,64 @@
+"""
+워커 수 / 풀 크기 계산 및 fork 후 상태 초기화 테스트
+"""
+
+import os
+
+import pytest
+from app.core.config import Settings
+from app.core.database import engine
+from app.core.metrics import Counter, Histogram, MetricsRegistry
+from app.core.workers import available_cpus, get_pool_limits, get_worker_count
+
+
+class TestWorkerSizing:
+    """워커 수 / 워커별 커넥션 풀 크기 계산 테스트"""
+
+    def test_worker_count(self):
+        """WEB_CONCURRENCY가 없으면 사용 가능한 CPU 수"""
+        assert get_worker_count(Settings(WEB_CONCURRENCY=0)) == available_cpus()
+        assert get_worker_count(Settings(WEB_CONCURRENCY=3)) == 3
+
+    def test_pool_limits_without_budget(self):
+        """DB_MAX_CONNECTIONS가 없으면 풀 설정 그대로"""
+        settings = Settings(DB_POOL_SIZE=5, DB_MAX_OVERFLOW=10, DB_MAX_CONNECTIONS=0)
+        assert get_pool_limits(settings, workers=8) == (5, 10)
+
+    def test_pool_limits_split_budget(self):
+        """커넥션 상한을 워커 수로 나눠 pool_size부터 채움"""
+        settings = Settings(DB_POOL_SIZE=5, DB_MAX_OVERFLOW=10, DB_MAX_CONNECTIONS=100)
+        assert get_pool_limits(settings, workers=4) == (5, 10)
+        assert get_pool_limits(settings, workers=10) == (5, 5)
+        assert get_pool_limits(settings, workers=50) == (2, 0)
+        assert get_pool_limits(settings, workers=200) == (1, 0)
+
+
+class TestAfterFork:
+    """fork된 자식 프로세스 상태 초기화 테스트"""
+
+    def test_metrics_reset_keeps_children(self):
+        """값만 초기화하고 child 참조는 유지"""
+        registry = MetricsRegistry()
+        counter = Counter("forked_total", "test", ("route",), registry=registry)
+        histogram = Histogram("forked_seconds", "test", registry=registry)
+        child = counter.labels("/users")
+        child.inc(3)
+        histogram.observe(0.2)
+
+        registry.reset()
+
+        assert counter.labels("/users") is child
+        assert child.get() == 0
+        assert histogram.labels().count == 0
+        assert sum(histogram.labels().bucket_counts) == 0
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="fork 미지원 플랫폼")
+    def test_child_gets_new_pool(self):
+        """fork된 자식은 부모와 다른 커넥션 풀을 사용"""
+        parent_pool = engine.pool
+        pid = os.fork()
+        if pid == 0:
+            os._exit(0 if engine.pool is not parent_pool else 1)
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert engine.pool is parent_pool
@@ -0,0 +1,140 @@
+"""
+User Async Router 테스트
+
+DB_ASYNC=True일 때 사용하는 async 사용자 관리 API 엔드포인트에 대한 통합 테스트입니다.
+"""
+
+from fastapi import status
+
+
+class TestAsyncUserCrud:
+    """async 사용자 CRUD API 테스트"""
+
+    def test_create_and_get_user(self, async_client):
+        """사용자 생성 후 단건 조회"""
+        response = async_client.post(
+            "/api/v1/users",
+            json={"email": "Async@Example.com", "name": "홍길동", "age": 25},
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()
+        assert data["email"] == "async@example.com"
+
+        response = async_client.get(f"/api/v1/users/{data['id']}")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["name"] == "홍길동"
+
+    def test_create_user_duplicate_email(self, async_client):
+        """중복 이메일로 사용자 생성 시도"""
+        payload = {"email": "dup@example.com", "name": "사용자"}
+        async_client.post("/api/v1/users", json=payload)
+        response = async_client.post("/api/v1/users", json=payload)
+        assert response.status_code == status.HTTP_409_CONFLICT
+
+    def test_create_user_idempotency_key(self, async_client):
+        """같은 Idempotency-Key의 재시도는 저장된 응답 반환"""
+        payload = {"email": "retry@example.com", "name": "재시도"}
+        headers = {"Idempotency-Key": "async-create-1"}
+        first = async_client.post("/api/v1/users", json=payload, headers=headers)
+        retry = async_client.post("/api/v1/users", json=payload, headers=headers)
+        assert first.status_code == retry.status_code == status.HTTP_201_CREATED
+        assert retry.json() == first.json()
+        assert retry.headers["Idempotent-Replayed"] == "true"
+
+    def test_create_user_group_commit(self, async_client, monkeypatch):
+        """그룹 커밋 모드에서도 생성 / 중복 409 응답은 동일"""
+        from app.features.user.router import user_async_router
+        from app.features.user.service import AsyncUserService
+
+        monkeypatch.setattr(
+            user_async_router,
+            "user_service",
+            AsyncUserService(create_batch_window=0.01, create_batch_max_size=10),
+        )
+        payload = {"email": "batch@example.com", "name": "배치"}
+        created = async_client.post("/api/v1/users", json=payload)
+        assert created.status_code == status.HTTP_201_CREATED
+        assert created.json()["email"] == "batch@example.com"
+        duplicate = async_client.post("/api/v1/users", json=payload)
+        assert duplicate.status_code == status.HTTP_409_CONFLICT
+
+    def test_get_users_cursor(self, async_client):
+        """커서 기반 목록 조회"""
+        for i in range(3):
+            async_client.post(
+                "/api/v1/users",
+                json={"email": f"user{i}@example.com", "name": f"사용자{i}"},
+            )
+
+        response = async_client.get("/api/v1/users?pagination=cursor&limit=2")
+        page = response.json()
+        assert len(page["items"]) == 2
+        response = async_client.get(f"/api/v1/users?cursor={page['next_cursor']}")
+        page = response.json()
+        assert len(page["items"]) == 1
+        assert page["next_cursor"] is None
+
+    def test_get_users_filter_sort(self, async_client):
+        """필터/정렬 목록 조회와 X-Total-Count"""
+        for i, age in enumerate([20, 30, 40]):
+            async_client.post(
+                "/api/v1/users",
+                json={"email": f"user{i}@example.com", "name": f"사용자{i}", "age": age},
+            )
+
+        response = async_client.get(
+            "/api/v1/users?min_age=25&sort=-name&pagination=cursor&limit=1&count=exact"
+        )
+        page = response.json()
+        assert response.headers["X-Total-Count"] == "2"
+        assert [user["name"] for user in page["items"]] == ["사용자2"]
+        response = async_client.get(
+            f"/api/v1/users?min_age=25&sort=-name&cursor={page['next_cursor']}"
+        )
+        assert [user["name"] for user in response.json()["items"]] == ["사용자1"]
+
+    def test_update_and_delete_user(self, async_client):
+        """사용자 수정 후 삭제"""
+        user_id = async_client.post(
+            "/api/v1/users", json={"email": "test@example.com", "name": "홍길동"}
+        ).json()["id"]
+
+        response = async_client.put(f"/api/v1/users/{user_id}", json={"age": 30})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["age"] == 30
+
+        response = async_client.delete(f"/api/v1/users/{user_id}")
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        response = async_client.get(f"/api/v1/users/{user_id}")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_non_integer_id_falls_through_to_sync_router(self, async_client):
+        """정수가 아닌 경로는 동기 라우터로 전달되어 검증 오류 반환"""
+        response = async_client.get("/api/v1/users/abc")
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_conditional_requests(self, async_client):
+        """ETag 조건부 조회 / 수정"""
+        user_id = async_client.post(
+            "/api/v1/users", json={"email": "etag@example.com", "name": "사용자"}
+        ).json()["id"]
+        etag = async_client.get(f"/api/v1/users/{user_id}").headers["ETag"]
+
+        response = async_client.get(
+            f"/api/v1/users/{user_id}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        response = async_client.put(
+            f"/api/v1/users/{user_id}",
+            json={"age": 30},
+            headers={"If-Match": '"stale"'},
+        )
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+        response = async_client.put(
+            f"/api/v1/users/{user_id}",
+            json={"age": 30},
+            headers={"If-Match": etag},
+        )
+        assert response.status_code == status.HTTP_200_OK
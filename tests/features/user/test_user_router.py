@@ -4,10 +4,32 @@ User Router 테스트
 사용자 관리 API 엔드포인트에 대한 통합 테스트입니다.
 """
 
+import csv
+import io
+import json
+
 import pytest
 from fastapi import status
 
 
+@pytest.fixture
+def statements():
+    from sqlalchemy import event
+    from app.core.query_stats import is_transaction_control
+    from tests.conftest import test_engine
+
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        # 테스트 fixture의 SAVEPOINT / RELEASE 제외
+        if not is_transaction_control(statement):
+            executed.append(statement.split()[0].upper())
+
+    event.listen(test_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(test_engine, "before_cursor_execute", record)
+
+
 class TestUserCreate:
     """사용자 생성 API 테스트"""
 
@@ -90,6 +112,214 @@ class TestUserCreate:
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
 
+class TestUserIdempotency:
+    """Idempotency-Key 재시도 테스트"""
+
+    payload = {"email": "retry@example.com", "name": "재시도"}
+
+    def test_retry_replays_first_response(self, client, statements):
+        """같은 키의 재시도는 INSERT 없이 처음 응답 반환"""
+        headers = {"Idempotency-Key": "create-1"}
+        first = client.post("/api/v1/users", json=self.payload, headers=headers)
+        assert first.status_code == status.HTTP_201_CREATED
+        assert statements == ["INSERT"]
+
+        retry = client.post("/api/v1/users", json=self.payload, headers=headers)
+        assert retry.status_code == status.HTTP_201_CREATED
+        assert retry.json() == first.json()
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        assert statements == ["INSERT"]
+
+    def test_without_key_duplicate_conflicts(self, client):
+        """키 없이 재시도하면 기존처럼 409"""
+        client.post("/api/v1/users", json=self.payload)
+        response = client.post("/api/v1/users", json=self.payload)
+        assert response.status_code == status.HTTP_409_CONFLICT
+
+    def test_key_reused_with_different_payload(self, client):
+        """같은 키로 다른 내용을 보내면 422"""
+        headers = {"Idempotency-Key": "create-2"}
+        client.post("/api/v1/users", json=self.payload, headers=headers)
+        response = client.post(
+            "/api/v1/users",
+            json={**self.payload, "name": "다른 이름"},
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_client_error_is_replayed(self, client):
+        """4xx 응답도 저장해 같은 결과를 반환"""
+        client.post("/api/v1/users", json=self.payload)
+        headers = {"Idempotency-Key": "create-3"}
+        first = client.post("/api/v1/users", json=self.payload, headers=headers)
+        assert first.status_code == status.HTTP_409_CONFLICT
+
+        client.delete(f"/api/v1/users/{client.get('/api/v1/users').json()[0]['id']}")
+        retry = client.post("/api/v1/users", json=self.payload, headers=headers)
+        assert retry.status_code == status.HTTP_409_CONFLICT
+        assert retry.json() == first.json()
+
+    def test_invalid_key(self, client):
+        response = client.post(
+            "/api/v1/users", json=self.payload, headers={"Idempotency-Key": "x" * 256}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_same_key_from_different_clients(self, client, statements):
+        """다른 클라이언트가 같은 키를 보내도 서로의 응답을 받지 않음"""
+        first = client.post(
+            "/api/v1/users",
+            json=self.payload,
+            headers={"Idempotency-Key": "shared", "Authorization": "Bearer client-a"},
+        )
+        assert first.status_code == status.HTTP_201_CREATED
+
+        other = client.post(
+            "/api/v1/users",
+            json={"email": "other@example.com", "name": "다른 클라이언트"},
+            headers={"Idempotency-Key": "shared", "Authorization": "Bearer client-b"},
+        )
+        assert other.status_code == status.HTTP_201_CREATED
+        assert "Idempotent-Replayed" not in other.headers
+        assert other.json()["id"] != first.json()["id"]
+        assert statements == ["INSERT", "INSERT"]
+
+        replay = client.post(
+            "/api/v1/users",
+            json=self.payload,
+            headers={"Idempotency-Key": "shared", "Authorization": "Bearer client-a"},
+        )
+        assert replay.headers["Idempotent-Replayed"] == "true"
+        assert replay.json() == first.json()
+
+
+class TestUserGroupCommit:
+    """동시 생성 요청 그룹 커밋 테스트"""
+
+    @pytest.fixture
+    def batching(self, monkeypatch):
+        from app.core.cache import get_cache
+        from app.features.user.router import user_router
+        from app.features.user.service import UserService
+
+        service = UserService(
+            cache=get_cache("user"), create_batch_window=1.0, create_batch_max_size=3
+        )
+        monkeypatch.setattr(user_router, "user_service", service)
+        return service
+
+    def test_concurrent_creates_share_one_insert(self, client, statements, batching):
+        """배치가 차면 다중 행 INSERT 한 번으로 삽입하고 요청마다 자기 결과를 받음"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        client.post("/api/v1/users", json={"email": "taken@example.com", "name": "기존"})
+        statements.clear()
+
+        emails = ["a@example.com", "TAKEN@example.com", "A@example.com"]
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            responses = list(
+                executor.map(
+                    lambda email: client.post(
+                        "/api/v1/users", json={"email": email, "name": "배치"}
+                    ),
+                    emails,
+                )
+            )
+
+        assert statements == ["INSERT"]
+        codes = sorted(response.status_code for response in responses)
+        assert codes == [201, 409, 409]
+        assert responses[1].status_code == status.HTTP_409_CONFLICT
+        [created] = [r.json() for r in responses if r.status_code == 201]
+        assert created["email"] == "a@example.com"
+        assert created["created_at"] is not None
+
+    def test_single_create_flushes_after_window(self, client, batching):
+        """다른 요청이 없으면 window 후 혼자 삽입"""
+        batching.create_batcher.window = 0.01
+        response = client.post("/api/v1/users", json={"email": "solo@example.com", "name": "혼자"})
+        assert response.status_code == status.HTTP_201_CREATED
+        assert client.get(f"/api/v1/users/{response.json()['id']}").status_code == 200
+
+
+class TestUserBulkCreate:
+    """사용자 일괄 생성 API 테스트"""
+
+    def test_bulk_create_json_array(self, client):
+        """JSON 배열 일괄 생성 (생성/중복/검증 실패 혼합)"""
+        client.post(
+            "/api/v1/users",
+            json={"email": "existing@example.com", "name": "기존 사용자"},
+        )
+        response = client.post(
+            "/api/v1/users/bulk",
+            json=[
+                {"email": "new1@example.com", "name": "사용자1", "age": 20},
+                {"email": "EXISTING@example.com", "name": "중복"},
+                {"email": "invalid-email", "name": "검증 실패"},
+                {"email": "new2@example.com", "name": "사용자2"},
+                {"email": "New1@Example.com", "name": "요청 내 중복"},
+            ],
+        )
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["created"] == 2
+        assert data["duplicates"] == 2
+        assert data["invalid"] == 1
+        assert [r["status"] for r in data["results"]] == [
+            "created",
+            "duplicate",
+            "invalid",
+            "created",
+            "duplicate",
+        ]
+        assert data["results"][2]["errors"]
+
+        user_id = data["results"][0]["id"]
+        response = client.get(f"/api/v1/users/{user_id}")
+        assert response.json()["email"] == "new1@example.com"
+        assert response.json()["age"] == 20
+
+    def test_bulk_create_ndjson(self, client):
+        """NDJSON 일괄 생성"""
+        body = "\n".join(
+            [
+                '{"email": "a@example.com", "name": "A"}',
+                "",
+                "{not json",
+                '{"email": "b@example.com", "name": "B"}',
+            ]
+        )
+        response = client.post(
+            "/api/v1/users/bulk",
+            content=body,
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["created"] == 2
+        assert data["invalid"] == 1
+        assert len(client.get("/api/v1/users").json()) == 2
+
+    def test_bulk_create_not_array(self, client):
+        """JSON 배열이 아닌 본문"""
+        response = client.post(
+            "/api/v1/users/bulk", json={"email": "a@example.com", "name": "A"}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_bulk_create_too_many_rows(self, client, monkeypatch):
+        """최대 행 수 초과"""
+        from app.features.user.router import user_router
+
+        monkeypatch.setattr(user_router.settings, "USER_BULK_MAX_ROWS", 2)
+        response = client.post(
+            "/api/v1/users/bulk",
+            json=[{"email": f"u{i}@example.com", "name": "U"} for i in range(3)],
+        )
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+
 class TestUserList:
     """사용자 목록 조회 API 테스트"""
 
@@ -138,6 +368,292 @@ class TestUserList:
         assert len(response.json()) == 1
 
 
+class TestUserCursorPagination:
+    """커서 기반 페이지네이션 API 테스트"""
+
+    def test_cursor_pagination_walks_all_pages(self, client):
+        """next_cursor를 따라 모든 사용자를 중복 없이 조회"""
+        for i in range(5):
+            client.post(
+                "/api/v1/users",
+                json={"email": f"user{i}@example.com", "name": f"사용자{i}"},
+            )
+
+        response = client.get("/api/v1/users?pagination=cursor&limit=2")
+        assert response.status_code == status.HTTP_200_OK
+        page = response.json()
+        assert len(page["items"]) == 2
+        assert page["next_cursor"] is not None
+
+        seen = [user["id"] for user in page["items"]]
+        while page["next_cursor"]:
+            response = client.get(
+                f"/api/v1/users?cursor={page['next_cursor']}&limit=2"
+            )
+            assert response.status_code == status.HTTP_200_OK
+            page = response.json()
+            seen.extend(user["id"] for user in page["items"])
+
+        assert len(seen) == 5
+        assert seen == sorted(seen)
+
+    def test_cursor_pagination_last_page(self, client):
+        """마지막 페이지에서는 next_cursor가 null"""
+        client.post(
+            "/api/v1/users",
+            json={"email": "only@example.com", "name": "사용자"},
+        )
+        response = client.get("/api/v1/users?pagination=cursor&limit=1")
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()["items"]) == 1
+        assert response.json()["next_cursor"] is None
+
+    def test_cursor_pagination_invalid_cursor(self, client):
+        """잘못된 커서"""
+        response = client.get("/api/v1/users?cursor=not-a-cursor")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestUserListFilterSort:
+    """사용자 목록 필터/정렬/총 개수 API 테스트"""
+
+    def _create_users(self, client):
+        users = [
+            ("c@example.com", "다", 30, True),
+            ("a@example.com", "가", 20, True),
+            ("d@example.com", "라", 40, False),
+            ("b@example.com", "나", 25, True),
+            ("e@example.com", "마", None, True),
+        ]
+        for email, name, age, is_active in users:
+            client.post(
+                "/api/v1/users",
+                json={"email": email, "name": name, "age": age, "is_active": is_active},
+            )
+
+    def test_filter_is_active_and_age_range(self, client):
+        """활성화 상태와 나이 범위 필터"""
+        self._create_users(client)
+        response = client.get(
+            "/api/v1/users?is_active=true&min_age=21&max_age=30&sort=name&count=exact"
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [user["name"] for user in response.json()] == ["나", "다"]
+        assert response.headers["X-Total-Count"] == "2"
+
+    def test_filter_created_range(self, client):
+        """생성 시각 범위 필터 (created_to는 미만)"""
+        self._create_users(client)
+        response = client.get(
+            "/api/v1/users?created_from=2000-01-01T00:00:00&created_to=2000-01-02T00:00:00"
+            "&count=exact"
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+        assert response.headers["X-Total-Count"] == "0"
+
+    def test_invalid_filter_range(self, client):
+        """범위의 시작이 끝보다 크면 400"""
+        response = client.get("/api/v1/users?min_age=40&max_age=20")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_sort_descending_id(self, client):
+        """-id 정렬"""
+        self._create_users(client)
+        response = client.get("/api/v1/users?sort=-id")
+        ids = [user["id"] for user in response.json()]
+        assert ids == sorted(ids, reverse=True)
+
+    def test_invalid_sort(self, client):
+        """허용되지 않은 정렬 키"""
+        response = client.get("/api/v1/users?sort=email")
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_cursor_pagination_with_sort_and_filter(self, client):
+        """정렬/필터를 유지하며 커서로 모든 페이지 조회"""
+        self._create_users(client)
+        url = "/api/v1/users?pagination=cursor&limit=2&sort=-name&is_active=true&count=exact"
+        page = client.get(url).json()
+        names = [user["name"] for user in page["items"]]
+        while page["next_cursor"]:
+            response = client.get(f"{url}&cursor={page['next_cursor']}")
+            assert response.status_code == status.HTTP_200_OK
+            assert response.headers["X-Total-Count"] == "4"
+            page = response.json()
+            names.extend(user["name"] for user in page["items"])
+        assert names == ["마", "다", "나", "가"]
+
+    def test_cursor_sort_mismatch(self, client):
+        """다른 정렬로 발급된 커서는 400"""
+        self._create_users(client)
+        page = client.get("/api/v1/users?pagination=cursor&limit=1&sort=name").json()
+        response = client.get(f"/api/v1/users?cursor={page['next_cursor']}&sort=-id")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_count_none_skips_header(self, client):
+        """count=none이면 X-Total-Count를 계산하지 않음"""
+        self._create_users(client)
+        response = client.get("/api/v1/users?count=none")
+        assert "X-Total-Count" not in response.headers
+        assert response.headers["X-DB-Queries"] == "1"
+
+    def test_count_skipped_by_default_and_on_cursor_pages(self, client, monkeypatch):
+        """기본값은 계산하지 않고, 설정으로 켜도 커서 다음 페이지는 계산하지 않음"""
+        from app.features.user.router import user_query
+
+        self._create_users(client)
+        response = client.get("/api/v1/users")
+        assert "X-Total-Count" not in response.headers
+        assert response.headers["X-DB-Queries"] == "1"
+
+        monkeypatch.setattr(user_query.settings, "USER_LIST_COUNT_MODE", "exact")
+        first = client.get("/api/v1/users?pagination=cursor&limit=2")
+        assert first.headers["X-Total-Count"] == "5"
+        response = client.get(f"/api/v1/users?cursor={first.json()['next_cursor']}")
+        assert "X-Total-Count" not in response.headers
+        assert response.headers["X-DB-Queries"] == "1"
+
+    def test_count_estimate_falls_back_to_exact(self, client):
+        """플래너 통계를 쓸 수 없는 DB에서는 정확한 개수를 반환"""
+        self._create_users(client)
+        response = client.get("/api/v1/users?count=estimate")
+        assert response.headers["X-Total-Count"] == "5"
+        assert "X-Total-Count-Estimated" not in response.headers
+
+
+class TestUserSearch:
+    """사용자 검색 API 테스트"""
+
+    def _create_users(self, client):
+        for email, name in [
+            ("kim@example.com", "김철수"),
+            ("hong@example.com", "홍길동"),
+            ("gildong@example.com", "Gil"),
+            ("jane_doe@example.com", "Jane"),
+            ("janet@example.com", "Janet"),
+        ]:
+            client.post("/api/v1/users", json={"email": email, "name": name})
+
+    def test_search_ranks_exact_then_prefix_then_contains(self, client):
+        """완전 일치 → 접두사 일치 → 부분 일치 순 정렬"""
+        self._create_users(client)
+        response = client.get("/api/v1/users/search?q=GIL")
+        assert response.status_code == status.HTTP_200_OK
+        assert [user["email"] for user in response.json()] == [
+            "gildong@example.com",
+        ]
+
+        response = client.get("/api/v1/users/search?q=jane")
+        assert [user["name"] for user in response.json()] == ["Jane", "Janet"]
+
+        response = client.get("/api/v1/users/search?q=dong")
+        assert [user["email"] for user in response.json()] == ["gildong@example.com"]
+
+    def test_search_short_query_prefix_only(self, client):
+        """짧은 검색어는 접두사 일치만 검색"""
+        self._create_users(client)
+        response = client.get("/api/v1/users/search?q=ho")
+        assert [user["email"] for user in response.json()] == ["hong@example.com"]
+
+    def test_search_short_query_prefix_only_on_postgresql(self):
+        """PostgreSQL도 짧은 검색어는 trigram 대신 LIKE 접두사 검색 (text_pattern_ops 인덱스)"""
+        from sqlalchemy.dialects import postgresql
+        from app.features.user.repository.user_repository import build_search_query
+
+        def compile_query(q: str):
+            query = build_search_query(q, 20, "postgresql", contains_min_length=3)
+            return query.compile(dialect=postgresql.dialect())
+
+        short = compile_query("ho")
+        assert "similarity" not in str(short) and " % " not in str(short)
+        assert set(short.params.values()) >= {"ho%"}
+        assert "%ho%" not in short.params.values()
+
+        full = compile_query("hong")
+        assert "similarity" in str(full)
+        assert "%hong%" in full.params.values()
+
+    def test_search_escapes_wildcards(self, client):
+        """LIKE 와일드카드는 문자 그대로 검색"""
+        self._create_users(client)
+        response = client.get("/api/v1/users/search?q=e_d")
+        assert [user["email"] for user in response.json()] == ["jane_doe@example.com"]
+        response = client.get("/api/v1/users/search?q=%25%25%25")
+        assert response.json() == []
+
+    def test_search_limit(self, client):
+        """limit 적용 및 최대값 검증"""
+        self._create_users(client)
+        response = client.get("/api/v1/users/search?q=example&limit=2")
+        assert len(response.json()) == 2
+        response = client.get("/api/v1/users/search?q=example&limit=1000")
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_search_blank_query(self, client):
+        """공백 검색어"""
+        response = client.get("/api/v1/users/search?q=%20%20")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        response = client.get("/api/v1/users/search")
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+class TestUserExport:
+    """사용자 내보내기 API 테스트"""
+
+    def _create_users(self, client, count):
+        for i in range(count):
+            client.post(
+                "/api/v1/users",
+                json={"email": f"user{i}@example.com", "name": f"사용자{i}", "age": 20},
+            )
+
+    def test_export_ndjson(self, client):
+        """NDJSON 내보내기"""
+        self._create_users(client, 3)
+        response = client.get("/api/v1/users/export")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [user["email"] for user in lines] == [
+            f"user{i}@example.com" for i in range(3)
+        ]
+        assert lines[0]["name"] == "사용자0"
+
+    def test_export_csv(self, client):
+        """CSV 내보내기"""
+        self._create_users(client, 2)
+        response = client.get("/api/v1/users/export?format=csv")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/csv")
+
+        rows = list(csv.reader(io.StringIO(response.text)))
+        assert rows[0] == [
+            "id",
+            "email",
+            "name",
+            "age",
+            "is_active",
+            "created_at",
+            "updated_at",
+        ]
+        assert len(rows) == 3
+        assert rows[1][1:5] == ["user0@example.com", "사용자0", "20", "true"]
+
+    def test_export_empty(self, client):
+        """빈 테이블 내보내기"""
+        response = client.get("/api/v1/users/export?format=csv")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.text.strip() == (
+            "id,email,name,age,is_active,created_at,updated_at"
+        )
+
+    def test_export_invalid_format(self, client):
+        """지원하지 않는 형식"""
+        response = client.get("/api/v1/users/export?format=xml")
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 class TestUserGet:
     """사용자 단건 조회 API 테스트"""
 
@@ -164,6 +680,266 @@ class TestUserGet:
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+class TestUserCache:
+    """단건 조회 캐시 테스트"""
+
+    def _create_user(self, client):
+        return client.post(
+            "/api/v1/users",
+            json={"email": "cache@example.com", "name": "홍길동", "age": 25},
+        ).json()["id"]
+
+    def test_get_user_served_from_cache(self, client):
+        """두 번째 조회는 캐시 적중"""
+        from app.core.cache import get_cache
+
+        user_id = self._create_user(client)
+        client.get(f"/api/v1/users/{user_id}")
+        hits = get_cache("user").stats()["hits"]
+
+        response = client.get(f"/api/v1/users/{user_id}")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["email"] == "cache@example.com"
+        assert get_cache("user").stats()["hits"] == hits + 1
+
+    def test_update_refreshes_cache(self, client):
+        """수정 후 조회 시 변경된 값 반환"""
+        user_id = self._create_user(client)
+        client.get(f"/api/v1/users/{user_id}")
+
+        client.put(f"/api/v1/users/{user_id}", json={"name": "김철수"})
+        response = client.get(f"/api/v1/users/{user_id}")
+        assert response.json()["name"] == "김철수"
+
+    def test_delete_invalidates_cache(self, client):
+        """삭제 후 조회 시 404"""
+        user_id = self._create_user(client)
+        client.get(f"/api/v1/users/{user_id}")
+
+        client.delete(f"/api/v1/users/{user_id}")
+        response = client.get(f"/api/v1/users/{user_id}")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestUserBatchGet:
+    """ID 목록 일괄 조회 API 테스트"""
+
+    def _create_users(self, client, count):
+        return [
+            client.post(
+                "/api/v1/users",
+                json={"email": f"batch{i}@example.com", "name": f"사용자{i}"},
+            ).json()["id"]
+            for i in range(count)
+        ]
+
+    def test_get_batch_in_request_order(self, client):
+        """요청 순서대로 반환하고 없는 ID는 missing으로 보고"""
+        ids = self._create_users(client, 3)
+        requested = [ids[2], 99999, ids[0], ids[2]]
+
+        response = client.get(
+            "/api/v1/users/batch", params={"ids": ",".join(map(str, requested))}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [user["id"] for user in data["items"]] == [ids[2], ids[0]]
+        assert data["missing"] == [99999]
+
+    def test_get_batch_single_query(self, client):
+        """캐시에 없는 사용자는 한 번의 쿼리로 조회, 이후 요청은 캐시 적중"""
+        ids = self._create_users(client, 5)
+
+        response = client.get("/api/v1/users/batch", params=[("ids", i) for i in ids])
+        assert len(response.json()["items"]) == 5
+        assert response.headers["X-DB-Queries"] == "1"
+
+        response = client.get(
+            "/api/v1/users/batch", params={"ids": ",".join(map(str, ids))}
+        )
+        assert len(response.json()["items"]) == 5
+        assert response.headers["X-DB-Queries"] == "0"
+
+    def test_post_batch(self, client):
+        """본문으로 ID 목록 전달"""
+        ids = self._create_users(client, 2)
+        response = client.post("/api/v1/users/batch", json={"ids": [ids[1], ids[0]]})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [user["id"] for user in response.json()["items"]] == [ids[1], ids[0]]
+
+    def test_batch_invalid_ids(self, client):
+        """정수가 아닌 ID / 빈 목록은 400"""
+        response = client.get("/api/v1/users/batch", params={"ids": "1,abc"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = client.get("/api/v1/users/batch", params={"ids": ","})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = client.post("/api/v1/users/batch", json={"ids": []})
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    @pytest.mark.parametrize("value", [0, -1, 2**31, 10**30])
+    def test_batch_id_out_of_range(self, client, value):
+        """ID 컬럼 범위를 벗어난 ID는 500 대신 400"""
+        response = client.get("/api/v1/users/batch", params={"ids": f"1,{value}"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = client.post("/api/v1/users/batch", json={"ids": [1, value]})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = client.delete("/api/v1/users", params={"ids": str(value)})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = client.patch(f"/api/v1/users?ids={value}", json={"is_active": False})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_batch_too_many_ids(self, client, monkeypatch):
+        """최대 ID 수 초과 시 413"""
+        from app.features.user.router import user_router
+
+        monkeypatch.setattr(user_router.settings, "USER_BATCH_MAX_IDS", 2)
+        response = client.get("/api/v1/users/batch", params={"ids": "1,2,3"})
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+        response = client.post("/api/v1/users/batch", json={"ids": [1, 2, 3]})
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+
+class TestUserConditionalRequests:
+    """ETag / 조건부 요청 테스트"""
+
+    def _create_user(self, client):
+        return client.post(
+            "/api/v1/users",
+            json={"email": "etag@example.com", "name": "홍길동", "age": 25},
+        ).json()["id"]
+
+    def test_get_returns_etag(self, client):
+        """단건 조회 응답에 강한 ETag 포함 (캐시 적중 여부와 무관하게 동일)"""
+        user_id = self._create_user(client)
+        first = client.get(f"/api/v1/users/{user_id}")
+        second = client.get(f"/api/v1/users/{user_id}")
+
+        etag = first.headers["ETag"]
+        assert etag.startswith('"') and not etag.startswith("W/")
+        assert second.headers["ETag"] == etag
+
+    def test_if_none_match_returns_304(self, client):
+        """If-None-Match 일치 시 본문 없이 304 (캐시에 있으면 SQL 없음)"""
+        user_id = self._create_user(client)
+        etag = client.get(f"/api/v1/users/{user_id}").headers["ETag"]
+
+        response = client.get(
+            f"/api/v1/users/{user_id}", headers={"If-None-Match": f"W/{etag}"}
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+        assert response.headers["X-DB-Queries"] == "0"
+
+    def test_if_none_match_without_cache(self, client):
+        """캐시가 없으면 ETag 계산용 컬럼만 조회해 304 판단"""
+        from app.core.cache import get_cache
+
+        user_id = self._create_user(client)
+        etag = client.get(f"/api/v1/users/{user_id}").headers["ETag"]
+        get_cache("user").clear()
+
+        response = client.get(
+            f"/api/v1/users/{user_id}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["X-DB-Queries"] == "1"
+
+    def test_if_none_match_mismatch_returns_body(self, client):
+        """If-None-Match 불일치 시 200과 본문 반환"""
+        user_id = self._create_user(client)
+        response = client.get(
+            f"/api/v1/users/{user_id}", headers={"If-None-Match": '"stale"'}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["id"] == user_id
+
+    def test_if_none_match_not_found(self, client):
+        """존재하지 않는 사용자는 404"""
+        response = client.get("/api/v1/users/99999", headers={"If-None-Match": '"x"'})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_update_if_match(self, client):
+        """If-Match 일치 시 수정, 불일치 / 약한 ETag는 412"""
+        user_id = self._create_user(client)
+        etag = client.get(f"/api/v1/users/{user_id}").headers["ETag"]
+
+        response = client.put(
+            f"/api/v1/users/{user_id}",
+            json={"name": "김철수"},
+            headers={"If-Match": '"stale"'},
+        )
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+        response = client.put(
+            f"/api/v1/users/{user_id}",
+            json={"name": "김철수"},
+            headers={"If-Match": f"W/{etag}"},
+        )
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+        assert client.get(f"/api/v1/users/{user_id}").json()["name"] == "홍길동"
+
+        response = client.put(
+            f"/api/v1/users/{user_id}",
+            json={"name": "김철수"},
+            headers={"If-Match": etag},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["name"] == "김철수"
+        assert "ETag" in response.headers
+
+    def test_stale_if_match_after_quick_updates(self, client):
+        """같은 초 안에 연이어 수정해도 ETag가 바뀌어, 처음 ETag로 재시도하면 412"""
+        user_id = self._create_user(client)
+        first = client.put(f"/api/v1/users/{user_id}", json={"name": "김철수"})
+        second = client.put(
+            f"/api/v1/users/{user_id}",
+            json={"name": "이영희"},
+            headers={"If-Match": first.headers["ETag"]},
+        )
+        assert second.status_code == status.HTTP_200_OK
+        assert second.headers["ETag"] != first.headers["ETag"]
+
+        response = client.put(
+            f"/api/v1/users/{user_id}",
+            json={"name": "박민수"},
+            headers={"If-Match": first.headers["ETag"]},
+        )
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+        response = client.get(
+            f"/api/v1/users/{user_id}", headers={"If-None-Match": first.headers["ETag"]}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["name"] == "이영희"
+
+    def test_delete_if_match(self, client):
+        """If-Match 불일치 시 삭제하지 않음"""
+        user_id = self._create_user(client)
+
+        response = client.delete(
+            f"/api/v1/users/{user_id}", headers={"If-Match": '"stale"'}
+        )
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+        assert client.get(f"/api/v1/users/{user_id}").status_code == status.HTTP_200_OK
+
+        response = client.delete(f"/api/v1/users/{user_id}", headers={"If-Match": "*"})
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    def test_if_match_not_found(self, client):
+        """존재하지 않는 사용자에 If-Match 지정 시 404"""
+        response = client.delete("/api/v1/users/99999", headers={"If-Match": "*"})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 class TestUserUpdate:
     """사용자 수정 API 테스트"""
 
@@ -261,6 +1037,135 @@ class TestUserDelete:
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+class TestUserBulkWrite:
+    """필터 / ID 목록 일괄 수정·삭제 API 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def small_chunks(self, monkeypatch):
+        from app.features.user.router import user_router
+
+        monkeypatch.setattr(user_router.settings, "USER_BULK_WRITE_CHUNK_SIZE", 2)
+
+    def _create_users(self, client, count):
+        return [
+            client.post(
+                "/api/v1/users",
+                json={"email": f"user{i}@example.com", "name": f"사용자{i}", "age": 20 + i},
+            ).json()["id"]
+            for i in range(count)
+        ]
+
+    def test_deactivate_by_filter_in_chunks(self, client, statements):
+        """필터에 해당하는 사용자를 청크 단위 UPDATE로 수정"""
+        self._create_users(client, 5)
+        statements.clear()
+
+        response = client.patch("/api/v1/users?min_age=21", json={"is_active": False})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"affected": 4, "chunks": 2}
+        # 마지막 청크가 가득 차면 다음 청크가 비어 있는지 한 번 더 조회
+        assert statements == ["SELECT", "UPDATE", "SELECT", "UPDATE", "SELECT"]
+
+        inactive = client.get("/api/v1/users?is_active=false").json()
+        assert [user["age"] for user in inactive] == [21, 22, 23, 24]
+
+        # 이미 같은 값인 행은 다시 수정하지 않음
+        again = client.patch("/api/v1/users?min_age=21", json={"is_active": False})
+        assert again.json() == {"affected": 0, "chunks": 0}
+
+    def test_ids_and_filter_combined(self, client):
+        user_ids = self._create_users(client, 4)
+        ids = ",".join(str(user_id) for user_id in user_ids[:3])
+        response = client.patch(f"/api/v1/users?ids={ids}&max_age=21", json={"name": "변경"})
+        assert response.json()["affected"] == 2
+        names = [user["name"] for user in client.get("/api/v1/users").json()]
+        assert names == ["변경", "변경", "사용자2", "사용자3"]
+
+    def test_update_invalidates_cache(self, client):
+        [user_id] = self._create_users(client, 1)
+        client.get(f"/api/v1/users/{user_id}")  # 캐시 채움
+        client.patch(f"/api/v1/users?ids={user_id}", json={"age": 99})
+        assert client.get(f"/api/v1/users/{user_id}").json()["age"] == 99
+
+    def test_delete_by_ids(self, client):
+        user_ids = self._create_users(client, 3)
+        client.get(f"/api/v1/users/{user_ids[0]}")  # 캐시 채움
+        response = client.delete(f"/api/v1/users?ids={user_ids[0]}&ids={user_ids[2]}&ids=999")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"affected": 2, "chunks": 1}
+        assert client.get(f"/api/v1/users/{user_ids[0]}").status_code == 404
+        assert [user["id"] for user in client.get("/api/v1/users").json()] == [user_ids[1]]
+
+    def test_too_many_ids(self, client, monkeypatch):
+        """대상 ID 수는 USER_BULK_WRITE_MAX_IDS로 제한 (일괄 조회 제한과 별도)"""
+        from app.features.user.router import user_router
+
+        monkeypatch.setattr(user_router.settings, "USER_BULK_WRITE_MAX_IDS", 2)
+        response = client.delete("/api/v1/users", params={"ids": "1,2,3"})
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        response = client.patch("/api/v1/users?ids=1,2,3", json={"is_active": False})
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        assert client.get("/api/v1/users/batch", params={"ids": "1,2,3"}).status_code == 200
+
+    def test_selection_required(self, client):
+        """필터와 ID 목록이 모두 없으면 전체 수정/삭제 대신 400"""
+        self._create_users(client, 1)
+        assert client.delete("/api/v1/users").status_code == 400
+        assert client.patch("/api/v1/users", json={"is_active": False}).status_code == 400
+        assert len(client.get("/api/v1/users").json()) == 1
+
+    def test_invalid_changes(self, client):
+        assert client.patch("/api/v1/users?is_active=true", json={}).status_code == 400
+        response = client.patch(
+            "/api/v1/users?is_active=true", json={"email": "same@example.com"}
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    @pytest.mark.parametrize("field", ["name", "is_active"])
+    def test_null_for_required_field(self, client, field):
+        """NOT NULL 필드에 null을 보내면 422, 나이는 null로 지울 수 있음"""
+        self._create_users(client, 1)
+        response = client.patch("/api/v1/users?is_active=true", json={field: None})
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+        response = client.patch("/api/v1/users?is_active=true", json={"age": None})
+        assert response.json() == {"affected": 1, "chunks": 1}
+        assert client.get("/api/v1/users").json()[0]["age"] is None
+
+
+class TestUserWriteStatements:
+    """쓰기 API의 SQL 문 수 테스트 (INSERT/UPDATE/DELETE ... RETURNING 한 번)"""
+
+    def test_write_endpoints_issue_single_statement(self, client, statements):
+        """생성/수정/삭제 각각 SQL 문 하나"""
+        response = client.post(
+            "/api/v1/users", json={"email": "one@example.com", "name": "홍길동"}
+        )
+        user_id = response.json()["id"]
+        assert statements == ["INSERT"]
+
+        statements.clear()
+        client.put(f"/api/v1/users/{user_id}", json={"name": "김철수"})
+        assert statements == ["UPDATE"]
+
+        statements.clear()
+        client.delete(f"/api/v1/users/{user_id}")
+        assert statements == ["DELETE"]
+
+    def test_update_email_conflict_keeps_row(self, client):
+        """이메일 중복 수정 실패 시 기존 값 유지"""
+        client.post("/api/v1/users", json={"email": "a@example.com", "name": "A"})
+        user_id = client.post(
+            "/api/v1/users", json={"email": "b@example.com", "name": "B"}
+        ).json()["id"]
+
+        response = client.put(
+            f"/api/v1/users/{user_id}", json={"email": "A@example.com", "name": "C"}
+        )
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert client.get(f"/api/v1/users/{user_id}").json()["name"] == "B"
+
+
 class TestUserEdgeCases:
     """경계값 및 특수 케이스 테스트"""
 